@@ -0,0 +1,174 @@
+"""Conversions from API models to the generated protobuf messages, shared by gRPC and REST."""
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from google.protobuf import json_format
+from google.protobuf.message import Message
+
+import app.protos.service_pb2 as service_pb2
+
+from app.models.models import User, UserPortfolio, Project, ProjectImage
+
+def user_to_proto(user: Any) -> service_pb2.User:
+    """Convert user model to protobuf message."""
+    return service_pb2.User(
+        id=str(user.id),
+        username=user.username,
+        email=user.email,
+        role=user.role,
+        created_at=user.created_at.isoformat()
+    )
+
+def project_image_to_proto(image: Any) -> service_pb2.ProjectImage:
+    """Convert a project image model to protobuf message."""
+    return service_pb2.ProjectImage(
+        id=str(image.id),
+        project_id=str(image.project_id),
+        image_url=image.image_url,
+        content_type=image.content_type or "",
+        length=image.length or 0
+    )
+
+def project_to_proto(project: Any) -> service_pb2.Project:
+    """Convert a project model to protobuf message."""
+    project_proto = service_pb2.Project(
+        id=str(project.id),
+        slug=project.slug,
+        title=project.title,
+        body=project.body,
+        body_html=project.body_html or "",
+        body_excerpt=project.body_excerpt or "",
+        user_id=str(project.user_id),
+        created_at=project.created_at.isoformat(),
+        updated_at=project.updated_at.isoformat()
+    )
+
+    if project.github_link:
+        project_proto.github_link = project.github_link
+
+    # Add images
+    for image in project.images:
+        project_proto.images.append(project_image_to_proto(image))
+
+    return project_proto
+
+def portfolio_to_proto(portfolio: Any) -> service_pb2.UserPortfolioResponse:
+    """Convert a user portfolio to its protobuf response message."""
+    response = service_pb2.UserPortfolioResponse(
+        user=user_to_proto(portfolio),
+        project_count=portfolio.stats.project_count,
+        image_count=portfolio.stats.image_count
+    )
+    for project in portfolio.projects:
+        project_proto = response.projects.add(
+            id=str(project.id),
+            slug=project.slug,
+            title=project.title,
+            body_excerpt=project.body_excerpt or "",
+            created_at=project.created_at.isoformat(),
+            updated_at=project.updated_at.isoformat()
+        )
+        if project.github_link:
+            project_proto.github_link = project.github_link
+        for image in project.images:
+            project_proto.images.append(project_image_to_proto(image))
+
+    return response
+
+# (message field, document key, conversion) for filling messages straight from
+# stored documents on gRPC reads, without building pydantic models first
+DocumentFields = Tuple[Tuple[str, str, Optional[Callable[[Any], Any]]], ...]
+
+USER_DOCUMENT_FIELDS: DocumentFields = (
+    ("id", "_id", str),
+    ("username", "username", None),
+    ("email", "email", None),
+    ("role", "role", None),
+    ("created_at", "created_at", datetime.isoformat),
+)
+
+PROJECT_DOCUMENT_FIELDS: DocumentFields = (
+    ("id", "_id", str),
+    ("slug", "slug", None),
+    ("title", "title", None),
+    ("body", "body", None),
+    ("github_link", "github_link", None),
+    ("user_id", "user_id", str),
+    ("created_at", "created_at", datetime.isoformat),
+    ("updated_at", "updated_at", datetime.isoformat),
+    ("body_html", "body_html", None),
+    ("body_excerpt", "body_excerpt", None),
+)
+
+def document_projection(fields: DocumentFields) -> dict:
+    """Mongo projection reading only what the message needs."""
+    return {key: 1 for _, key, _ in fields}
+
+USER_DOCUMENT_PROJECTION = document_projection(USER_DOCUMENT_FIELDS)
+PROJECT_DOCUMENT_PROJECTION = document_projection(PROJECT_DOCUMENT_FIELDS)
+
+def document_to_proto(message_class: type, fields: DocumentFields, document: dict) -> Message:
+    """Fill a message from a stored document; missing and null values keep the proto default."""
+    values = {}
+    for field, key, convert in fields:
+        value = document.get(key)
+        if value is not None:
+            values[field] = convert(value) if convert else value
+    return message_class(**values)
+
+def user_document_to_proto(document: dict) -> service_pb2.User:
+    return document_to_proto(service_pb2.User, USER_DOCUMENT_FIELDS, document)
+
+def project_document_to_proto(document: dict) -> service_pb2.Project:
+    return document_to_proto(service_pb2.Project, PROJECT_DOCUMENT_FIELDS, document)
+
+def partial_to_proto(message_class: type, model: Any) -> Message:
+    """Convert a sparse model (see repositories.projection) with only its selected fields set."""
+    return json_format.ParseDict(
+        model.model_dump(mode="json", exclude_unset=True),
+        message_class(),
+        ignore_unknown_fields=True
+    )
+
+# model -> (message, list message, list field) for sparse fieldsets
+PARTIAL_MESSAGES: Dict[type, Tuple[type, type, str]] = {
+    User: (service_pb2.User, service_pb2.GetUsersResponse, "users"),
+    Project: (service_pb2.Project, service_pb2.GetProjectsResponse, "projects"),
+}
+
+# (model, is_list) -> message builder, for REST content negotiation
+PROTO_ENCODERS: Dict[Tuple[type, bool], Callable[[Any], Any]] = {
+    (User, False): user_to_proto,
+    (User, True): lambda users: service_pb2.GetUsersResponse(
+        users=[user_to_proto(user) for user in users]
+    ),
+    (UserPortfolio, False): portfolio_to_proto,
+    (Project, False): project_to_proto,
+    (Project, True): lambda projects: service_pb2.GetProjectsResponse(
+        projects=[project_to_proto(project) for project in projects]
+    ),
+    (ProjectImage, False): project_image_to_proto,
+    (ProjectImage, True): lambda images: service_pb2.GetProjectImagesResponse(
+        images=[project_image_to_proto(image) for image in images]
+    ),
+}
+
+def _partial_encoder(model: type, many: bool) -> Optional[Callable[[Any], Any]]:
+    if model not in PARTIAL_MESSAGES:
+        return None
+    message_class, list_class, list_field = PARTIAL_MESSAGES[model]
+    if many:
+        return lambda items: list_class(**{
+            list_field: [partial_to_proto(message_class, item) for item in items]
+        })
+    return lambda item: partial_to_proto(message_class, item)
+
+def to_proto_bytes(model: type, many: bool, content: Any, partial: bool = False) -> Optional[bytes]:
+    """Encode a response as protobuf, or None when there is no matching message."""
+    if partial:
+        encoder = _partial_encoder(model, many)
+    else:
+        encoder = PROTO_ENCODERS.get((model, many))
+    if encoder is None:
+        return None
+    return encoder(content).SerializeToString()
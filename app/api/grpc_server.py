@@ -1,6 +1,5 @@
-import asyncio
 import grpc
-from concurrent import futures
+from grpc_health.v1 import health, health_pb2, health_pb2_grpc
 from datetime import datetime, timedelta
 from typing import Any
 
@@ -10,66 +9,141 @@ import app.protos.service_pb2 as service_pb2
 import app.protos.service_pb2_grpc as service_pb2_grpc
 
 from app.core.config import settings
+from app.core.health import readiness
+from app.core.rate_limit import LOGIN, PASSWORD_CHANGE, REGISTER, RateLimitExceeded, rate_limiter
 from app.models.models import User, UserCreate, UserUpdate
 from app.models.models import Project, ProjectCreate, ProjectUpdate
 from app.models.models import ProjectImage, ProjectImageCreate, ProjectImageUpdate
 from app.services.user_service import UserServices
-# from app.services.project_service import ProjectService
-# from app.services.project_image_service import ProjectImageService
+from app.services.portfolio_service import PortfolioService
+from app.services.project_service import ProjectService
+from app.services.project_image_service import ProjectImageService
 from app.api.rest.auth import create_access_token
+from app.api.converters import (
+    user_to_proto, project_to_proto, project_image_to_proto, portfolio_to_proto, partial_to_proto,
+    user_document_to_proto, project_document_to_proto, USER_DOCUMENT_PROJECTION, PROJECT_DOCUMENT_PROJECTION
+)
+from app.api.interceptors import (
+    AdmissionControlInterceptor, CircuitBreakerInterceptor, DeadlineInterceptor, MetricsInterceptor,
+    ResponseCacheInterceptor, ServerTimingInterceptor
+)
+from app.repositories.projection import USER_FIELDS, PROJECT_FIELDS, parse_fields
+
+def _mask_fields(request, allowed):
+    """Fields selected by a request's read_mask, or None when it is unset."""
+    if not request.HasField("read_mask"):
+        return None
+    return parse_fields(request.read_mask.paths, allowed)
+
+def _peer_ip(context):
+    """Client address of an RPC, from x-forwarded-for metadata only when it is trusted."""
+    if settings.RATE_LIMIT_TRUST_FORWARDED:
+        for key, value in context.invocation_metadata():
+            if key == "x-forwarded-for":
+                return value.split(",")[0].strip()
+    # "ipv4:10.0.0.1:53412", "ipv6:[::1]:53412" or "unix:/path"
+    kind, _, address = context.peer().partition(":")
+    if kind == "ipv6":
+        return address.rpartition("]")[0].lstrip("[")
+    if kind == "ipv4":
+        return address.rpartition(":")[0]
+    return address
+
+async def _rate_limited(context, rule, **identities) -> bool:
+    """Check a rate limit for the peer; on rejection set RESOURCE_EXHAUSTED and return True."""
+    try:
+        await rate_limiter.check(rule, ip=_peer_ip(context), **identities)
+    except RateLimitExceeded as e:
+        context.set_code(grpc.StatusCode.RESOURCE_EXHAUSTED)
+        context.set_details(str(e))
+        context.set_trailing_metadata((("retry-after", str(e.retry_after_seconds)),))
+        return True
+    return False
 
 # User Service Implementation
 class UserServicer(service_pb2_grpc.UserServiceServicer):
     def __init__(self):
         self.service = UserServices()
+        self.portfolio_service = PortfolioService()
     
-    def _user_to_proto(self, user: Any) -> service_pb2.User:
-        """Convert user model to protobuf message."""
-        return service_pb2.User(
-            id=str(user.id),
-            username=user.username,
-            email=user.email,
-            role=user.role,
-            created_at=user.created_at.isoformat()
-        )
+    def _user_to_proto(self, user: Any, fields=None) -> service_pb2.User:
+        """Convert a user model, or a stored user document on plain reads, to protobuf message."""
+        if fields:
+            return partial_to_proto(service_pb2.User, user)
+        if isinstance(user, dict):
+            return user_document_to_proto(user)
+        return user_to_proto(user)
     
     async def GetUsers(self, request, context):
         """Get all users with pagination."""
-        users = await self.service.get_users(skip=request.skip, limit=request.limit)
+        try:
+            fields = _mask_fields(request, USER_FIELDS)
+        except ValueError as e:
+            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+            context.set_details(str(e))
+            return service_pb2.GetUsersResponse()
+        
+        if fields:
+            users = await self.service.get_users(skip=request.skip, limit=request.limit, fields=fields)
+        else:
+            users = await self.service.get_user_documents(request.skip, request.limit, USER_DOCUMENT_PROJECTION)
         
         response = service_pb2.GetUsersResponse()
         for user in users:
-            user_proto = self._user_to_proto(user)
+            user_proto = self._user_to_proto(user, fields)
             response.users.append(user_proto)
         
         return response
     
     async def GetUser(self, request, context):
         """Get a user by their ID."""
-        user = await self.service.get_user(request.id)
+        try:
+            fields = _mask_fields(request, USER_FIELDS)
+        except ValueError as e:
+            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+            context.set_details(str(e))
+            return service_pb2.UserResponse()
+        
+        if fields:
+            user = await self.service.get_user(request.id, fields)
+        else:
+            user = await self.service.get_user_document(request.id, USER_DOCUMENT_PROJECTION)
         
         if not user:
             context.set_code(grpc.StatusCode.NOT_FOUND)
             context.set_details(f"User with ID {request.id} not found")
             return service_pb2.UserResponse()
         
-        user_proto = self._user_to_proto(user)
+        user_proto = self._user_to_proto(user, fields)
         return service_pb2.UserResponse(user=user_proto)
     
     async def GetUserByUsername(self, request, context):
         """Get a user by their username."""
-        user = await self.service.get_user_by_username(request.username)
+        try:
+            fields = _mask_fields(request, USER_FIELDS)
+        except ValueError as e:
+            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+            context.set_details(str(e))
+            return service_pb2.UserResponse()
+        
+        if fields:
+            user = await self.service.get_user_by_username(request.username, fields)
+        else:
+            user = await self.service.get_user_document_by_username(request.username, USER_DOCUMENT_PROJECTION)
         
         if not user:
             context.set_code(grpc.StatusCode.NOT_FOUND)
             context.set_details(f"User with username {request.username} not found")
             return service_pb2.UserResponse()
         
-        user_proto = self._user_to_proto(user)
+        user_proto = self._user_to_proto(user, fields)
         return service_pb2.UserResponse(user=user_proto)
     
     async def CreateUser(self, request, context):
         """Create a new user."""
+        if await _rate_limited(context, REGISTER):
+            return service_pb2.UserResponse()
+        
         try:
             user_data = UserCreate(
                 username=request.username,
@@ -99,6 +173,9 @@ class UserServicer(service_pb2_grpc.UserServiceServicer):
         
         user_update = UserUpdate(**update_data)
         
+        if user_update.password is not None and await _rate_limited(context, PASSWORD_CHANGE, user_id=request.id):
+            return service_pb2.UserResponse()
+        
         try:
             user = await self.service.update_user(request.id, user_update)
             
@@ -126,6 +203,9 @@ class UserServicer(service_pb2_grpc.UserServiceServicer):
     
     async def AuthenticateUser(self, request, context):
         """Authenticate a user by username and password."""
+        if await _rate_limited(context, LOGIN, username=request.username):
+            return service_pb2.AuthenticateUserResponse()
+        
         user = await self.service.authenticate_user(request.username, request.password)
         
         if not user:
@@ -145,330 +225,354 @@ class UserServicer(service_pb2_grpc.UserServiceServicer):
             token=token,
             user=user_proto
         )
+    
+    async def GetUserPortfolio(self, request, context):
+        """Get a user's profile, projects and images in one call."""
+        portfolio = await self.portfolio_service.get_portfolio(request.username)
+        
+        if not portfolio:
+            context.set_code(grpc.StatusCode.NOT_FOUND)
+            context.set_details(f"User with username {request.username} not found")
+            return service_pb2.UserPortfolioResponse()
+        
+        return portfolio_to_proto(portfolio)
 
 # Project Service Implementation
-# class ProjectServicer(service_pb2_grpc.ProjectServiceServicer):
-#     def __init__(self):
-#         self.service = ProjectService()
-    
-#     def _project_image_to_proto(self, image: Any) -> service_pb2.ProjectImage:
-#         """Convert a project image model to protobuf message."""
-#         return service_pb2.ProjectImage(
-#             id=str(image.id),
-#             project_id=str(image.project_id),
-#             image_url=image.image_url
-#         )
-    
-#     def _project_to_proto(self, project: Any) -> service_pb2.Project:
-#         """Convert a project model to protobuf message."""
-#         project_proto = service_pb2.Project(
-#             id=str(project.id),
-#             slug=project.slug,
-#             title=project.title,
-#             body=project.body,
-#             user_id=str(project.user_id),
-#             created_at=project.created_at.isoformat(),
-#             updated_at=project.updated_at.isoformat()
-#         )
-        
-#         if project.github_link:
-#             project_proto.github_link = project.github_link
-        
-#         # Add images
-#         for image in project.images:
-#             image_proto = self._project_image_to_proto(image)
-#             project_proto.images.append(image_proto)
-        
-#         return project_proto
-    
-#     async def GetProjects(self, request, context):
-#         """Get all projects with pagination."""
-#         projects = await self.service.get_projects(skip=request.skip, limit=request.limit)
+class ProjectServicer(service_pb2_grpc.ProjectServiceServicer):
+    def __init__(self):
+        self.service = ProjectService()
+    
+    def _project_image_to_proto(self, image: Any) -> service_pb2.ProjectImage:
+        """Convert a project image model to protobuf message."""
+        return project_image_to_proto(image)
+    
+    def _project_to_proto(self, project: Any, fields=None) -> service_pb2.Project:
+        """Convert a project model, or a stored project document on plain reads, to protobuf message."""
+        if fields:
+            return partial_to_proto(service_pb2.Project, project)
+        if isinstance(project, dict):
+            return project_document_to_proto(project)
+        return project_to_proto(project)
+    
+    async def GetProjects(self, request, context):
+        """Get all projects with pagination."""
+        try:
+            fields = _mask_fields(request, PROJECT_FIELDS)
+        except ValueError as e:
+            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+            context.set_details(str(e))
+            return service_pb2.GetProjectsResponse()
         
-#         response = service_pb2.GetProjectsResponse()
-#         for project in projects:
-#             project_proto = self._project_to_proto(project)
-#             response.projects.append(project_proto)
+        if fields:
+            projects = await self.service.get_projects(skip=request.skip, limit=request.limit, fields=fields)
+        else:
+            projects = await self.service.get_project_documents(request.skip, request.limit, PROJECT_DOCUMENT_PROJECTION)
         
-#         return response
+        response = service_pb2.GetProjectsResponse()
+        for project in projects:
+            project_proto = self._project_to_proto(project, fields)
+            response.projects.append(project_proto)
+        
+        return response
     
-#     async def GetProject(self, request, context):
-#         """Get a project by its ID."""
-#         project = await self.service.get_project(request.id)
+    async def GetProject(self, request, context):
+        """Get a project by its ID."""
+        try:
+            fields = _mask_fields(request, PROJECT_FIELDS)
+        except ValueError as e:
+            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+            context.set_details(str(e))
+            return service_pb2.ProjectResponse()
         
-#         if not project:
-#             context.set_code(grpc.StatusCode.NOT_FOUND)
-#             context.set_details(f"Project with ID {request.id} not found")
-#             return service_pb2.ProjectResponse()
+        if fields:
+            project = await self.service.get_project(request.id, fields)
+        else:
+            project = await self.service.get_project_document(request.id, PROJECT_DOCUMENT_PROJECTION)
+        
+        if not project:
+            context.set_code(grpc.StatusCode.NOT_FOUND)
+            context.set_details(f"Project with ID {request.id} not found")
+            return service_pb2.ProjectResponse()
         
-#         project_proto = self._project_to_proto(project)
-#         return service_pb2.ProjectResponse(project=project_proto)
+        project_proto = self._project_to_proto(project, fields)
+        return service_pb2.ProjectResponse(project=project_proto)
     
-#     async def GetProjectBySlug(self, request, context):
-#         """Get a project by its slug."""
-#         project = await self.service.get_project_by_slug(request.slug)
+    async def GetProjectBySlug(self, request, context):
+        """Get a project by its slug."""
+        try:
+            fields = _mask_fields(request, PROJECT_FIELDS)
+        except ValueError as e:
+            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+            context.set_details(str(e))
+            return service_pb2.ProjectResponse()
         
-#         if not project:
-#             context.set_code(grpc.StatusCode.NOT_FOUND)
-#             context.set_details(f"Project with slug {request.slug} not found")
-#             return service_pb2.ProjectResponse()
+        if fields:
+            project = await self.service.get_project_by_slug(request.slug, fields)
+        else:
+            project = await self.service.get_project_document_by_slug(request.slug, PROJECT_DOCUMENT_PROJECTION)
         
-#         project_proto = self._project_to_proto(project)
-#         return service_pb2.ProjectResponse(project=project_proto)
+        if not project:
+            context.set_code(grpc.StatusCode.NOT_FOUND)
+            context.set_details(f"Project with slug {request.slug} not found")
+            return service_pb2.ProjectResponse()
+        
+        project_proto = self._project_to_proto(project, fields)
+        return service_pb2.ProjectResponse(project=project_proto)
     
-#     async def GetProjectsByUser(self, request, context):
-#         """Get all projects for a specific user."""
-#         projects = await self.service.get_projects_by_user(
-#             user_id=request.user_id,
-#             skip=request.skip,
-#             limit=request.limit
-#         )
-        
-#         response = service_pb2.GetProjectsResponse()
-#         for project in projects:
-#             project_proto = self._project_to_proto(project)
-#             response.projects.append(project_proto)
-        
-#         return response
+    async def GetProjectsByUser(self, request, context):
+        """Get all projects for a specific user."""
+        try:
+            fields = _mask_fields(request, PROJECT_FIELDS)
+        except ValueError as e:
+            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+            context.set_details(str(e))
+            return service_pb2.GetProjectsResponse()
+        
+        if fields:
+            projects = await self.service.get_projects_by_user(
+                user_id=request.user_id,
+                skip=request.skip,
+                limit=request.limit,
+                fields=fields
+            )
+        else:
+            projects = await self.service.get_project_documents_by_user(
+                request.user_id, request.skip, request.limit, PROJECT_DOCUMENT_PROJECTION
+            )
+        
+        response = service_pb2.GetProjectsResponse()
+        for project in projects:
+            project_proto = self._project_to_proto(project, fields)
+            response.projects.append(project_proto)
+        
+        return response
     
-#     async def CreateProject(self, request, context):
-#         """Create a new project."""
-#         try:
-#             github_link = request.github_link if hasattr(request, 'github_link') else None
+    async def CreateProject(self, request, context):
+        """Create a new project."""
+        try:
+            github_link = request.github_link if hasattr(request, 'github_link') else None
             
-#             project_data = ProjectCreate(
-#                 slug=request.slug,
-#                 title=request.title,
-#                 body=request.body,
-#                 github_link=github_link,
-#                 user_id=request.user_id
-#             )
+            project_data = ProjectCreate(
+                slug=request.slug,
+                title=request.title,
+                body=request.body,
+                github_link=github_link,
+                user_id=request.user_id
+            )
             
-#             project = await self.service.create_project(project_data)
-#             project_proto = self._project_to_proto(project)
+            project = await self.service.create_project(project_data)
+            project_proto = self._project_to_proto(project)
             
-#             return service_pb2.ProjectResponse(project=project_proto)
-#         except ValueError as e:
-#             context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
-#             context.set_details(str(e))
-#             return service_pb2.ProjectResponse()
+            return service_pb2.ProjectResponse(project=project_proto)
+        except ValueError as e:
+            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+            context.set_details(str(e))
+            return service_pb2.ProjectResponse()
     
-#     async def UpdateProject(self, request, context):
-#         """Update an existing project."""
-#         # Build update data from request
-#         update_data = {}
+    async def UpdateProject(self, request, context):
+        """Update an existing project."""
+        # Build update data from request
+        update_data = {}
         
-#         # Only include fields that are explicitly set in the request
-#         for field, value in request.ListFields():
-#             if field.name != 'id':
-#                 update_data[field.name] = value
+        # Only include fields that are explicitly set in the request
+        for field, value in request.ListFields():
+            if field.name != 'id':
+                update_data[field.name] = value
         
-#         project_update = ProjectUpdate(**update_data)
+        project_update = ProjectUpdate(**update_data)
         
-#         try:
-#             project = await self.service.update_project(request.id, project_update)
+        try:
+            project = await self.service.update_project(request.id, project_update)
             
-#             if not project:
-#                 context.set_code(grpc.StatusCode.NOT_FOUND)
-#                 context.set_details(f"Project with ID {request.id} not found")
-#                 return service_pb2.ProjectResponse()
+            if not project:
+                context.set_code(grpc.StatusCode.NOT_FOUND)
+                context.set_details(f"Project with ID {request.id} not found")
+                return service_pb2.ProjectResponse()
             
-#             project_proto = self._project_to_proto(project)
-#             return service_pb2.ProjectResponse(project=project_proto)
-#         except ValueError as e:
-#             context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
-#             context.set_details(str(e))
-#             return service_pb2.ProjectResponse()
+            project_proto = self._project_to_proto(project)
+            return service_pb2.ProjectResponse(project=project_proto)
+        except ValueError as e:
+            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+            context.set_details(str(e))
+            return service_pb2.ProjectResponse()
     
-#     async def DeleteProject(self, request, context):
-#         """Delete a project by its ID."""
-#         success = await self.service.delete_project(request.id)
+    async def DeleteProject(self, request, context):
+        """Delete a project by its ID."""
+        success = await self.service.delete_project(request.id)
         
-#         if not success:
-#             context.set_code(grpc.StatusCode.NOT_FOUND)
-#             context.set_details(f"Project with ID {request.id} not found")
+        if not success:
+            context.set_code(grpc.StatusCode.NOT_FOUND)
+            context.set_details(f"Project with ID {request.id} not found")
         
-#         return service_pb2.DeleteProjectResponse(success=success)
+        return service_pb2.DeleteProjectResponse(success=success)
 
-# # Project Image Service Implementation
-# class ProjectImageServicer(service_pb2_grpc.ProjectImageServiceServicer):
-#     def __init__(self):
-#         self.service = ProjectImageService()
+# Project Image Service Implementation
+class ProjectImageServicer(service_pb2_grpc.ProjectImageServiceServicer):
+    def __init__(self):
+        self.service = ProjectImageService()
     
-#     def _project_image_to_proto(self, image: Any) -> service_pb2.ProjectImage:
-#         """Convert a project image model to protobuf message."""
-#         return service_pb2.ProjectImage(
-#             id=str(image.id),
-#             project_id=str(image.project_id),
-#             image_url=image.image_url
-#         )
+    def _project_image_to_proto(self, image: Any) -> service_pb2.ProjectImage:
+        """Convert a project image model to protobuf message."""
+        return project_image_to_proto(image)
     
-#     async def GetImagesByProject(self, request, context):
-#         """Get all images for a specific project."""
-#         images = await self.service.get_images_by_project(request.project_id)
+    async def GetImagesByProject(self, request, context):
+        """Get all images for a specific project."""
+        images = await self.service.get_images_by_project(request.project_id)
         
-#         response = service_pb2.GetProjectImagesResponse()
-#         for image in images:
-#             image_proto = self._project_image_to_proto(image)
-#             response.images.append(image_proto)
+        response = service_pb2.GetProjectImagesResponse()
+        for image in images:
+            image_proto = self._project_image_to_proto(image)
+            response.images.append(image_proto)
         
-#         return response
+        return response
     
-#     async def GetImage(self, request, context):
-#         """Get an image by its ID."""
-#         image = await self.service.get_image(request.id)
+    async def GetImage(self, request, context):
+        """Get an image by its ID."""
+        image = await self.service.get_image(request.id)
         
-#         if not image:
-#             context.set_code(grpc.StatusCode.NOT_FOUND)
-#             context.set_details(f"Image with ID {request.id} not found")
-#             return service_pb2.ProjectImageResponse()
+        if not image:
+            context.set_code(grpc.StatusCode.NOT_FOUND)
+            context.set_details(f"Image with ID {request.id} not found")
+            return service_pb2.ProjectImageResponse()
         
-#         image_proto = self._project_image_to_proto(image)
-#         return service_pb2.ProjectImageResponse(image=image_proto)
+        image_proto = self._project_image_to_proto(image)
+        return service_pb2.ProjectImageResponse(image=image_proto)
     
-#     async def CreateImage(self, request, context):
-#         """Create a new image."""
-#         try:
-#             image_data = ProjectImageCreate(
-#                 project_id=request.project_id,
-#                 image_url=request.image_url
-#             )
+    async def CreateImage(self, request, context):
+        """Create a new image."""
+        try:
+            image_data = ProjectImageCreate(
+                project_id=request.project_id,
+                image_url=request.image_url
+            )
             
-#             image = await self.service.create_image(image_data)
-#             image_proto = self._project_image_to_proto(image)
+            image = await self.service.create_image(image_data)
+            image_proto = self._project_image_to_proto(image)
             
-#             return service_pb2.ProjectImageResponse(image=image_proto)
-#         except ValueError as e:
-#             context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
-#             context.set_details(str(e))
-#             return service_pb2.ProjectImageResponse()
+            return service_pb2.ProjectImageResponse(image=image_proto)
+        except ValueError as e:
+            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+            context.set_details(str(e))
+            return service_pb2.ProjectImageResponse()
     
-#     async def UpdateImage(self, request, context):
-#         """Update an existing image."""
-#         # Build update data from request
-#         update_data = {}
+    async def UpdateImage(self, request, context):
+        """Update an existing image."""
+        # Build update data from request
+        update_data = {}
         
-#         # Only include fields that are explicitly set in the request
-#         for field, value in request.ListFields():
-#             if field.name != 'id':
-#                 update_data[field.name] = value
+        # Only include fields that are explicitly set in the request
+        for field, value in request.ListFields():
+            if field.name != 'id':
+                update_data[field.name] = value
         
-#         image_update = ProjectImageUpdate(**update_data)
+        image_update = ProjectImageUpdate(**update_data)
         
-#         try:
-#             image = await self.service.update_image(request.id, image_update)
+        try:
+            image = await self.service.update_image(request.id, image_update)
             
-#             if not image:
-#                 context.set_code(grpc.StatusCode.NOT_FOUND)
-#                 context.set_details(f"Image with ID {request.id} not found")
-#                 return service_pb2.ProjectImageResponse()
+            if not image:
+                context.set_code(grpc.StatusCode.NOT_FOUND)
+                context.set_details(f"Image with ID {request.id} not found")
+                return service_pb2.ProjectImageResponse()
             
-#             image_proto = self._project_image_to_proto(image)
-#             return service_pb2.ProjectImageResponse(image=image_proto)
-#         except ValueError as e:
-#             context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
-#             context.set_details(str(e))
-#             return service_pb2.ProjectImageResponse()
+            image_proto = self._project_image_to_proto(image)
+            return service_pb2.ProjectImageResponse(image=image_proto)
+        except ValueError as e:
+            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+            context.set_details(str(e))
+            return service_pb2.ProjectImageResponse()
     
-#     async def DeleteImage(self, request, context):
-#         """Delete an image by its ID."""
-#         success = await self.service.delete_image(request.id)
+    async def DeleteImage(self, request, context):
+        """Delete an image by its ID."""
+        success = await self.service.delete_image(request.id)
         
-#         if not success:
-#             context.set_code(grpc.StatusCode.NOT_FOUND)
-#             context.set_details(f"Image with ID {request.id} not found")
+        if not success:
+            context.set_code(grpc.StatusCode.NOT_FOUND)
+            context.set_details(f"Image with ID {request.id} not found")
         
-#         return service_pb2.DeleteImageResponse(success=success)
-
-# Adapter classes for async-to-sync conversion
-class AsyncUserServicer(service_pb2_grpc.UserServiceServicer):
-    """Adapter for running async methods in gRPC."""
-    def __init__(self):
-        self.servicer = UserServicer()
-    
-    def GetUsers(self, request, context):
-        return asyncio.run(self.servicer.GetUsers(request, context))
-    
-    def GetUser(self, request, context):
-        return asyncio.run(self.servicer.GetUser(request, context))
-    
-    def GetUserByUsername(self, request, context):
-        return asyncio.run(self.servicer.GetUserByUsername(request, context))
-    
-    def CreateUser(self, request, context):
-        return asyncio.run(self.servicer.CreateUser(request, context))
-    
-    def UpdateUser(self, request, context):
-        return asyncio.run(self.servicer.UpdateUser(request, context))
-    
-    def DeleteUser(self, request, context):
-        return asyncio.run(self.servicer.DeleteUser(request, context))
-    
-    def AuthenticateUser(self, request, context):
-        return asyncio.run(self.servicer.AuthenticateUser(request, context))
-
-# class AsyncProjectServicer(service_pb2_grpc.ProjectServiceServicer):
-#     """Adapter for running async methods in gRPC."""
-#     def __init__(self):
-#         self.servicer = ProjectServicer()
-    
-#     def GetProjects(self, request, context):
-#         return asyncio.run(self.servicer.GetProjects(request, context))
-    
-#     def GetProject(self, request, context):
-#         return asyncio.run(self.servicer.GetProject(request, context))
-    
-#     def GetProjectBySlug(self, request, context):
-#         return asyncio.run(self.servicer.GetProjectBySlug(request, context))
-    
-#     def GetProjectsByUser(self, request, context):
-#         return asyncio.run(self.servicer.GetProjectsByUser(request, context))
+        return service_pb2.DeleteImageResponse(success=success)
     
-#     def CreateProject(self, request, context):
-#         return asyncio.run(self.servicer.CreateProject(request, context))
-    
-#     def UpdateProject(self, request, context):
-#         return asyncio.run(self.servicer.UpdateProject(request, context))
-    
-#     def DeleteProject(self, request, context):
-#         return asyncio.run(self.servicer.DeleteProject(request, context))
-
-# class AsyncProjectImageServicer(service_pb2_grpc.ProjectImageServiceServicer):
-#     """Adapter for running async methods in gRPC."""
-#     def __init__(self):
-#         self.servicer = ProjectImageServicer()
-    
-#     def GetImagesByProject(self, request, context):
-#         return asyncio.run(self.servicer.GetImagesByProject(request, context))
-    
-#     def GetImage(self, request, context):
-#         return asyncio.run(self.servicer.GetImage(request, context))
-    
-#     def CreateImage(self, request, context):
-#         return asyncio.run(self.servicer.CreateImage(request, context))
-    
-#     def UpdateImage(self, request, context):
-#         return asyncio.run(self.servicer.UpdateImage(request, context))
-    
-#     def DeleteImage(self, request, context):
-#         return asyncio.run(self.servicer.DeleteImage(request, context))
+    async def DownloadImage(self, request, context):
+        """Stream an uploaded image's bytes, optionally a sub-range."""
+        image = await self.service.get_image(request.id)
+        grid_out = await self.service.open_image(image) if image else None
+        
+        if not grid_out:
+            context.set_code(grpc.StatusCode.NOT_FOUND)
+            context.set_details(f"Image content with ID {request.id} not found")
+            return
+        
+        start = request.offset
+        if start < 0 or (start >= grid_out.length and grid_out.length > 0):
+            context.set_code(grpc.StatusCode.OUT_OF_RANGE)
+            context.set_details(f"Offset {start} is outside the image")
+            return
+        end = grid_out.length - 1
+        if request.length > 0:
+            end = min(start + request.length - 1, end)
+        
+        offset = start
+        first = True
+        async for data in self.service.iter_image(grid_out, start, end):
+            chunk = service_pb2.ImageChunk(data=data, offset=offset)
+            if first:
+                chunk.total_length = grid_out.length
+                chunk.content_type = image.content_type or ""
+                chunk.checksum = image.checksum or ""
+                first = False
+            offset += len(data)
+            yield chunk
 
-def serve():
-    """Start the gRPC server."""
-    server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
+async def serve() -> grpc.aio.Server:
+    """
+    Start the gRPC server on the running event loop, sharing it (and the Motor
+    client) with the REST app. The port is bound with SO_REUSEPORT so several
+    worker processes can serve the same address.
+    """
+    # Outermost first, in the same order as the REST middleware: cache hits
+    # are timed and counted but never shed by admission control
+    interceptors = []
+    if settings.METRICS_ENABLED:
+        interceptors.append(MetricsInterceptor())
+    if settings.SERVER_TIMING:
+        interceptors.append(ServerTimingInterceptor())
+    if settings.CIRCUIT_BREAKER_ENABLED:
+        interceptors.append(CircuitBreakerInterceptor())
+    interceptors.append(ResponseCacheInterceptor())
+    if settings.DEADLINE_ENABLED:
+        interceptors.append(DeadlineInterceptor())
+    if settings.ADMISSION_ENABLED:
+        interceptors.append(AdmissionControlInterceptor())
+    server = grpc.aio.server(
+        interceptors=interceptors,
+        maximum_concurrent_rpcs=settings.GRPC_MAX_CONCURRENT_RPCS,
+        options=[("grpc.so_reuseport", 1)]
+    )
     
     # Add servicers to server
     service_pb2_grpc.add_UserServiceServicer_to_server(
-        AsyncUserServicer(), server
+        UserServicer(), server
+    )
+    service_pb2_grpc.add_ProjectServiceServicer_to_server(
+        ProjectServicer(), server
     )
-    # service_pb2_grpc.add_ProjectServiceServicer_to_server(
-    #     AsyncProjectServicer(), server
-    # )
-    # service_pb2_grpc.add_ProjectImageServiceServicer_to_server(
-    #     AsyncProjectImageServicer(), server
-    # )
+    service_pb2_grpc.add_ProjectImageServiceServicer_to_server(
+        ProjectImageServicer(), server
+    )
+    
+    # Standard grpc.health.v1 service mirroring the process readiness
+    health_servicer = health.aio.HealthServicer()
+    health_pb2_grpc.add_HealthServicer_to_server(health_servicer, server)
+    service_names = ["", *(service.full_name for service in service_pb2.DESCRIPTOR.services_by_name.values())]
+    
+    async def report_health(ready: bool):
+        status = health_pb2.HealthCheckResponse.SERVING if ready else health_pb2.HealthCheckResponse.NOT_SERVING
+        for name in service_names:
+            await health_servicer.set(name, status)
+    
+    await readiness.add_listener(report_health)
     
     server.add_insecure_port(settings.GRPC_SERVER_ADDRESS)
-    server.start()
+    await server.start()
     print(f"gRPC server started on {settings.GRPC_SERVER_ADDRESS}")
-    return server
\ No newline at end of file
+    return server
@@ -0,0 +1,287 @@
+"""gRPC server interceptors (grpc.aio; every RPC runs in its own task)."""
+import time
+from typing import Any, Callable, Dict, Tuple
+
+import grpc
+
+from app.core.admission import AdaptiveLimiter, grpc_limiter, grpc_priority
+from app.core.circuit_breaker import CircuitOpenError
+from app.core.config import settings
+from app.core.deadline import DeadlineExceeded, request_deadline
+from app.core.metrics import ADMISSION_REJECTED, GRPC_LATENCY, GRPC_REQUESTS, STALE_RESPONSES
+from app.core.response_cache import (
+    PROJECTS_TAG, ResponseCache, grpc_response_cache, image_tag, project_tag, user_tag
+)
+from app.core.timing import SERVER_TIMING_HEADER, current_timings, start_request
+
+def _wrap_handler(handler, wrap_unary, wrap_stream):
+    """Return a copy of an RPC method handler with its behaviour wrapped."""
+    if handler is None:
+        return None
+    if handler.unary_unary:
+        return handler._replace(unary_unary=wrap_unary(handler.unary_unary))
+    if handler.stream_unary:
+        return handler._replace(stream_unary=wrap_unary(handler.stream_unary))
+    if handler.unary_stream:
+        return handler._replace(unary_stream=wrap_stream(handler.unary_stream))
+    if handler.stream_stream:
+        return handler._replace(stream_stream=wrap_stream(handler.stream_stream))
+    return handler
+
+def _split_method(full_method: str) -> tuple:
+    # "/protos.UserService/GetUser" -> ("protos.UserService", "GetUser")
+    service, _, method = full_method.lstrip("/").rpartition("/")
+    return service, method
+
+def _add_trailing_metadata(context, *metadata) -> None:
+    context.set_trailing_metadata(tuple(context.trailing_metadata() or ()) + metadata)
+
+class ServerTimingInterceptor(grpc.aio.ServerInterceptor):
+    """
+    Collect phase timings for each RPC and send them as `server-timing` trailing
+    metadata. The timings live in the RPC's own task context, so they never leak
+    into other calls.
+    """
+    def _send_timings(self, context):
+        # Keep trailing metadata the handler set, e.g. retry-after
+        _add_trailing_metadata(context, (SERVER_TIMING_HEADER, current_timings().header_value()))
+
+    async def intercept_service(self, continuation, handler_call_details):
+        def wrap_unary(behavior):
+            async def timed_behavior(request, context):
+                start_request()
+                try:
+                    return await behavior(request, context)
+                finally:
+                    self._send_timings(context)
+            return timed_behavior
+
+        def wrap_stream(behavior):
+            async def timed_behavior(request, context):
+                start_request()
+                try:
+                    async for response in behavior(request, context):
+                        yield response
+                finally:
+                    self._send_timings(context)
+            return timed_behavior
+
+        return _wrap_handler(await continuation(handler_call_details), wrap_unary, wrap_stream)
+
+def _status_name(context) -> str:
+    code = context.code()
+    return (code or grpc.StatusCode.OK).name
+
+def _error_name(context) -> str:
+    # context.abort() sets the code before raising; anything else is UNKNOWN
+    return (context.code() or grpc.StatusCode.UNKNOWN).name
+
+class MetricsInterceptor(grpc.aio.ServerInterceptor):
+    """Count RPCs by status code and observe their latency per method."""
+    def _record(self, labels, context, started_at, code=None):
+        GRPC_LATENCY.labels(*labels).observe(time.perf_counter() - started_at)
+        GRPC_REQUESTS.labels(*labels, code or _status_name(context)).inc()
+
+    async def intercept_service(self, continuation, handler_call_details):
+        labels = _split_method(handler_call_details.method)
+
+        def wrap_unary(behavior):
+            async def measured_behavior(request, context):
+                started_at = time.perf_counter()
+                try:
+                    response = await behavior(request, context)
+                except Exception:
+                    self._record(labels, context, started_at, _error_name(context))
+                    raise
+                self._record(labels, context, started_at)
+                return response
+            return measured_behavior
+
+        def wrap_stream(behavior):
+            async def measured_behavior(request, context):
+                started_at = time.perf_counter()
+                try:
+                    async for response in behavior(request, context):
+                        yield response
+                except Exception:
+                    self._record(labels, context, started_at, _error_name(context))
+                    raise
+                self._record(labels, context, started_at)
+            return measured_behavior
+
+        return _wrap_handler(await continuation(handler_call_details), wrap_unary, wrap_stream)
+
+class AdmissionControlInterceptor(grpc.aio.ServerInterceptor):
+    """
+    Shed RPCs beyond the adaptive concurrency limit with RESOURCE_EXHAUSTED and
+    `retry-after` trailing metadata. Streaming RPCs hold a slot until they finish
+    but, like failed calls, do not feed their latency to the limiter.
+    """
+    def __init__(self, limiter: AdaptiveLimiter = grpc_limiter):
+        self.limiter = limiter
+
+    async def _reject(self, priority, context):
+        ADMISSION_REJECTED.labels("grpc", priority.name.lower()).inc()
+        context.set_trailing_metadata((("retry-after", str(settings.ADMISSION_RETRY_AFTER)),))
+        await context.abort(grpc.StatusCode.RESOURCE_EXHAUSTED, "Server is overloaded, retry later")
+
+    async def intercept_service(self, continuation, handler_call_details):
+        key = handler_call_details.method
+        priority = grpc_priority(_split_method(key)[1])
+
+        def wrap_unary(behavior):
+            async def admitted_behavior(request, context):
+                if not self.limiter.try_acquire(priority):
+                    await self._reject(priority, context)
+                started_at = time.perf_counter()
+                latency = None
+                try:
+                    response = await behavior(request, context)
+                    if not context.code():
+                        latency = time.perf_counter() - started_at
+                    return response
+                finally:
+                    self.limiter.release(key, latency)
+            return admitted_behavior
+
+        def wrap_stream(behavior):
+            async def admitted_behavior(request, context):
+                if not self.limiter.try_acquire(priority):
+                    await self._reject(priority, context)
+                try:
+                    async for response in behavior(request, context):
+                        yield response
+                finally:
+                    self.limiter.release(key)
+            return admitted_behavior
+
+        return _wrap_handler(await continuation(handler_call_details), wrap_unary, wrap_stream)
+
+class DeadlineInterceptor(grpc.aio.ServerInterceptor):
+    """
+    Run each RPC under the client's deadline, so its MongoDB queries get the
+    remaining time as maxTimeMS. Calls that arrive expired, or whose queries
+    run out of time, end with DEADLINE_EXCEEDED; other MongoDB timeouts, and
+    any timeout in a call without a deadline, propagate unchanged.
+    """
+    async def _expired(self, context):
+        await context.abort(grpc.StatusCode.DEADLINE_EXCEEDED, "Request deadline exceeded")
+
+    async def intercept_service(self, continuation, handler_call_details):
+        def wrap_unary(behavior):
+            async def deadline_behavior(request, context):
+                try:
+                    with request_deadline(context.time_remaining()):
+                        return await behavior(request, context)
+                except DeadlineExceeded:
+                    await self._expired(context)
+            return deadline_behavior
+
+        def wrap_stream(behavior):
+            async def deadline_behavior(request, context):
+                try:
+                    with request_deadline(context.time_remaining()):
+                        async for response in behavior(request, context):
+                            yield response
+                except DeadlineExceeded:
+                    await self._expired(context)
+            return deadline_behavior
+
+        return _wrap_handler(await continuation(handler_call_details), wrap_unary, wrap_stream)
+
+class CircuitBreakerInterceptor(grpc.aio.ServerInterceptor):
+    """
+    End RPCs refused by an open circuit breaker with UNAVAILABLE and
+    `retry-after` trailing metadata for when the breaker will next try MongoDB.
+    """
+    async def _unavailable(self, context, error: CircuitOpenError):
+        _add_trailing_metadata(context, ("retry-after", str(error.retry_after_seconds)))
+        await context.abort(grpc.StatusCode.UNAVAILABLE, str(error))
+
+    async def intercept_service(self, continuation, handler_call_details):
+        def wrap_unary(behavior):
+            async def breaker_behavior(request, context):
+                try:
+                    return await behavior(request, context)
+                except CircuitOpenError as e:
+                    await self._unavailable(context, e)
+            return breaker_behavior
+
+        def wrap_stream(behavior):
+            async def breaker_behavior(request, context):
+                try:
+                    async for response in behavior(request, context):
+                        yield response
+                except CircuitOpenError as e:
+                    await self._unavailable(context, e)
+            return breaker_behavior
+
+        return _wrap_handler(await continuation(handler_call_details), wrap_unary, wrap_stream)
+
+# Idempotent read RPCs whose responses may be cached, with the tags of a
+# response; the services purge these tags on every write, as for REST
+CACHEABLE_RPCS: Dict[str, Callable[[Any, Any], Tuple[str, ...]]] = {
+    "/protos.UserService/GetUser": lambda request, response: (user_tag(response.user.id),),
+    "/protos.UserService/GetUserByUsername": lambda request, response: (user_tag(response.user.id),),
+    "/protos.UserService/GetUserPortfolio": lambda request, response: (user_tag(response.user.id),),
+    "/protos.ProjectService/GetProjects": lambda request, response: (PROJECTS_TAG,),
+    "/protos.ProjectService/GetProject": lambda request, response: (project_tag(response.project.id),),
+    "/protos.ProjectService/GetProjectBySlug": lambda request, response: (project_tag(response.project.id),),
+    "/protos.ProjectService/GetProjectsByUser": lambda request, response: (user_tag(request.user_id),),
+    "/protos.ProjectImageService/GetImagesByProject": lambda request, response: (project_tag(request.project_id),),
+    "/protos.ProjectImageService/GetImage": lambda request, response: (
+        image_tag(response.image.id), project_tag(response.image.project_id)
+    ),
+}
+
+class ResponseCacheInterceptor(grpc.aio.ServerInterceptor):
+    """
+    Cache the serialized responses of the read RPCs in CACHEABLE_RPCS, keyed by
+    method and request bytes, in a byte-bounded LRU with a TTL. Only OK
+    responses are stored. A hit returns the stored bytes, which the response
+    serializer passes through, so no message is built. While a circuit breaker
+    refuses MongoDB work, a recently expired entry is returned instead. Calls
+    are marked with `x-cache: HIT`, `MISS` or `STALE` trailing metadata.
+    """
+    def __init__(self, cache: ResponseCache = grpc_response_cache):
+        self.cache = cache
+
+    async def intercept_service(self, continuation, handler_call_details):
+        method = handler_call_details.method
+        handler = await continuation(handler_call_details)
+        tags_for = CACHEABLE_RPCS.get(method)
+        if handler is None or tags_for is None or not handler.unary_unary or not self.cache.enabled:
+            return handler
+
+        behavior = handler.unary_unary
+        serialize = handler.response_serializer
+
+        async def cached_behavior(request, context):
+            key = (method, request.SerializeToString(deterministic=True))
+            entry = self.cache.get(key)
+            if entry is not None:
+                _add_trailing_metadata(context, ("x-cache", "HIT"))
+                return entry.body
+
+            # A write that purges while this call reads must not be undone by storing it
+            sequence = self.cache.sequence
+            try:
+                response = await behavior(request, context)
+            except CircuitOpenError:
+                entry = self.cache.get(key, stale=True)
+                if entry is None:
+                    raise
+                STALE_RESPONSES.labels("grpc").inc()
+                _add_trailing_metadata(context, ("x-cache", "STALE"))
+                return entry.body
+            _add_trailing_metadata(context, ("x-cache", "MISS"))
+            if context.code() not in (None, grpc.StatusCode.OK):
+                return response
+            body = serialize(response)
+            self.cache.set(key, 0, [], body, tags_for(request, response), sequence=sequence)
+            return body
+
+        return handler._replace(
+            unary_unary=cached_behavior,
+            response_serializer=lambda response: response if isinstance(response, bytes) else serialize(response)
+        )
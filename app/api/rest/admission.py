@@ -0,0 +1,67 @@
+import time
+
+import orjson
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.admission import AdaptiveLimiter, rest_limiter, rest_policy
+from app.core.config import settings
+from app.core.metrics import ADMISSION_REJECTED
+from app.api.rest.batch_endpoints import BATCH_PATH, in_batch
+from app.api.rest.metrics import route_template
+from app.api.rest.responses import JSON_MEDIA_TYPE
+
+OVERLOADED_BODY = orjson.dumps({"detail": "Server is overloaded, retry later"})
+
+class AdmissionControlMiddleware:
+    """
+    Shed API requests beyond the adaptive concurrency limit with an immediate 503.
+    Only API routes are admitted; a batch is not, but each of its sub-requests is,
+    so a batch's fanned-out work counts against the limit like separate requests.
+    """
+    def __init__(self, app: ASGIApp, limiter: AdaptiveLimiter = rest_limiter):
+        self.app = app
+        self.limiter = limiter
+
+    async def _reject(self, send: Send) -> None:
+        await send({
+            "type": "http.response.start",
+            "status": 503,
+            "headers": [
+                (b"content-type", JSON_MEDIA_TYPE.encode()),
+                (b"content-length", str(len(OVERLOADED_BODY)).encode()),
+                (b"retry-after", str(settings.ADMISSION_RETRY_AFTER).encode()),
+            ]
+        })
+        await send({"type": "http.response.body", "body": OVERLOADED_BODY})
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        path = scope.get("path", "")
+        batch = path == BATCH_PATH and not in_batch()
+        if scope["type"] != "http" or not path.startswith(f"{settings.API_PREFIX}/") or batch:
+            await self.app(scope, receive, send)
+            return
+
+        policy = rest_policy(scope["method"], path)
+        if not self.limiter.try_acquire(policy.priority):
+            ADMISSION_REJECTED.labels("rest", policy.priority.name.lower()).inc()
+            await self._reject(send)
+            return
+
+        status_code = None
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        started_at = time.perf_counter()
+        latency = None
+        try:
+            await self.app(scope, receive, send_wrapper)
+            # 4xx/304 answers skip the real work; timing them would skew the baseline
+            if policy.sampled and status_code is not None and 200 <= status_code < 300:
+                latency = time.perf_counter() - started_at
+        finally:
+            # Failed requests release their slot without moving the limit
+            self.limiter.release((scope["method"], route_template(scope)), latency)
@@ -1,13 +1,20 @@
-from fastapi import APIRouter, HTTPException, status, Depends
+from fastapi import APIRouter, HTTPException, status, Depends, Request
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from jose import JWTError, jwt
 from pydantic import BaseModel
+from contextvars import ContextVar
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Optional, Tuple
+import secrets
 
 from app.core.config import settings
+from app.core.rate_limit import LOGIN
+from app.core.revocation import revocation_list
+from app.core.timing import timed
 from app.models.models import User
 from app.services.user_service import UserServices
+from app.api.rest.rate_limit import enforce_rate_limit
+from app.api.rest.responses import FastModelRoute, ModelJSONResponse
 
 # JWT settings
 SECRET_KEY = settings.SECRET_KEY
@@ -16,6 +23,10 @@ ACCESS_TOKEN_EXPIRE_MINUTES = 30
 
 # OAuth2 scheme
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/token")
+optional_oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/token", auto_error=False)
+
+# (token, user) already authenticated for the current batch, shared by its sub-requests
+_authenticated_user: ContextVar[Optional[Tuple[str, User]]] = ContextVar("authenticated_user", default=None)
 
 # Token models
 class Token(BaseModel):
@@ -25,8 +36,11 @@ class Token(BaseModel):
 class TokenData(BaseModel):
     username: Optional[str] = None
 
+class TokenRevocation(BaseModel):
+    token: str
+
 # Router
-router = APIRouter()
+router = APIRouter(route_class=FastModelRoute, default_response_class=ModelJSONResponse)
 user_service = UserServices()
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
@@ -38,13 +52,26 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     else:
         expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     
-    to_encode.update({"exp": expire})
+    # A unique ID, so the token can be revoked before it expires
+    to_encode.update({"exp": expire, "jti": secrets.token_urlsafe(16)})
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     
     return encoded_jwt
 
+def remember_authenticated_user(token: str, user: User) -> None:
+    """Let requests dispatched from this context reuse an authentication."""
+    _authenticated_user.set((token, user))
+
 async def get_current_user(token: str = Depends(oauth2_scheme)) -> User:
     """Get the current user from the JWT token."""
+    authenticated = _authenticated_user.get()
+    if authenticated is not None and authenticated[0] == token:
+        return authenticated[1]
+    
+    return await authenticate_token(token)
+
+async def authenticate_token(token: str) -> User:
+    """Decode a JWT and load its user, raising 401 when either fails."""
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -52,7 +79,8 @@ async def get_current_user(token: str = Depends(oauth2_scheme)) -> User:
     )
     
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        with timed("jwt"):
+            payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
         username: str = payload.get("sub")
         
         if username is None:
@@ -62,6 +90,11 @@ async def get_current_user(token: str = Depends(oauth2_scheme)) -> User:
     except JWTError:
         raise credentials_exception
     
+    # Only Bloom filter hits query MongoDB; tokens issued without a jti cannot be revoked
+    jti = payload.get("jti")
+    if jti is not None and await revocation_list.is_revoked(jti):
+        raise credentials_exception
+    
     user = await user_service.get_user_by_username(token_data.username)
     
     if user is None:
@@ -70,8 +103,9 @@ async def get_current_user(token: str = Depends(oauth2_scheme)) -> User:
     return user
 
 @router.post("/token", response_model=Token)
-async def login_for_access_token(form_data: OAuth2PasswordRequestForm = Depends()):
-    """Login endpoint to get an access token."""
+async def login_for_access_token(request: Request, form_data: OAuth2PasswordRequestForm = Depends()):
+    """Login endpoint to get an access token. Rate limited per client IP and per username."""
+    await enforce_rate_limit(LOGIN, request, username=form_data.username)
     user = await user_service.authenticate_user(form_data.username, form_data.password)
     
     if not user:
@@ -86,4 +120,40 @@ async def login_for_access_token(form_data: OAuth2PasswordRequestForm = Depends(
         data={"sub": user.username}, expires_delta=access_token_expires
     )
     
-    return {"access_token": access_token, "token_type": "bearer"}
\ No newline at end of file
+    return {"access_token": access_token, "token_type": "bearer"}
+
+async def revoke_token(payload: dict) -> None:
+    """Revoke a decoded token until it expires."""
+    if payload.get("jti") is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Token cannot be revoked"
+        )
+    await revocation_list.revoke(payload["jti"], datetime.utcfromtimestamp(payload["exp"]), payload["sub"])
+
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+async def logout(token: str = Depends(oauth2_scheme), current_user: User = Depends(get_current_user)):
+    """Revoke the access token this request was made with."""
+    await revoke_token(jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM]))
+    return None
+
+@router.post("/token/revoke", status_code=status.HTTP_204_NO_CONTENT)
+async def revoke_access_token(revocation: TokenRevocation, current_user: User = Depends(get_current_user)):
+    """
+    Revoke an access token before it expires.
+    Users can revoke their own tokens, admins can revoke any token.
+    Tokens that are invalid or already expired need no revoking.
+    """
+    try:
+        payload = jwt.decode(revocation.token, SECRET_KEY, algorithms=[ALGORITHM])
+    except JWTError:
+        return None
+    
+    if current_user.role != "admin" and payload.get("sub") != current_user.username:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not enough permissions"
+        )
+    
+    await revoke_token(payload)
+    return None
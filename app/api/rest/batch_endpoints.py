@@ -0,0 +1,175 @@
+import asyncio
+import posixpath
+from contextvars import ContextVar
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import unquote, urlsplit
+
+import orjson
+from fastapi import APIRouter, HTTPException, status, Depends, Request, Response
+
+from app.core.config import settings
+from app.models.models import BatchOperation, BatchRequest
+from app.api.rest.auth import authenticate_token, optional_oauth2_scheme, remember_authenticated_user
+from app.api.rest.responses import JSON_MEDIA_TYPE, FastModelRoute, ModelJSONResponse
+
+router = APIRouter(route_class=FastModelRoute, default_response_class=ModelJSONResponse)
+
+BATCH_PATH = f"{settings.API_PREFIX}/v1/batch"
+# Headers of the batch request that every sub-request inherits
+FORWARDED_HEADERS = {b"authorization", b"user-agent", b"x-forwarded-for", b"x-real-ip"}
+# Headers the batch sets itself on sub-requests
+RESERVED_HEADERS = {b"accept", b"content-length", b"content-type", b"host"}
+
+# Set while a batch dispatches its sub-requests, so batches cannot nest
+_in_batch: ContextVar[bool] = ContextVar("in_batch", default=False)
+
+def in_batch() -> bool:
+    """Whether the current request is a sub-request of a batch."""
+    return _in_batch.get()
+
+def _normalize_path(path: str) -> str:
+    """Decode and collapse a path the way the router will see it ("/a/./b//c/../" -> "/a/b/")."""
+    decoded = unquote(path)
+    normalized = posixpath.normpath(decoded) if decoded else decoded
+    if decoded.endswith("/") and not normalized.endswith("/"):
+        normalized += "/"
+    return normalized
+
+def _encode_result(status_code: int, headers: List[Tuple[bytes, bytes]], body: bytes) -> bytes:
+    """Encode one sub-response; JSON bodies are spliced in as-is rather than re-parsed."""
+    header_map: Dict[str, str] = {}
+    content_type = ""
+    for name, value in headers:
+        name, value = name.decode("latin-1").lower(), value.decode("latin-1")
+        if name == "content-length":
+            continue
+        if name == "content-type":
+            content_type = value
+        header_map[name] = f"{header_map[name]}, {value}" if name in header_map else value
+
+    if not body:
+        body = b"null"
+    elif not content_type.startswith(JSON_MEDIA_TYPE):
+        body = orjson.dumps(body.decode("utf-8", "replace"))
+    return b'{"status":%d,"headers":%b,"body":%b}' % (status_code, orjson.dumps(header_map), body)
+
+def _error_result(status_code: int, detail: str) -> bytes:
+    return _encode_result(
+        status_code,
+        [(b"content-type", JSON_MEDIA_TYPE.encode())],
+        orjson.dumps({"detail": detail})
+    )
+
+async def _dispatch(request: Request, operation: BatchOperation) -> bytes:
+    """Run one sub-request through the full ASGI app and capture its response."""
+    url = urlsplit(operation.path)
+    # Check the path that will be routed, so "/api/v1/b%61tch" cannot reach the batch endpoint
+    path = _normalize_path(url.path)
+    if url.scheme or url.netloc or not path.startswith(f"{settings.API_PREFIX}/") or path.rstrip("/") == BATCH_PATH:
+        return _error_result(status.HTTP_400_BAD_REQUEST, f"Invalid batch path: {operation.path}")
+
+    body = b"" if operation.body is None else orjson.dumps(operation.body)
+    headers = [(name, value) for name, value in request.scope["headers"] if name in FORWARDED_HEADERS]
+    for name, value in operation.headers.items():
+        name = name.lower().encode("latin-1")
+        if name not in RESERVED_HEADERS:
+            headers = [header for header in headers if header[0] != name]
+            headers.append((name, value.encode("latin-1")))
+    headers.append((b"accept", JSON_MEDIA_TYPE.encode()))
+    headers.append((b"content-length", str(len(body)).encode()))
+    if body:
+        headers.append((b"content-type", JSON_MEDIA_TYPE.encode()))
+
+    scope = {
+        "type": "http",
+        "asgi": request.scope.get("asgi", {"version": "3.0"}),
+        "http_version": request.scope.get("http_version", "1.1"),
+        "method": operation.method,
+        "scheme": request.scope.get("scheme", "http"),
+        "path": path,
+        "raw_path": url.path.encode(),
+        "query_string": url.query.encode(),
+        "root_path": request.scope.get("root_path", ""),
+        "headers": headers,
+        "server": request.scope.get("server"),
+        "client": request.scope.get("client"),
+        "state": dict(request.scope.get("state", {})),
+    }
+
+    request_sent = False
+    finished = asyncio.Event()
+
+    async def receive():
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        # Nothing else will arrive; only report a disconnect once the response is done
+        await finished.wait()
+        return {"type": "http.disconnect"}
+
+    status_code: Optional[int] = None
+    response_headers: List[Tuple[bytes, bytes]] = []
+    response_body = bytearray()
+
+    async def send(message):
+        nonlocal status_code, response_headers
+        if message["type"] == "http.response.start":
+            status_code = message["status"]
+            response_headers = list(message.get("headers", []))
+        elif message["type"] == "http.response.body":
+            response_body.extend(message.get("body", b""))
+
+    try:
+        await request.app(scope, receive, send)
+    except Exception:
+        # The error middleware has already sent a 500 when it re-raises
+        if status_code is None:
+            return _error_result(status.HTTP_500_INTERNAL_SERVER_ERROR, "Internal Server Error")
+    finally:
+        finished.set()
+
+    if status_code is None:
+        return _error_result(status.HTTP_500_INTERNAL_SERVER_ERROR, "Internal Server Error")
+    return _encode_result(status_code, response_headers, bytes(response_body))
+
+@router.post("/batch")
+async def run_batch(
+    batch: BatchRequest,
+    request: Request,
+    token: Optional[str] = Depends(optional_oauth2_scheme)
+):
+    """
+    Run several API requests in one round trip and return their responses in order.
+    Sub-requests run concurrently (at most BATCH_CONCURRENCY at a time), so they
+    must not depend on each other. A bearer token is checked once and reused by
+    every sub-request; each sub-request still enforces its own permissions.
+    """
+    if in_batch():
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Batches cannot be nested"
+        )
+
+    if len(batch.requests) > settings.BATCH_MAX_REQUESTS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"A batch can contain at most {settings.BATCH_MAX_REQUESTS} requests"
+        )
+
+    if token:
+        remember_authenticated_user(token, await authenticate_token(token))
+
+    semaphore = asyncio.Semaphore(settings.BATCH_CONCURRENCY)
+
+    async def run(operation: BatchOperation) -> bytes:
+        async with semaphore:
+            return await _dispatch(request, operation)
+
+    # Sub-request tasks copy the context, so each of them sees the flag
+    in_batch_token = _in_batch.set(True)
+    try:
+        results = await asyncio.gather(*(run(operation) for operation in batch.requests))
+    finally:
+        _in_batch.reset(in_batch_token)
+    return Response(b'{"responses":[' + b",".join(results) + b"]}", media_type=JSON_MEDIA_TYPE)
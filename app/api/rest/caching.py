@@ -0,0 +1,113 @@
+from contextvars import ContextVar
+from typing import Optional
+
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.api.rest.conditional import CONDITIONAL_HEADERS
+from app.api.rest.responses import negotiate
+from app.core.circuit_breaker import CircuitOpenError
+from app.core.metrics import STALE_RESPONSES
+from app.core.response_cache import CachedResponse, ResponseCache, response_cache
+
+# Set by the middleware for each GET; endpoints opt in by filling it
+_cache_directive: ContextVar[Optional[dict]] = ContextVar("cache_directive", default=None)
+
+def cache_response(*tags: str, ttl: Optional[float] = None) -> None:
+    """
+    Mark the response being built as cacheable under the given tags.
+    Only call this from public endpoints whose output does not depend on the caller.
+    """
+    directive = _cache_directive.get()
+    if directive is not None:
+        directive["tags"] = tags
+        directive["ttl"] = ttl
+
+class ResponseCacheMiddleware:
+    """
+    ASGI cache of fully serialized responses for GET requests.
+
+    Entries are keyed by path, query string and negotiated media type, and are
+    only stored for 200 responses whose endpoint called `cache_response`. A hit
+    is replayed without routing, database access or serialization. Conditional
+    requests bypass the cache; endpoints answer them from a cheap projection.
+    While a circuit breaker refuses MongoDB work, a recently expired entry is
+    replayed instead, marked `x-cache: STALE`.
+    """
+    def __init__(self, app: ASGIApp, cache: ResponseCache = response_cache):
+        self.app = app
+        self.cache = cache
+
+    async def _replay(self, scope: Scope, send: Send, entry: CachedResponse, status: bytes) -> None:
+        # Hits skip the router; keep the route visible to outer middleware
+        if entry.route_scope:
+            scope.update(entry.route_scope)
+        await send({
+            "type": "http.response.start",
+            "status": entry.status,
+            "headers": entry.headers + [(b"x-cache", status)]
+        })
+        await send({"type": "http.response.body", "body": entry.body})
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "GET" or not self.cache.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        if any(header in headers for header in CONDITIONAL_HEADERS):
+            await self.app(scope, receive, send)
+            return
+
+        key = (scope["path"], scope["query_string"], negotiate(headers.get("accept")))
+        entry = self.cache.get(key)
+        if entry is not None:
+            await self._replay(scope, send, entry, b"HIT")
+            return
+
+        directive = {}
+        token = _cache_directive.set(directive)
+        sequence = self.cache.sequence
+        start: Optional[Message] = None
+        body = bytearray()
+        storable = True
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start, storable
+            if message["type"] == "http.response.start":
+                start = message
+                message = {**message, "headers": list(message.get("headers", [])) + [(b"x-cache", b"MISS")]}
+            elif message["type"] == "http.response.body" and storable:
+                body.extend(message.get("body", b""))
+                if len(body) > self.cache.max_entry_bytes:
+                    storable = False
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except CircuitOpenError:
+            entry = self.cache.get(key, stale=True) if start is None else None
+            if entry is None:
+                raise
+            STALE_RESPONSES.labels("rest").inc()
+            await self._replay(scope, send, entry, b"STALE")
+            return
+        finally:
+            _cache_directive.reset(token)
+
+        if not storable or start is None or start["status"] != 200 or "tags" not in directive:
+            return
+        response_headers = list(start.get("headers", []))
+        if any(name.lower() == b"set-cookie" for name, _ in response_headers):
+            return
+
+        self.cache.set(
+            key,
+            start["status"],
+            response_headers,
+            bytes(body),
+            directive["tags"],
+            ttl=directive["ttl"],
+            sequence=sequence,
+            route_scope={key: scope[key] for key in ("route", "path_params") if key in scope}
+        )
@@ -0,0 +1,46 @@
+import orjson
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.circuit_breaker import CircuitOpenError
+from app.api.rest.responses import JSON_MEDIA_TYPE
+
+class CircuitBreakerMiddleware:
+    """
+    Answer requests refused by an open circuit breaker with an immediate 503 and
+    a Retry-After for when the breaker will next try MongoDB.
+    """
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def _reject(self, send: Send, error: CircuitOpenError) -> None:
+        body = orjson.dumps({"detail": str(error)})
+        await send({
+            "type": "http.response.start",
+            "status": 503,
+            "headers": [
+                (b"content-type", JSON_MEDIA_TYPE.encode()),
+                (b"content-length", str(len(body)).encode()),
+                (b"retry-after", str(error.retry_after_seconds).encode()),
+            ]
+        })
+        await send({"type": "http.response.body", "body": body})
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal started
+            if message["type"] == "http.response.start":
+                started = True
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except CircuitOpenError as e:
+            if started:
+                raise
+            await self._reject(send, e)
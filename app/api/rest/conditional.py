@@ -0,0 +1,78 @@
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Optional, Tuple
+
+from fastapi import Request, Response, status
+
+from app.api.rest.responses import negotiated_media_type
+
+CONDITIONAL_HEADERS = ("if-none-match", "if-modified-since")
+
+def is_conditional(request: Request) -> bool:
+    """Whether the client sent any validator worth checking before a full load."""
+    return any(header in request.headers for header in CONDITIONAL_HEADERS)
+
+def make_validators(id: Any, updated_at: Optional[datetime], *extra: Any) -> Tuple[str, Optional[datetime]]:
+    """
+    Build a weak ETag and Last-Modified value from a document's version fields.
+    The negotiated media type is part of the ETag: JSON, protobuf and msgpack
+    share a URL but are different representations.
+    """
+    digest = hashlib.blake2b(digest_size=12)
+    digest.update(negotiated_media_type().encode('utf-8'))
+    digest.update(str(id).encode('utf-8'))
+    if updated_at is not None:
+        digest.update(updated_at.isoformat().encode('utf-8'))
+    for value in extra:
+        digest.update(b'\x00' + str(value).encode('utf-8'))
+
+    last_modified = None
+    if updated_at is not None:
+        # Mongo stores naive UTC datetimes; HTTP dates have second resolution
+        last_modified = updated_at.replace(tzinfo=timezone.utc, microsecond=0)
+
+    return f'W/"{digest.hexdigest()}"', last_modified
+
+def _etag_matches(header: str, etag: str) -> bool:
+    if header.strip() == "*":
+        return True
+    # Weak comparison: ignore the W/ prefix on both sides
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == opaque:
+            return True
+    return False
+
+def is_not_modified(request: Request, etag: str, last_modified: Optional[datetime]) -> bool:
+    """Evaluate If-None-Match / If-Modified-Since (RFC 9110, If-None-Match wins)."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return _etag_matches(if_none_match, etag)
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        return last_modified <= since
+
+    return False
+
+def set_validators(response: Response, etag: str, last_modified: Optional[datetime]) -> Response:
+    """Attach validator headers so clients and the CDN can revalidate."""
+    response.headers["ETag"] = etag
+    response.headers["Vary"] = "Accept"
+    if last_modified is not None:
+        response.headers["Last-Modified"] = format_datetime(last_modified, usegmt=True)
+    response.headers.setdefault("Cache-Control", "no-cache")
+    return response
+
+def not_modified(etag: str, last_modified: Optional[datetime]) -> Response:
+    return set_validators(Response(status_code=status.HTTP_304_NOT_MODIFIED), etag, last_modified)
@@ -0,0 +1,66 @@
+import orjson
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.deadline import DeadlineExceeded, request_deadline, time_remaining
+from app.api.rest.responses import JSON_MEDIA_TYPE
+
+DEADLINE_EXCEEDED_BODY = orjson.dumps({"detail": "Request deadline exceeded"})
+
+def _header_timeout(scope: Scope):
+    value = Headers(scope=scope).get(settings.DEADLINE_HEADER)
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        # A malformed timeout is ignored rather than failing the request
+        return None
+
+class DeadlineMiddleware:
+    """
+    Run each HTTP request under the deadline its caller sent in DEADLINE_HEADER
+    (seconds). Requests that arrive expired, or whose MongoDB work runs out of
+    time, get a 504 unless the response has already started.
+    """
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def _reject(self, send: Send) -> None:
+        await send({
+            "type": "http.response.start",
+            "status": 504,
+            "headers": [
+                (b"content-type", JSON_MEDIA_TYPE.encode()),
+                (b"content-length", str(len(DEADLINE_EXCEEDED_BODY)).encode()),
+            ]
+        })
+        await send({"type": "http.response.body", "body": DEADLINE_EXCEEDED_BODY})
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timeout = _header_timeout(scope)
+        # Batch sub-requests inherit the batch's deadline instead
+        if timeout is None and time_remaining() is None:
+            await self.app(scope, receive, send)
+            return
+
+        started = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal started
+            if message["type"] == "http.response.start":
+                started = True
+            await send(message)
+
+        try:
+            with request_deadline(timeout):
+                await self.app(scope, receive, send_wrapper)
+        except DeadlineExceeded:
+            if started:
+                raise
+            await self._reject(send)
@@ -0,0 +1,20 @@
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.drain import InFlightRequests, in_flight
+
+class InFlightMiddleware:
+    """Count HTTP requests until their response is fully sent, for the shutdown drain."""
+    def __init__(self, app: ASGIApp, requests: InFlightRequests = in_flight):
+        self.app = app
+        self.requests = requests
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        self.requests.enter()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.requests.exit()
@@ -0,0 +1,47 @@
+import zlib
+from typing import AsyncIterator
+
+import orjson
+from fastapi import Request
+from fastapi.responses import StreamingResponse
+
+from app.api.rest.responses import json_default
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+# Lines are grouped into chunks of roughly this size before being sent
+EXPORT_CHUNK_BYTES = 64 * 1024
+
+async def ndjson_chunks(documents: AsyncIterator[dict], compress: bool = False) -> AsyncIterator[bytes]:
+    """Encode documents as NDJSON, optionally gzipped chunk by chunk."""
+    compressor = zlib.compressobj(wbits=31) if compress else None
+    buffer = bytearray()
+
+    async for document in documents:
+        buffer += orjson.dumps(document, default=json_default, option=orjson.OPT_APPEND_NEWLINE)
+        if len(buffer) >= EXPORT_CHUNK_BYTES:
+            chunk = compressor.compress(bytes(buffer)) if compressor else bytes(buffer)
+            buffer.clear()
+            if chunk:
+                yield chunk
+
+    tail = bytes(buffer)
+    if compressor:
+        tail = compressor.compress(tail) + compressor.flush()
+    if tail:
+        yield tail
+
+def ndjson_response(request: Request, documents: AsyncIterator[dict], filename: str) -> StreamingResponse:
+    """Stream documents as an NDJSON download, gzipped when the client accepts it."""
+    compress = "gzip" in request.headers.get("accept-encoding", "").lower()
+    headers = {
+        "Content-Disposition": f'attachment; filename="{filename}"',
+        "Vary": "Accept-Encoding"
+    }
+    if compress:
+        headers["Content-Encoding"] = "gzip"
+
+    return StreamingResponse(
+        ndjson_chunks(documents, compress=compress),
+        media_type=NDJSON_MEDIA_TYPE,
+        headers=headers
+    )
@@ -0,0 +1,18 @@
+from fastapi import APIRouter, status
+from fastapi.responses import JSONResponse
+
+from app.core.health import readiness
+
+router = APIRouter(prefix="/health", include_in_schema=False)
+
+@router.get("/live")
+async def live():
+    """The process is up and serving HTTP."""
+    return {"status": "ok"}
+
+@router.get("/ready")
+async def ready():
+    """Warm and accepting traffic; 503 while starting up or shutting down."""
+    if not readiness.ready:
+        return JSONResponse({"status": "unavailable"}, status_code=status.HTTP_503_SERVICE_UNAVAILABLE)
+    return {"status": "ready"}
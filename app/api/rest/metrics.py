@@ -0,0 +1,62 @@
+import time
+
+from fastapi import APIRouter, Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.metrics import HTTP_LATENCY, HTTP_REQUESTS, render_metrics
+
+router = APIRouter()
+
+# Label for requests that matched no route, to keep label cardinality bounded
+UNMATCHED_ROUTE = "<unmatched>"
+
+def route_template(scope: Scope) -> str:
+    """Full path template of the matched route, e.g. /api/v1/users/{user_id}."""
+    route = scope.get("route")
+    template = getattr(route, "path", None)
+    if template is None:
+        return UNMATCHED_ROUTE
+
+    # Routes of included routers may only know their own part of the path;
+    # recover the prefix by formatting the template with the matched params
+    try:
+        suffix = template.format(**scope.get("path_params", {}))
+    except (KeyError, IndexError, ValueError):
+        return template
+    path = scope["path"]
+    if suffix and path.endswith(suffix):
+        return path[:len(path) - len(suffix)] + template
+    return template
+
+@router.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus exposition of this process (or all workers in multiprocess mode)."""
+    body, content_type = render_metrics()
+    return Response(body, media_type=content_type)
+
+class MetricsMiddleware:
+    """Count HTTP requests and observe their latency per route template."""
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started_at = time.perf_counter()
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            path = route_template(scope)
+            method = scope["method"]
+            HTTP_LATENCY.labels(method, path).observe(time.perf_counter() - started_at)
+            HTTP_REQUESTS.labels(method, path, str(status_code)).inc()
@@ -1,9 +1,15 @@
 from fastapi import APIRouter
 
 from app.api.rest.user_endpoints import router as users_router
+from app.api.rest.project_endpoints import router as projects_router
+from app.api.rest.project_image_endpoints import router as images_router
+from app.api.rest.batch_endpoints import router as batch_router
 from app.api.rest.auth import router as auth_router
 from app.core.config import settings
 
 api_router = APIRouter(prefix=settings.API_PREFIX)
 api_router.include_router(auth_router, tags=["authentication"])
-api_router.include_router(users_router, prefix="/v1", tags=["users"])
\ No newline at end of file
+api_router.include_router(users_router, prefix="/v1", tags=["users"])
+api_router.include_router(projects_router, prefix="/v1", tags=["projects"])
+api_router.include_router(images_router, prefix="/v1", tags=["images"])
+api_router.include_router(batch_router, prefix="/v1", tags=["batch"])
\ No newline at end of file
@@ -0,0 +1,220 @@
+from fastapi import APIRouter, HTTPException, status, Query, Path, Depends, Request, Response
+from fastapi.responses import StreamingResponse
+from datetime import datetime
+from typing import List, Optional
+
+from app.models.models import User, Project, ProjectCreate, ProjectUpdate
+from app.services.project_service import ProjectService
+from app.core.response_cache import PROJECTS_TAG, project_tag, user_tag
+from app.api.rest.auth import get_current_user
+from app.api.rest.caching import cache_response
+from app.api.rest.conditional import (
+    is_conditional, is_not_modified, make_validators, not_modified, set_validators
+)
+from app.api.rest.export import ndjson_response
+from app.api.rest.responses import FastModelRoute, ModelJSONResponse, select_fields
+from app.repositories.projection import PROJECT_FIELDS
+
+router = APIRouter(route_class=FastModelRoute, default_response_class=ModelJSONResponse)
+project_service = ProjectService()
+
+async def get_owned_project(project_id: str, current_user: User) -> Project:
+    """Load a project and check the current user may modify it."""
+    project = await project_service.get_project(project_id)
+    if not project:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Project with ID {project_id} not found"
+        )
+
+    if current_user.role != "admin" and str(project.user_id) != str(current_user.id):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not enough permissions"
+        )
+    return project
+
+def _project_validators(project_id, updated_at, body_hash):
+    # body_hash covers the renderer version, so re-renders invalidate the ETag too
+    return make_validators(project_id, updated_at, body_hash)
+
+@router.get("/projects/", response_model=List[Project])
+async def read_projects(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=100),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return, e.g. slug,title"),
+):
+    """
+    Retrieve projects with pagination, newest first.
+    Public endpoint.
+    """
+    selected = select_fields(fields, PROJECT_FIELDS)
+    cache_response(PROJECTS_TAG)
+    return await project_service.get_projects(skip=skip, limit=limit, fields=selected)
+
+@router.get("/projects/export", response_class=StreamingResponse)
+async def export_projects(
+    request: Request,
+    since: Optional[datetime] = Query(None, description="Only projects updated at or after this time"),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Export projects as newline-delimited JSON, streamed straight from the database.
+    Gzipped when the client sends `Accept-Encoding: gzip`.
+    Only available to admin users.
+    """
+    if current_user.role != "admin":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not enough permissions"
+        )
+
+    return ndjson_response(request, project_service.export_projects(since), "projects.ndjson")
+
+@router.get("/projects/{project_id}", response_model=Project)
+async def read_project(
+    request: Request,
+    response: Response,
+    project_id: str = Path(..., title="The ID of the project to get"),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return, e.g. slug,title"),
+):
+    """
+    Get a specific project by ID.
+    Public endpoint.
+    Supports conditional requests (ETag / Last-Modified).
+    """
+    if is_conditional(request):
+        # Revalidate against a projection before loading the full document
+        validator = await project_service.get_project_validator(project_id)
+        if validator:
+            etag, last_modified = _project_validators(
+                validator["_id"], validator.get("updated_at"), validator.get("body_hash")
+            )
+            if is_not_modified(request, etag, last_modified):
+                return not_modified(etag, last_modified)
+
+    selected = select_fields(fields, PROJECT_FIELDS)
+    project = await project_service.get_project(project_id, selected)
+    if not project:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Project with ID {project_id} not found"
+        )
+    set_validators(response, *_project_validators(project.id, project.updated_at, project.body_hash))
+    cache_response(project_tag(project.id))
+    return project
+
+@router.get("/projects/slug/{slug}", response_model=Project)
+async def read_project_by_slug(
+    slug: str,
+    request: Request,
+    response: Response,
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return, e.g. slug,title"),
+):
+    """
+    Get a specific project by slug.
+    Public endpoint.
+    Supports conditional requests (ETag / Last-Modified).
+    """
+    if is_conditional(request):
+        validator = await project_service.get_project_validator_by_slug(slug)
+        if validator:
+            etag, last_modified = _project_validators(
+                validator["_id"], validator.get("updated_at"), validator.get("body_hash")
+            )
+            if is_not_modified(request, etag, last_modified):
+                return not_modified(etag, last_modified)
+
+    selected = select_fields(fields, PROJECT_FIELDS)
+    project = await project_service.get_project_by_slug(slug, selected)
+    if not project:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Project with slug {slug} not found"
+        )
+    set_validators(response, *_project_validators(project.id, project.updated_at, project.body_hash))
+    cache_response(project_tag(project.id))
+    return project
+
+@router.get("/users/{user_id}/projects", response_model=List[Project])
+async def read_projects_by_user(
+    user_id: str = Path(..., title="The ID of the user whose projects to get"),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=100),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return, e.g. slug,title"),
+):
+    """
+    Get all projects of a user.
+    Public endpoint.
+    """
+    selected = select_fields(fields, PROJECT_FIELDS)
+    cache_response(user_tag(user_id))
+    return await project_service.get_projects_by_user(user_id, skip=skip, limit=limit, fields=selected)
+
+@router.post("/projects/", response_model=Project, status_code=status.HTTP_201_CREATED)
+async def create_project(
+    project: ProjectCreate,
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Create a new project.
+    Users can create their own projects, admins can create projects for anyone.
+    """
+    if current_user.role != "admin" and str(project.user_id) != str(current_user.id):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not enough permissions"
+        )
+
+    try:
+        return await project_service.create_project(project)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+@router.put("/projects/{project_id}", response_model=Project)
+async def update_project(
+    project_id: str = Path(..., title="The ID of the project to update"),
+    project: ProjectUpdate = None,
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Update an existing project.
+    Owners can update their own projects, admins can update any project.
+    """
+    await get_owned_project(project_id, current_user)
+
+    try:
+        updated_project = await project_service.update_project(project_id, project)
+        if not updated_project:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Project with ID {project_id} not found"
+            )
+        return updated_project
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+@router.delete("/projects/{project_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_project(
+    project_id: str = Path(..., title="The ID of the project to delete"),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Delete a project.
+    Owners can delete their own projects, admins can delete any project.
+    """
+    await get_owned_project(project_id, current_user)
+
+    deleted = await project_service.delete_project(project_id)
+    if not deleted:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Project with ID {project_id} not found"
+        )
+    return None
@@ -0,0 +1,217 @@
+from fastapi import APIRouter, HTTPException, status, Query, Path, Depends, Request, Response
+from fastapi.responses import StreamingResponse
+from email.utils import format_datetime
+from datetime import timezone
+from typing import List, Optional, Tuple
+
+from app.core.config import settings
+from app.models.models import User, ProjectImage, ProjectImageCreate
+from app.services.project_image_service import ProjectImageService
+from app.core.response_cache import image_tag, project_tag
+from app.api.rest.auth import get_current_user
+from app.api.rest.caching import cache_response
+from app.api.rest.conditional import is_not_modified
+from app.api.rest.project_endpoints import get_owned_project
+from app.api.rest.responses import FastModelRoute, ModelJSONResponse
+
+router = APIRouter(route_class=FastModelRoute, default_response_class=ModelJSONResponse)
+image_service = ProjectImageService()
+
+def parse_range(header: Optional[str], length: int) -> Optional[Tuple[int, int]]:
+    """
+    Parse a single `bytes=` range against a file of the given length.
+    Returns None when the whole file should be sent.
+    """
+    if not header:
+        return None
+
+    unit, _, spec = header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        # Multipart ranges are not supported, fall back to the full body
+        return None
+
+    start_text, _, end_text = spec.strip().partition("-")
+    try:
+        if start_text == "":
+            suffix = int(end_text)
+            start, end = max(length - suffix, 0), length - 1
+            satisfiable = suffix > 0
+        else:
+            start = int(start_text)
+            end = min(int(end_text), length - 1) if end_text else length - 1
+            satisfiable = start < length and start <= end
+    except ValueError:
+        return None
+
+    if not satisfiable:
+        raise HTTPException(
+            status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+            detail="Requested range not satisfiable",
+            headers={"Content-Range": f"bytes */{length}"}
+        )
+    return start, end
+
+@router.get("/projects/{project_id}/images", response_model=List[ProjectImage])
+async def read_project_images(
+    project_id: str = Path(..., title="The ID of the project whose images to get")
+):
+    """
+    Get all images of a project.
+    Public endpoint.
+    """
+    cache_response(project_tag(project_id))
+    return await image_service.get_images_by_project(project_id)
+
+@router.post("/projects/{project_id}/images", response_model=ProjectImage, status_code=status.HTTP_201_CREATED)
+async def create_project_image(
+    image: ProjectImageCreate,
+    project_id: str = Path(..., title="The ID of the project to add the image to"),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Attach an externally hosted image to a project.
+    Owners can add images to their own projects, admins to any project.
+    """
+    await get_owned_project(project_id, current_user)
+    if str(image.project_id) != project_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Image project_id does not match the project"
+        )
+
+    return await image_service.create_image(image)
+
+@router.post(
+    "/projects/{project_id}/images/upload",
+    response_model=ProjectImage,
+    status_code=status.HTTP_201_CREATED,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"image/*": {"schema": {"type": "string", "format": "binary"}}}
+        }
+    }
+)
+async def upload_project_image(
+    request: Request,
+    project_id: str = Path(..., title="The ID of the project to upload the image to"),
+    filename: str = Query("image", max_length=255),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Upload an image for a project into GridFS.
+    The raw request body is the image; it is streamed to storage chunk by chunk.
+    Owners can upload to their own projects, admins to any project.
+    """
+    await get_owned_project(project_id, current_user)
+
+    content_length = request.headers.get("content-length")
+    if content_length and content_length.isdigit() and int(content_length) > settings.MAX_IMAGE_UPLOAD_BYTES:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail="Image exceeds the maximum upload size"
+        )
+
+    content_type = request.headers.get("content-type", "").split(";")[0].strip()
+    try:
+        return await image_service.upload_image(project_id, request.stream(), content_type, filename)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+@router.get("/images/{image_id}", response_model=ProjectImage)
+async def read_image(
+    image_id: str = Path(..., title="The ID of the image to get")
+):
+    """
+    Get an image's metadata by ID.
+    Public endpoint.
+    """
+    image = await image_service.get_image(image_id)
+    if not image:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Image with ID {image_id} not found"
+        )
+    cache_response(image_tag(image.id), project_tag(image.project_id))
+    return image
+
+@router.get("/images/{image_id}/content")
+async def download_image(
+    request: Request,
+    image_id: str = Path(..., title="The ID of the image to download")
+):
+    """
+    Stream an uploaded image's bytes.
+    Supports single byte ranges and conditional requests; uploaded content never
+    changes under the same ID, so responses are cacheable for a long time.
+    Public endpoint.
+    """
+    image = await image_service.get_image(image_id)
+    grid_out = await image_service.open_image(image) if image else None
+    if not grid_out:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Image content with ID {image_id} not found"
+        )
+
+    length = grid_out.length
+    etag = f'"{image.checksum}"'
+    last_modified = grid_out.upload_date.replace(tzinfo=timezone.utc, microsecond=0)
+    headers = {
+        "ETag": etag,
+        "Last-Modified": format_datetime(last_modified, usegmt=True),
+        "Cache-Control": f"public, max-age={settings.IMAGE_CACHE_MAX_AGE}, immutable",
+        "Accept-Ranges": "bytes"
+    }
+
+    if is_not_modified(request, etag, last_modified):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    byte_range = None
+    if_range = request.headers.get("if-range")
+    if if_range is None or if_range.strip() == etag:
+        byte_range = parse_range(request.headers.get("range"), length)
+
+    if byte_range:
+        start, end = byte_range
+        headers["Content-Range"] = f"bytes {start}-{end}/{length}"
+        status_code = status.HTTP_206_PARTIAL_CONTENT
+    else:
+        start, end = 0, length - 1
+        status_code = status.HTTP_200_OK
+    headers["Content-Length"] = str(end - start + 1)
+
+    return StreamingResponse(
+        image_service.iter_image(grid_out, start, end),
+        status_code=status_code,
+        media_type=image.content_type or "application/octet-stream",
+        headers=headers
+    )
+
+@router.delete("/images/{image_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_image(
+    image_id: str = Path(..., title="The ID of the image to delete"),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Delete an image, including its stored content.
+    Owners can delete images of their own projects, admins any image.
+    """
+    image = await image_service.get_image(image_id)
+    if not image:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Image with ID {image_id} not found"
+        )
+    await get_owned_project(str(image.project_id), current_user)
+
+    deleted = await image_service.delete_image(image_id)
+    if not deleted:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Image with ID {image_id} not found"
+        )
+    return None
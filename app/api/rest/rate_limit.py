@@ -0,0 +1,25 @@
+from typing import Optional
+
+from fastapi import HTTPException, Request, status
+
+from app.core.config import settings
+from app.core.rate_limit import RateLimitExceeded, RateLimitRule, rate_limiter
+
+def client_ip(request: Request) -> Optional[str]:
+    """Address of the client, taken from X-Forwarded-For only when it is trusted."""
+    if settings.RATE_LIMIT_TRUST_FORWARDED:
+        forwarded = request.headers.get("x-forwarded-for")
+        if forwarded:
+            return forwarded.split(",")[0].strip()
+    return request.client.host if request.client else None
+
+async def enforce_rate_limit(rule: RateLimitRule, request: Request, **identities: Optional[str]) -> None:
+    """Check the rule for the client IP and any further identities, raising 429 when exhausted."""
+    try:
+        await rate_limiter.check(rule, ip=client_ip(request), **identities)
+    except RateLimitExceeded as e:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=str(e),
+            headers={"Retry-After": str(e.retry_after_seconds)}
+        )
@@ -0,0 +1,227 @@
+import functools
+import inspect
+from contextvars import ContextVar
+from typing import Any, FrozenSet, List, Optional, get_args, get_origin
+
+import orjson
+from bson import ObjectId
+from fastapi import HTTPException, Response, status
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute
+from pydantic import BaseModel, TypeAdapter
+
+from app.core.timing import timed
+from app.repositories.projection import parse_fields
+
+JSON_MEDIA_TYPE = "application/json"
+PROTOBUF_MEDIA_TYPE = "application/x-protobuf"
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+
+_MEDIA_TYPES = {
+    JSON_MEDIA_TYPE: JSON_MEDIA_TYPE,
+    PROTOBUF_MEDIA_TYPE: PROTOBUF_MEDIA_TYPE,
+    "application/protobuf": PROTOBUF_MEDIA_TYPE,
+    "application/vnd.google.protobuf": PROTOBUF_MEDIA_TYPE,
+    MSGPACK_MEDIA_TYPE: MSGPACK_MEDIA_TYPE,
+    "application/x-msgpack": MSGPACK_MEDIA_TYPE,
+    "application/*": JSON_MEDIA_TYPE,
+    "*/*": JSON_MEDIA_TYPE,
+}
+
+# Media type negotiated for the request being handled
+_negotiated_media_type: ContextVar[str] = ContextVar("negotiated_media_type", default=JSON_MEDIA_TYPE)
+# Whether the endpoint returned sparse models (only their set fields are rendered)
+_sparse_response: ContextVar[bool] = ContextVar("sparse_response", default=False)
+
+def render_sparse() -> None:
+    """Render only the fields set on the returned models (for `fields=` selections)."""
+    _sparse_response.set(True)
+
+def select_fields(fields: Optional[str], allowed: FrozenSet[str]) -> Optional[FrozenSet[str]]:
+    """Validate a `fields=` query parameter and switch the response to sparse rendering."""
+    try:
+        selected = parse_fields(fields, allowed)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    if selected:
+        render_sparse()
+    return selected
+
+def negotiated_media_type() -> str:
+    """Media type of the response being built for the current request."""
+    return _negotiated_media_type.get()
+
+def negotiate(accept: Optional[str]) -> str:
+    """Pick the preferred supported media type from an Accept header (JSON by default)."""
+    if not accept:
+        return JSON_MEDIA_TYPE
+
+    candidates = []
+    for position, part in enumerate(accept.split(",")):
+        media_type, *params = [item.strip() for item in part.split(";")]
+        quality = 1.0
+        for param in params:
+            if param.startswith("q="):
+                try:
+                    quality = float(param[2:])
+                except ValueError:
+                    quality = 0.0
+        supported = _MEDIA_TYPES.get(media_type.lower())
+        if supported and quality > 0:
+            candidates.append((-quality, position, supported))
+
+    return min(candidates)[2] if candidates else JSON_MEDIA_TYPE
+
+@functools.lru_cache(maxsize=None)
+def _list_adapter(model: type) -> TypeAdapter:
+    return TypeAdapter(List[model])
+
+def json_default(value: Any) -> Any:
+    if isinstance(value, ObjectId):
+        return str(value)
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json", by_alias=True)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+def dump_json(content: Any, exclude_unset: bool = False) -> bytes:
+    """
+    Serialize models with pydantic's compiled serializer (datetimes and all, no
+    Python-level hooks) and anything else with orjson.
+    """
+    if isinstance(content, BaseModel):
+        return content.__pydantic_serializer__.to_json(content, by_alias=True, exclude_unset=exclude_unset)
+    if isinstance(content, list) and content and isinstance(content[0], BaseModel):
+        model = type(content[0])
+        if all(type(item) is model for item in content):
+            return _list_adapter(model).dump_json(content, by_alias=True, exclude_unset=exclude_unset)
+    return orjson.dumps(content, default=json_default)
+
+def dump_msgpack(content: Any, exclude_unset: bool = False) -> bytes:
+    """MessagePack encoding of the same document the JSON body would carry."""
+    if isinstance(content, BaseModel):
+        content = content.__pydantic_serializer__.to_python(
+            content, mode="json", by_alias=True, exclude_unset=exclude_unset
+        )
+    elif isinstance(content, list) and content and isinstance(content[0], BaseModel):
+        content = _list_adapter(type(content[0])).dump_python(
+            content, mode="json", by_alias=True, exclude_unset=exclude_unset
+        )
+    # Imported on first use; only clients that ask for msgpack need it
+    import msgpack
+    return msgpack.packb(content, default=json_default)
+
+class ModelJSONResponse(JSONResponse):
+    """JSON response rendered with `dump_json`."""
+    def __init__(self, content: Any, exclude_unset: bool = False, **kwargs):
+        self.exclude_unset = exclude_unset
+        super().__init__(content, **kwargs)
+
+    def render(self, content: Any) -> bytes:
+        with timed("serialize"):
+            return dump_json(content, self.exclude_unset)
+
+class FastModelRoute(APIRoute):
+    """
+    Route that skips FastAPI's response re-validation when the endpoint already
+    returns an instance of its exact response_model (or a list of them).
+
+    The returned model is trusted as-is and rendered in the media type negotiated
+    from the Accept header: JSON (default), protobuf via the generated
+    service_pb2 messages, or MessagePack. Any other return value takes the
+    regular validate-then-serialize JSON path.
+    """
+    def __init__(self, path: str, endpoint, **kwargs):
+        if inspect.iscoroutinefunction(endpoint):
+            endpoint = self._wrap_endpoint(endpoint)
+        super().__init__(path, endpoint, **kwargs)
+
+        self._fast_model = None
+        self._fast_many = False
+        if self._fast_path_allowed():
+            model = self.response_model
+            if get_origin(model) in (list, List) and len(get_args(model)) == 1:
+                model, self._fast_many = get_args(model)[0], True
+            if isinstance(model, type) and issubclass(model, BaseModel):
+                self._fast_model = model
+
+    def _fast_path_allowed(self) -> bool:
+        # Filtering options need FastAPI's own serializer
+        return not (
+            self.response_model_include
+            or self.response_model_exclude
+            or self.response_model_exclude_unset
+            or self.response_model_exclude_defaults
+            or self.response_model_exclude_none
+            or not self.response_model_by_alias
+        )
+
+    def get_route_handler(self):
+        handler = super().get_route_handler()
+
+        async def negotiating_handler(request):
+            token = _negotiated_media_type.set(negotiate(request.headers.get("accept")))
+            sparse_token = _sparse_response.set(False)
+            try:
+                return await handler(request)
+            finally:
+                _sparse_response.reset(sparse_token)
+                _negotiated_media_type.reset(token)
+
+        return negotiating_handler
+
+    def _render(self, result: Any) -> Response:
+        status_code = self.status_code or 200
+        media_type = negotiated_media_type()
+        sparse = _sparse_response.get()
+
+        body = None
+        if media_type == PROTOBUF_MEDIA_TYPE:
+            # Imported lazily so JSON-only processes never load the protobuf stack
+            from app.api.converters import to_proto_bytes
+            with timed("serialize"):
+                body = to_proto_bytes(self._fast_model, self._fast_many, result, partial=sparse)
+        elif media_type == MSGPACK_MEDIA_TYPE:
+            with timed("serialize"):
+                body = dump_msgpack(result, exclude_unset=sparse)
+
+        if body is None:
+            response = ModelJSONResponse(result, exclude_unset=sparse, status_code=status_code)
+        else:
+            response = Response(body, status_code=status_code, media_type=media_type)
+        response.headers["Vary"] = "Accept"
+        return response
+
+    def _matches(self, result: Any) -> bool:
+        model = self._fast_model
+        if model is None:
+            return False
+        if self._fast_many:
+            return isinstance(result, list) and all(type(item) is model for item in result)
+        # Exact type only: a subclass would leak fields the response_model hides
+        return type(result) is model
+
+    def _wrap_endpoint(self, endpoint):
+        route = self
+
+        @functools.wraps(endpoint)
+        async def fast_endpoint(*args, **kwargs):
+            result = await endpoint(*args, **kwargs)
+            if isinstance(result, Response) or not route._matches(result):
+                return result
+
+            response = route._render(result)
+            # Carry over headers/status set on an injected `response: Response`
+            for value in kwargs.values():
+                if type(value) is Response:
+                    response.raw_headers.extend(
+                        header for header in value.raw_headers
+                        if header[0] not in (b"content-length", b"content-type", b"vary")
+                    )
+                    if value.status_code:
+                        response.status_code = value.status_code
+            return response
+
+        return fast_endpoint
@@ -1,17 +1,32 @@
-from fastapi import APIRouter, HTTPException, status, Query, Path, Depends
-from typing import List
+from fastapi import APIRouter, HTTPException, status, Query, Path, Depends, Request, Response
+from fastapi.responses import StreamingResponse
+from datetime import datetime
+from typing import List, Optional
 
-from app.models.models import User, UserCreate, UserUpdate
+from app.models.models import User, UserCreate, UserUpdate, UserProfile, UserPortfolio
 from app.services.user_service import UserServices
+from app.services.portfolio_service import PortfolioService
+from app.core.rate_limit import PASSWORD_CHANGE, REGISTER
+from app.core.response_cache import user_tag
 from app.api.rest.auth import get_current_user
+from app.api.rest.caching import cache_response
+from app.api.rest.conditional import (
+    is_conditional, is_not_modified, make_validators, not_modified, set_validators
+)
+from app.api.rest.export import ndjson_response
+from app.api.rest.rate_limit import enforce_rate_limit
+from app.api.rest.responses import FastModelRoute, ModelJSONResponse, select_fields
+from app.repositories.projection import USER_FIELDS
 
-router = APIRouter()
+router = APIRouter(route_class=FastModelRoute, default_response_class=ModelJSONResponse)
 user_service = UserServices()
+portfolio_service = PortfolioService()
 
 @router.get("/users/", response_model=List[User])
 async def read_users(
     skip: int = Query(0, ge=0), 
     limit: int = Query(100, ge=1, le=100),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return, e.g. username,role"),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -24,51 +39,139 @@ async def read_users(
             detail="Not enough permissions"
         )
         
-    return await user_service.get_users(skip=skip, limit=limit)
+    selected = select_fields(fields, USER_FIELDS)
+    return await user_service.get_users(skip=skip, limit=limit, fields=selected)
+
+@router.get("/users/export", response_class=StreamingResponse)
+async def export_users(
+    request: Request,
+    since: Optional[datetime] = Query(None, description="Only users created or updated at or after this time"),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Export users as newline-delimited JSON, streamed straight from the database.
+    Gzipped when the client sends `Accept-Encoding: gzip`.
+    Only available to admin users.
+    """
+    if current_user.role != "admin":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not enough permissions"
+        )
+        
+    return ndjson_response(request, user_service.export_users(since), "users.ndjson")
+
+def _user_validators(user_id, created_at, updated_at):
+    return make_validators(user_id, updated_at or created_at)
 
 @router.get("/users/{user_id}", response_model=User)
 async def read_user(
+    request: Request,
+    response: Response,
     user_id: str = Path(..., title="The ID of the user to get"),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return, e.g. username,role"),
     current_user: User = Depends(get_current_user)
 ):
     """
     Get a specific user by ID.
     Users can get their own info, admins can get any user.
+    Supports conditional requests (ETag / Last-Modified).
     """
     if current_user.role != "admin" and str(current_user.id) != user_id:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not enough permissions"
         )
+    
+    if is_conditional(request):
+        # Revalidate against a projection before loading the full document
+        validator = await user_service.get_user_validator(user_id)
+        if validator:
+            etag, last_modified = _user_validators(
+                validator["_id"], validator.get("created_at"), validator.get("updated_at")
+            )
+            if is_not_modified(request, etag, last_modified):
+                return not_modified(etag, last_modified)
         
-    user = await user_service.get_user(user_id)
+    selected = select_fields(fields, USER_FIELDS)
+    user = await user_service.get_user(user_id, selected)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"User with ID {user_id} not found"
         )
+    set_validators(response, *_user_validators(user.id, user.created_at, user.updated_at))
     return user
 
 @router.get("/users/username/{username}", response_model=User)
-async def read_user_by_username(username: str):
+async def read_user_by_username(
+    username: str,
+    request: Request,
+    response: Response,
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return, e.g. username,role"),
+):
     """
     Get a specific user by username.
     Public endpoint.
+    Supports conditional requests (ETag / Last-Modified).
     """
-    user = await user_service.get_user_by_username(username)
+    if is_conditional(request):
+        validator = await user_service.get_user_validator_by_username(username)
+        if validator:
+            etag, last_modified = _user_validators(
+                validator["_id"], validator.get("created_at"), validator.get("updated_at")
+            )
+            if is_not_modified(request, etag, last_modified):
+                return not_modified(etag, last_modified)
+    
+    selected = select_fields(fields, USER_FIELDS)
+    user = await user_service.get_user_by_username(username, selected)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"User with username {username} not found"
         )
+    set_validators(response, *_user_validators(user.id, user.created_at, user.updated_at))
+    cache_response(user_tag(user.id))
     return user
 
+@router.get("/users/username/{username}/profile", response_model=UserProfile)
+async def read_user_profile(username: str):
+    """
+    Get a user's public profile with project/image counts and latest project.
+    Public endpoint.
+    """
+    profile = await user_service.get_user_profile(username)
+    if not profile:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"User with username {username} not found"
+        )
+    cache_response(user_tag(profile.id))
+    return profile
+
+@router.get("/users/username/{username}/portfolio", response_model=UserPortfolio)
+async def read_user_portfolio(username: str):
+    """
+    Get a user's portfolio: profile, projects and their images in one call.
+    Public endpoint.
+    """
+    portfolio = await portfolio_service.get_portfolio(username)
+    if not portfolio:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"User with username {username} not found"
+        )
+    cache_response(user_tag(portfolio.id))
+    return portfolio
+
 @router.post("/users/", response_model=User, status_code=status.HTTP_201_CREATED)
-async def create_user(user: UserCreate):
+async def create_user(user: UserCreate, request: Request):
     """
     Create a new user.
-    Public endpoint (registration).
+    Public endpoint (registration), rate limited per client IP.
     """
+    await enforce_rate_limit(REGISTER, request)
     try:
         return await user_service.create_user(user)
     except ValueError as e:
@@ -79,6 +182,7 @@ async def create_user(user: UserCreate):
 
 @router.put("/users/{user_id}", response_model=User)
 async def update_user(
+    request: Request,
     user_id: str = Path(..., title="The ID of the user to update"),
     user: UserUpdate = None,
     current_user: User = Depends(get_current_user)
@@ -86,7 +190,7 @@ async def update_user(
     """
     Update an existing user.
     Users can update their own info, admins can update any user.
-    Only admins can change roles.
+    Only admins can change roles. Password changes are rate limited per caller.
     """
     # Only allow admins to change roles
     if current_user.role != "admin" and user.role is not None:
@@ -102,6 +206,9 @@ async def update_user(
             detail="Not enough permissions"
         )
     
+    if user.password is not None:
+        await enforce_rate_limit(PASSWORD_CHANGE, request, subject=current_user.username)
+    
     try:
         updated_user = await user_service.update_user(user_id, user)
         if not updated_user:
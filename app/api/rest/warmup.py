@@ -0,0 +1,106 @@
+"""
+Startup warm-up, run from the lifespan before the worker starts accepting traffic.
+
+It opens Motor pool connections and replays representative public GETs through
+the full ASGI app, which fills the response and portfolio caches, pulls hot
+documents into MongoDB's working set and exercises every serialization path once.
+"""
+import asyncio
+import time
+from typing import List
+from urllib.parse import quote
+
+from starlette.types import ASGIApp
+
+from app.core.config import settings
+from app.core.db import db
+from app.repositories.projection import PROJECT_FIELDS, USER_FIELDS, parse_fields
+from app.services.project_service import ProjectService
+from app.services.user_service import UserServices
+from app.api.rest.responses import JSON_MEDIA_TYPE
+
+async def _get(app: ASGIApp, path: str) -> int:
+    """Run a GET through the app in-process and return its status code."""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": quote(path).encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"host", b"warmup"), (b"accept", JSON_MEDIA_TYPE.encode())],
+        "server": None,
+        "client": None,
+        "state": {},
+    }
+    status_code = 500
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        nonlocal status_code
+        if message["type"] == "http.response.start":
+            status_code = message["status"]
+
+    await app(scope, receive, send)
+    return status_code
+
+async def warm_pool(connections: int) -> None:
+    """Open up to `connections` pool connections by running that many pings at once."""
+    await asyncio.gather(*(db.client.admin.command("ping") for _ in range(connections)))
+
+async def warm_paths() -> List[str]:
+    """Public GETs for the most recent projects and their owners, plus WARMUP_USERNAMES."""
+    projects = await ProjectService().get_projects(
+        limit=settings.WARMUP_RECENT_PROJECTS, fields=parse_fields("slug,user_id", PROJECT_FIELDS)
+    )
+    usernames = list(settings.WARMUP_USERNAMES)
+    user_service = UserServices()
+    username_fields = parse_fields("username", USER_FIELDS)
+    hot_users = 0
+    for user_id in dict.fromkeys(project.user_id for project in projects):
+        if hot_users >= settings.WARMUP_HOT_USERS:
+            break
+        user = await user_service.get_user(user_id, fields=username_fields)
+        if user and user.username not in usernames:
+            usernames.append(user.username)
+            hot_users += 1
+
+    prefix = f"{settings.API_PREFIX}/v1"
+    paths = [f"{prefix}/projects/"]
+    paths += [f"{prefix}/projects/slug/{project.slug}" for project in projects]
+    for username in usernames:
+        paths += [f"{prefix}/users/username/{username}", f"{prefix}/users/username/{username}/portfolio"]
+    return paths
+
+async def _warm_up(app: ASGIApp) -> None:
+    started_at = time.perf_counter()
+    try:
+        await warm_pool(settings.WARMUP_CONNECTIONS)
+    except Exception as e:
+        print(f"Warm-up: could not open pool connections: {e!r}")
+
+    paths = await warm_paths()
+    failed = 0
+    for path in paths:
+        try:
+            await _get(app, path)
+        except Exception:
+            # The error middleware has already logged it; keep warming the rest
+            failed += 1
+    print(f"Warm-up: {len(paths)} requests ({failed} failed) in {time.perf_counter() - started_at:.2f}s")
+
+async def warm_up(app: ASGIApp) -> None:
+    """Warm this worker, giving up after WARMUP_TIMEOUT; a failed warm-up never blocks startup."""
+    if not settings.WARMUP_ENABLED:
+        return
+    try:
+        await asyncio.wait_for(_warm_up(app), settings.WARMUP_TIMEOUT)
+    except asyncio.TimeoutError:
+        print(f"Warm-up: not finished after {settings.WARMUP_TIMEOUT}s, continuing cold")
+    except Exception as e:
+        print(f"Warm-up failed: {e!r}")
@@ -0,0 +1,24 @@
+"""
+Recompute the denormalized per-user stats (project/image counts, latest project).
+
+Usage:
+    python -m app.commands.reconcile_user_stats
+"""
+import asyncio
+
+from app.core.db import connect_to_mongodb, close_mongodb_connection
+from app.services.user_service import UserServices
+
+async def run():
+    await connect_to_mongodb()
+    try:
+        updated = await UserServices().reconcile_user_stats()
+        print(f"Reconciled stats for {updated} users")
+    finally:
+        await close_mongodb_connection()
+
+def main():
+    asyncio.run(run())
+
+if __name__ == "__main__":
+    main()
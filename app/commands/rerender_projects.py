@@ -0,0 +1,29 @@
+"""
+Re-render stored project bodies after a renderer upgrade.
+
+Usage:
+    python -m app.commands.rerender_projects [--batch-size 100] [--workers N]
+"""
+import argparse
+import asyncio
+
+from app.core.db import connect_to_mongodb, close_mongodb_connection
+from app.services.project_service import ProjectService
+
+async def run(batch_size: int, workers: int):
+    await connect_to_mongodb()
+    try:
+        rendered = await ProjectService().rerender_stale(batch_size=batch_size, workers=workers)
+        print(f"Re-rendered {rendered} projects")
+    finally:
+        await close_mongodb_connection()
+
+def main():
+    parser = argparse.ArgumentParser(description="Re-render stale project bodies")
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+    asyncio.run(run(args.batch_size, args.workers))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""
+Run the REST and gRPC servers in several worker processes.
+
+Each worker is a full copy of the app: uvicorn plus the grpc.aio server on one
+event loop, with its own Motor client. Every worker binds both ports with
+SO_REUSEPORT, so the kernel spreads connections across them. Crashed workers
+are restarted. SIGTERM or SIGINT drains every worker before exiting: the
+supervisor sends each one SIGTERM (workers ignore SIGINT), and it reports
+not-ready for SHUTDOWN_DRAIN_DELAY seconds while still serving, then stops
+accepting and gives in-flight requests SHUTDOWN_GRACE_PERIOD seconds.
+
+Usage:
+    python -m app.commands.serve [--workers N] [--host 0.0.0.0] [--port 8000]
+"""
+import argparse
+import asyncio
+import multiprocessing
+import os
+import signal
+import socket
+import tempfile
+import time
+
+from app.core.config import settings
+
+# A worker that dies sooner than this after starting is crash-looping
+MIN_WORKER_UPTIME = 5.0
+MAX_RESTART_DELAY = 30.0
+
+def _reuseport_socket(host: str, port: int) -> socket.socket:
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    sock.bind((host, port))
+    sock.set_inheritable(True)
+    return sock
+
+def run_worker(host: str, port: int) -> None:
+    """Worker entry point; runs uvicorn, which then runs the app's lifespan shutdown."""
+    import uvicorn
+
+    class DrainingServer(uvicorn.Server):
+        """
+        On SIGTERM, report not-ready and keep serving for the drain delay.
+        SIGINT is ignored: Ctrl-C reaches every process in the terminal's group,
+        and the supervisor follows it with SIGTERM, which a second exit signal
+        here would turn into an immediate exit that skips the drain.
+        """
+        draining = False
+
+        async def serve(self, sockets=None):
+            self.loop = asyncio.get_running_loop()
+            await super().serve(sockets)
+
+        def handle_exit(self, sig, frame):
+            if sig == signal.SIGINT:
+                return
+            if self.draining or not settings.SHUTDOWN_DRAIN_DELAY:
+                # No delay configured, or a second signal: stop now
+                return super().handle_exit(sig, frame)
+            self.draining = True
+            self.loop.call_soon_threadsafe(lambda: self.loop.create_task(self.drain(sig, frame)))
+
+        async def drain(self, sig, frame):
+            from app.core.health import readiness
+
+            await readiness.set(False)
+            await asyncio.sleep(settings.SHUTDOWN_DRAIN_DELAY)
+            super().handle_exit(sig, frame)
+
+    sock = _reuseport_socket(host, port)
+    config = uvicorn.Config("main:app", lifespan="on", timeout_graceful_shutdown=settings.SHUTDOWN_GRACE_PERIOD)
+    DrainingServer(config).run(sockets=[sock])
+
+class Supervisor:
+    def __init__(self, workers: int, host: str, port: int):
+        self.workers = workers
+        self.host = host
+        self.port = port
+        self.processes = {}
+        self.stopping = False
+        self._context = multiprocessing.get_context("spawn")
+        self._restart_delay = 1.0
+
+    def _spawn(self, slot: int) -> None:
+        process = self._context.Process(target=run_worker, args=(self.host, self.port), name=f"worker-{slot}")
+        process.start()
+        self.processes[slot] = (process, time.monotonic())
+        print(f"Started worker {slot} (pid {process.pid})")
+
+    def _reap(self) -> None:
+        """Restart workers that exited, backing off if they keep crashing on start."""
+        from app.core.metrics import mark_process_dead
+
+        for slot, (process, started_at) in list(self.processes.items()):
+            if process.is_alive() or self.stopping:
+                continue
+            mark_process_dead(process.pid)
+            print(f"Worker {slot} (pid {process.pid}) exited with code {process.exitcode}, restarting")
+            if time.monotonic() - started_at < MIN_WORKER_UPTIME:
+                time.sleep(self._restart_delay)
+                self._restart_delay = min(self._restart_delay * 2, MAX_RESTART_DELAY)
+            else:
+                self._restart_delay = 1.0
+            if not self.stopping:
+                self._spawn(slot)
+
+    def _stop(self, signum, frame) -> None:
+        self.stopping = True
+
+    def _drain(self) -> None:
+        """Ask every worker to shut down gracefully and kill the ones that overrun."""
+        from app.core.metrics import mark_process_dead
+
+        for process, _ in self.processes.values():
+            if process.is_alive():
+                process.terminate()
+        # uvicorn and the lifespan may each use the grace period
+        deadline = time.monotonic() + settings.SHUTDOWN_DRAIN_DELAY + 2 * settings.SHUTDOWN_GRACE_PERIOD + 5
+        for process, _ in self.processes.values():
+            process.join(max(deadline - time.monotonic(), 0))
+            if process.is_alive():
+                print(f"Worker pid {process.pid} did not stop in time, killing it")
+                process.kill()
+                process.join()
+            mark_process_dead(process.pid)
+
+    def run(self) -> None:
+        signal.signal(signal.SIGTERM, self._stop)
+        signal.signal(signal.SIGINT, self._stop)
+        for slot in range(self.workers):
+            self._spawn(slot)
+        while not self.stopping:
+            time.sleep(0.5)
+            self._reap()
+        print("Shutting down workers")
+        self._drain()
+
+def main():
+    parser = argparse.ArgumentParser(description="Run REST and gRPC servers in several worker processes")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8000)
+    args = parser.parse_args()
+
+    # Workers must share one metrics directory, set before prometheus_client is imported
+    if settings.METRICS_ENABLED and not os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        os.environ["PROMETHEUS_MULTIPROC_DIR"] = tempfile.mkdtemp(prefix="prometheus-")
+
+    Supervisor(args.workers, args.host, args.port).run()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+"""
+Adaptive admission control shared by the REST middleware and gRPC interceptor.
+
+Each transport has an AdaptiveLimiter whose concurrency limit follows AIMD:
+it grows by about one per limit's worth of healthy completions and shrinks
+multiplicatively when a request takes much longer than its route's baseline,
+a running estimate of the route's 10th percentile latency. Lower priorities
+may only use part of the limit, so they are shed first and cheap public reads
+keep flowing.
+"""
+import re
+import threading
+import time
+from enum import IntEnum
+from typing import Dict, Hashable, List, NamedTuple, Optional, Pattern
+
+from app.core.config import settings
+from app.core.metrics import ADMISSION_LIMIT
+
+class Priority(IntEnum):
+    HIGH = 0
+    NORMAL = 1
+    LOW = 2
+
+# Share of the concurrency limit each priority may occupy
+PRIORITY_SHARES: Dict[Priority, float] = {
+    Priority.HIGH: 1.0,
+    Priority.NORMAL: 0.8,
+    Priority.LOW: 0.5,
+}
+
+# Quantile of successful latencies used as a route's baseline. A low
+# percentile rather than the minimum, so one unusually fast response (say, a
+# login rejected before hashing) cannot pin the baseline near zero
+BASELINE_QUANTILE = 0.1
+# Relative step of the quantile estimate per sample
+BASELINE_STEP = 0.05
+# Samples a route needs before its baseline may move the limit
+BASELINE_WARMUP = 20
+
+class LatencyBaseline:
+    """Streaming estimate of one route's BASELINE_QUANTILE latency."""
+    __slots__ = ("value", "_warmup")
+
+    def __init__(self):
+        self.value: Optional[float] = None
+        self._warmup: List[float] = []
+
+    def observe(self, latency: float) -> Optional[float]:
+        """Add a sample; returns the baseline, or None while still warming up."""
+        if self.value is None:
+            self._warmup.append(latency)
+            if len(self._warmup) < BASELINE_WARMUP:
+                return None
+            samples = sorted(self._warmup)
+            self.value = samples[int(len(samples) * BASELINE_QUANTILE)]
+            self._warmup = []
+            return self.value
+
+        # Stochastic quantile tracking: settles where BASELINE_QUANTILE of samples are below it
+        if latency < self.value:
+            self.value *= 1 - BASELINE_STEP * (1 - BASELINE_QUANTILE)
+        else:
+            self.value *= 1 + BASELINE_STEP * BASELINE_QUANTILE
+        return self.value
+
+class AdaptiveLimiter:
+    """Thread-safe AIMD concurrency limiter."""
+    def __init__(
+        self,
+        name: str,
+        initial_limit: int,
+        min_limit: int,
+        max_limit: int,
+        tolerance: float = 2.0,
+        backoff: float = 0.9,
+        cooldown: float = 0.1
+    ):
+        self.name = name
+        self.limit = float(min(max(initial_limit, min_limit), max_limit))
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.tolerance = tolerance
+        self.backoff = backoff
+        self.cooldown = cooldown
+        self.in_flight = 0
+        self._baselines: Dict[Hashable, LatencyBaseline] = {}
+        self._last_decrease = 0.0
+        self._lock = threading.Lock()
+        ADMISSION_LIMIT.labels(name).set(self.limit)
+
+    def try_acquire(self, priority: Priority = Priority.NORMAL) -> bool:
+        """Take a slot if the priority's share of the limit allows it; never blocks."""
+        with self._lock:
+            allowed = max(1, int(self.limit * PRIORITY_SHARES[priority]))
+            if self.in_flight >= allowed:
+                return False
+            self.in_flight += 1
+            return True
+
+    def release(self, key: Hashable, latency: Optional[float] = None) -> None:
+        """
+        Return a slot; `latency` (None for unsampled requests) adjusts the limit.
+        Only pass latencies of successful requests: fast rejections would drag
+        the baseline down.
+        """
+        with self._lock:
+            was_in_flight = self.in_flight
+            self.in_flight -= 1
+            if latency is None:
+                return
+
+            tracker = self._baselines.get(key)
+            if tracker is None:
+                tracker = self._baselines[key] = LatencyBaseline()
+            # Judge the sample against the baseline from before it
+            baseline = tracker.value
+            tracker.observe(latency)
+            if baseline is None:
+                return
+
+            if latency > baseline * self.tolerance:
+                now = time.monotonic()
+                # One decrease per cooldown, not one per request of the same burst
+                if now - self._last_decrease >= self.cooldown:
+                    self.limit = max(self.min_limit, self.limit * self.backoff)
+                    self._last_decrease = now
+            elif was_in_flight >= self.limit / 2:
+                # Only grow while the limit is actually being exercised
+                self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+            ADMISSION_LIMIT.labels(self.name).set(self.limit)
+
+class RoutePolicy(NamedTuple):
+    method: str
+    pattern: Pattern
+    priority: Priority
+    # Streaming responses say nothing about overload; keep them out of the baselines
+    sampled: bool = True
+
+def _policy(method: str, pattern: str, priority: Priority, sampled: bool = True) -> RoutePolicy:
+    return RoutePolicy(method, re.compile(pattern), priority, sampled)
+
+_API = re.escape(settings.API_PREFIX)
+
+# First match wins; unmatched writes are NORMAL
+REST_POLICIES: List[RoutePolicy] = [
+    _policy("POST", rf"{_API}/token$", Priority.LOW),
+    _policy("POST", rf"{_API}/v1/users/$", Priority.LOW),
+    _policy("GET", rf"{_API}/v1/users/$", Priority.LOW),
+    _policy("GET", rf"{_API}/v1/(users|projects)/export$", Priority.LOW, sampled=False),
+    _policy("GET", rf"{_API}/v1/images/[^/]+/content$", Priority.HIGH, sampled=False),
+    _policy("POST", rf"{_API}/v1/projects/[^/]+/images/upload$", Priority.NORMAL, sampled=False),
+    _policy("GET", r".*", Priority.HIGH),
+]
+
+GRPC_PRIORITIES: Dict[str, Priority] = {
+    "AuthenticateUser": Priority.LOW,
+    "CreateUser": Priority.LOW,
+    "GetUsers": Priority.LOW,
+}
+
+def rest_policy(method: str, path: str) -> RoutePolicy:
+    for policy in REST_POLICIES:
+        if policy.method == method and policy.pattern.match(path):
+            return policy
+    return RoutePolicy(method, None, Priority.NORMAL, True)
+
+def grpc_priority(method: str) -> Priority:
+    if method in GRPC_PRIORITIES:
+        return GRPC_PRIORITIES[method]
+    if method.startswith(("Get", "Download")):
+        return Priority.HIGH
+    return Priority.NORMAL
+
+rest_limiter = AdaptiveLimiter(
+    "rest",
+    initial_limit=settings.ADMISSION_INITIAL_LIMIT,
+    min_limit=settings.ADMISSION_MIN_LIMIT,
+    max_limit=settings.ADMISSION_MAX_LIMIT,
+    tolerance=settings.ADMISSION_LATENCY_TOLERANCE
+)
+
+grpc_limiter = AdaptiveLimiter(
+    "grpc",
+    initial_limit=settings.ADMISSION_INITIAL_LIMIT,
+    min_limit=settings.ADMISSION_MIN_LIMIT,
+    max_limit=settings.ADMISSION_MAX_LIMIT,
+    tolerance=settings.ADMISSION_LATENCY_TOLERANCE
+)
@@ -0,0 +1,199 @@
+"""
+Circuit breakers around MongoDB, per operation class ("users.read", "projects.write", ...).
+
+Each breaker watches the outcomes of its repository calls over a rolling time
+window. Once enough of them fail with a connection error or a timeout, it opens:
+calls fail at once with CircuitOpenError (503 on REST, UNAVAILABLE on gRPC, or a
+stale cached response when there is one) instead of each waiting out server
+selection. After CIRCUIT_BREAKER_OPEN_SECONDS it lets a few trial calls through;
+if they all succeed it closes again, if one fails it reopens.
+"""
+import contextlib
+import functools
+import math
+import threading
+import time
+from collections import deque
+from contextvars import ContextVar
+from enum import IntEnum
+from typing import Deque, Dict, Iterator, Tuple
+
+from pymongo.errors import ConnectionFailure, ExecutionTimeout, PyMongoError, WTimeoutError
+
+from app.core.config import settings
+from app.core.deadline import time_remaining
+from app.core.metrics import CIRCUIT_CALLS, CIRCUIT_STATE
+
+class CircuitState(IntEnum):
+    CLOSED = 0
+    OPEN = 1
+    HALF_OPEN = 2
+
+class CircuitOpenError(Exception):
+    """A repository call was refused because MongoDB is failing for its operation class."""
+    def __init__(self, operation: str, retry_after: float):
+        super().__init__(f"Service temporarily unavailable ({operation}), retry later")
+        self.operation = operation
+        self.retry_after = retry_after
+
+    @property
+    def retry_after_seconds(self) -> int:
+        return max(1, math.ceil(self.retry_after))
+
+def is_outage(error: BaseException) -> bool:
+    """Errors that say MongoDB is unreachable or too slow, as opposed to a rejected operation."""
+    if isinstance(error, (ConnectionFailure, ExecutionTimeout, WTimeoutError)):
+        return True
+    return isinstance(error, PyMongoError) and error.timeout
+
+class CircuitBreaker:
+    """Thread-safe breaker for one operation class."""
+    def __init__(
+        self,
+        name: str,
+        window: float,
+        failure_rate: float,
+        min_calls: int,
+        open_seconds: float,
+        half_open_trials: int
+    ):
+        self.name = name
+        self.window = window
+        self.failure_rate = failure_rate
+        self.min_calls = min_calls
+        self.open_seconds = open_seconds
+        self.half_open_trials = half_open_trials
+        self.state = CircuitState.CLOSED
+        self._outcomes: Deque[Tuple[float, bool]] = deque()
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trials = 0
+        self._trial_successes = 0
+        self._lock = threading.Lock()
+        CIRCUIT_STATE.labels(name).set(self.state)
+
+    def _set_state(self, state: CircuitState) -> None:
+        self.state = state
+        CIRCUIT_STATE.labels(self.name).set(state)
+        if state == CircuitState.OPEN:
+            self._opened_at = time.monotonic()
+        elif state == CircuitState.HALF_OPEN:
+            self._trials = 0
+            self._trial_successes = 0
+        else:
+            self._outcomes.clear()
+            self._failures = 0
+
+    def _prune(self, now: float) -> None:
+        while self._outcomes and self._outcomes[0][0] <= now - self.window:
+            _, failed = self._outcomes.popleft()
+            self._failures -= failed
+
+    def acquire(self) -> None:
+        """Let a call through or raise CircuitOpenError."""
+        with self._lock:
+            if self.state == CircuitState.OPEN:
+                remaining = self._opened_at + self.open_seconds - time.monotonic()
+                if remaining > 0:
+                    CIRCUIT_CALLS.labels(self.name, "rejected").inc()
+                    raise CircuitOpenError(self.name, remaining)
+                self._set_state(CircuitState.HALF_OPEN)
+            if self.state == CircuitState.HALF_OPEN:
+                if self._trials >= self.half_open_trials:
+                    CIRCUIT_CALLS.labels(self.name, "rejected").inc()
+                    raise CircuitOpenError(self.name, self.open_seconds)
+                self._trials += 1
+
+    def record(self, failed: bool, timeout: bool = False) -> None:
+        """Report the outcome of a call that `acquire` let through."""
+        CIRCUIT_CALLS.labels(self.name, ("timeout" if timeout else "error") if failed else "success").inc()
+        with self._lock:
+            if self.state == CircuitState.HALF_OPEN:
+                if failed:
+                    self._set_state(CircuitState.OPEN)
+                else:
+                    self._trial_successes += 1
+                    if self._trial_successes >= self.half_open_trials:
+                        self._set_state(CircuitState.CLOSED)
+                return
+            if self.state == CircuitState.OPEN:
+                return
+
+            now = time.monotonic()
+            self._prune(now)
+            self._outcomes.append((now, failed))
+            self._failures += failed
+            calls = len(self._outcomes)
+            if calls >= self.min_calls and self._failures >= calls * self.failure_rate:
+                self._set_state(CircuitState.OPEN)
+
+    def release(self) -> None:
+        """Give back a trial slot whose call ended without saying anything about MongoDB."""
+        with self._lock:
+            if self.state == CircuitState.HALF_OPEN and self._trials > 0:
+                self._trials -= 1
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+def circuit_breaker(name: str) -> CircuitBreaker:
+    """The process-wide breaker for an operation class, created on first use."""
+    breaker = _breakers.get(name)
+    if breaker is None:
+        with _breakers_lock:
+            breaker = _breakers.get(name)
+            if breaker is None:
+                breaker = _breakers[name] = CircuitBreaker(
+                    name,
+                    window=settings.CIRCUIT_BREAKER_WINDOW,
+                    failure_rate=settings.CIRCUIT_BREAKER_FAILURE_RATE,
+                    min_calls=settings.CIRCUIT_BREAKER_MIN_CALLS,
+                    open_seconds=settings.CIRCUIT_BREAKER_OPEN_SECONDS,
+                    half_open_trials=settings.CIRCUIT_BREAKER_HALF_OPEN_TRIALS
+                )
+    return breaker
+
+# Set while a guarded call runs, so repository methods calling each other count once
+_guarded: ContextVar[bool] = ContextVar("circuit_guarded", default=False)
+
+@contextlib.contextmanager
+def guard(name: str) -> Iterator[None]:
+    """Run one repository operation through the breaker for its operation class."""
+    if _guarded.get() or not settings.CIRCUIT_BREAKER_ENABLED:
+        yield
+        return
+
+    breaker = circuit_breaker(name)
+    breaker.acquire()
+    token = _guarded.set(True)
+    try:
+        yield
+    except PyMongoError as e:
+        remaining = time_remaining()
+        if remaining is not None and remaining <= 0:
+            # Cut short by the caller's own deadline, not by MongoDB
+            breaker.release()
+        elif is_outage(e):
+            breaker.record(failed=True, timeout=e.timeout)
+        else:
+            # MongoDB answered, e.g. a duplicate key
+            breaker.record(failed=False)
+        raise
+    except BaseException:
+        # Validation errors, cancellation, expired deadlines: no verdict on MongoDB
+        breaker.release()
+        raise
+    else:
+        breaker.record(failed=False)
+    finally:
+        _guarded.reset(token)
+
+def guarded(kind: str):
+    """Decorate a repository coroutine method; its breaker is "<collection_name>.<kind>"."""
+    def decorator(method):
+        @functools.wraps(method)
+        async def guarded_method(self, *args, **kwargs):
+            with guard(f"{self.collection_name}.{kind}"):
+                return await method(self, *args, **kwargs)
+        return guarded_method
+    return decorator
@@ -11,12 +11,107 @@ class Settings:
     # MongoDB Settings
     MONGODB_URL: str = os.getenv("MONGODB_URL", "mongodb://localhost:27017")
     MONGODB_DB_NAME: str = os.getenv("MONGODB_DB_NAME", "project_db")
+    GRIDFS_BUCKET_NAME: str = os.getenv("GRIDFS_BUCKET_NAME", "images")
+    MONGODB_MIN_POOL_SIZE: int = int(os.getenv("MONGODB_MIN_POOL_SIZE", "0"))
+    # How long an operation waits for a usable server before failing (the breaker counts these)
+    MONGODB_SERVER_SELECTION_TIMEOUT_MS: int = int(os.getenv("MONGODB_SERVER_SELECTION_TIMEOUT_MS", "30000"))
     
     # gRPC Settings
+    ENABLE_GRPC: bool = os.getenv("ENABLE_GRPC", "True").lower() == "true"
     GRPC_SERVER_ADDRESS: str = os.getenv("GRPC_SERVER_ADDRESS", "[::]:50051")
+    # RPCs beyond this are rejected by gRPC itself before reaching any handler
+    GRPC_MAX_CONCURRENT_RPCS: int = int(os.getenv("GRPC_MAX_CONCURRENT_RPCS", "1000"))
     
     # Security Settings
     SECRET_KEY: str = os.getenv("SECRET_KEY", "testpassword")
     ACCESS_TOKEN_EXPIRE_MINUTES: int = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
+    PBKDF2_WORKERS: int = int(os.getenv("PBKDF2_WORKERS", "0")) or None
+    
+    # Token revocation Settings
+    # Seconds before a token revoked by another worker is refused here too
+    REVOCATION_REFRESH_SECONDS: float = float(os.getenv("REVOCATION_REFRESH_SECONDS", "5"))
+    # Seconds between full reloads, which drop revocations of expired tokens from the filter
+    REVOCATION_REBUILD_SECONDS: float = float(os.getenv("REVOCATION_REBUILD_SECONDS", "3600"))
+    REVOCATION_BLOOM_CAPACITY: int = int(os.getenv("REVOCATION_BLOOM_CAPACITY", "100000"))
+    REVOCATION_BLOOM_ERROR_RATE: float = float(os.getenv("REVOCATION_BLOOM_ERROR_RATE", "0.001"))
+    
+    # Rate limit Settings (budgets per client, e.g. "10/minute")
+    RATE_LIMIT_ENABLED: bool = os.getenv("RATE_LIMIT_ENABLED", "True").lower() == "true"
+    RATE_LIMIT_BACKEND: str = os.getenv("RATE_LIMIT_BACKEND", "memory")
+    RATE_LIMIT_LOGIN: str = os.getenv("RATE_LIMIT_LOGIN", "10/minute")
+    RATE_LIMIT_REGISTER: str = os.getenv("RATE_LIMIT_REGISTER", "20/hour")
+    RATE_LIMIT_PASSWORD_CHANGE: str = os.getenv("RATE_LIMIT_PASSWORD_CHANGE", "10/hour")
+    # Only enable behind a proxy that sets X-Forwarded-For; clients can forge it otherwise
+    RATE_LIMIT_TRUST_FORWARDED: bool = os.getenv("RATE_LIMIT_TRUST_FORWARDED", "False").lower() == "true"
+    
+    # Project rendering Settings
+    PROJECT_EXCERPT_LENGTH: int = int(os.getenv("PROJECT_EXCERPT_LENGTH", "280"))
+    RENDER_WORKERS: int = int(os.getenv("RENDER_WORKERS", "0")) or None
+    
+    # Image storage Settings
+    MAX_IMAGE_UPLOAD_BYTES: int = int(os.getenv("MAX_IMAGE_UPLOAD_BYTES", str(20 * 1024 * 1024)))
+    IMAGE_STREAM_CHUNK_BYTES: int = int(os.getenv("IMAGE_STREAM_CHUNK_BYTES", str(255 * 1024)))
+    IMAGE_CACHE_MAX_AGE: int = int(os.getenv("IMAGE_CACHE_MAX_AGE", "31536000"))
+    
+    # Portfolio Settings
+    PORTFOLIO_MAX_PROJECTS: int = int(os.getenv("PORTFOLIO_MAX_PROJECTS", "100"))
+    PORTFOLIO_CACHE_SIZE: int = int(os.getenv("PORTFOLIO_CACHE_SIZE", "512"))
+    
+    # Response cache Settings (0 disables)
+    RESPONSE_CACHE_TTL: float = float(os.getenv("RESPONSE_CACHE_TTL", "30"))
+    RESPONSE_CACHE_MAX_BYTES: int = int(os.getenv("RESPONSE_CACHE_MAX_BYTES", str(32 * 1024 * 1024)))
+    # Seconds past expiry a cached response may still be served while MongoDB is unavailable
+    RESPONSE_CACHE_STALE_TTL: float = float(os.getenv("RESPONSE_CACHE_STALE_TTL", "300"))
+    GRPC_RESPONSE_CACHE_TTL: float = float(os.getenv("GRPC_RESPONSE_CACHE_TTL", "30"))
+    GRPC_RESPONSE_CACHE_MAX_BYTES: int = int(os.getenv("GRPC_RESPONSE_CACHE_MAX_BYTES", str(16 * 1024 * 1024)))
+    
+    # Batch Settings
+    BATCH_MAX_REQUESTS: int = int(os.getenv("BATCH_MAX_REQUESTS", "20"))
+    BATCH_CONCURRENCY: int = int(os.getenv("BATCH_CONCURRENCY", "8"))
+    
+    # Instrumentation Settings
+    SERVER_TIMING: bool = os.getenv("SERVER_TIMING", "False").lower() == "true"
+    METRICS_ENABLED: bool = os.getenv("METRICS_ENABLED", "True").lower() == "true"
+    EVENT_LOOP_LAG_INTERVAL: float = float(os.getenv("EVENT_LOOP_LAG_INTERVAL", "0.5"))
+    
+    # Shutdown Settings
+    # Seconds to keep serving while reporting not-ready, so load balancers stop routing here first
+    SHUTDOWN_DRAIN_DELAY: float = float(os.getenv("SHUTDOWN_DRAIN_DELAY", "0"))
+    # Seconds in-flight REST requests and gRPC calls get to finish once the worker stops accepting
+    SHUTDOWN_GRACE_PERIOD: float = float(os.getenv("SHUTDOWN_GRACE_PERIOD", "30"))
+    
+    # Warm-up Settings (run at startup, before the worker accepts traffic)
+    WARMUP_ENABLED: bool = os.getenv("WARMUP_ENABLED", "True").lower() == "true"
+    WARMUP_CONNECTIONS: int = int(os.getenv("WARMUP_CONNECTIONS", "10"))
+    WARMUP_RECENT_PROJECTS: int = int(os.getenv("WARMUP_RECENT_PROJECTS", "20"))
+    WARMUP_HOT_USERS: int = int(os.getenv("WARMUP_HOT_USERS", "10"))
+    # Comma separated usernames to always warm, e.g. the site owner's
+    WARMUP_USERNAMES: list = [name.strip() for name in os.getenv("WARMUP_USERNAMES", "").split(",") if name.strip()]
+    WARMUP_TIMEOUT: float = float(os.getenv("WARMUP_TIMEOUT", "30"))
+    
+    # Admission control Settings
+    ADMISSION_ENABLED: bool = os.getenv("ADMISSION_ENABLED", "True").lower() == "true"
+    ADMISSION_INITIAL_LIMIT: int = int(os.getenv("ADMISSION_INITIAL_LIMIT", "50"))
+    ADMISSION_MIN_LIMIT: int = int(os.getenv("ADMISSION_MIN_LIMIT", "4"))
+    ADMISSION_MAX_LIMIT: int = int(os.getenv("ADMISSION_MAX_LIMIT", "500"))
+    ADMISSION_LATENCY_TOLERANCE: float = float(os.getenv("ADMISSION_LATENCY_TOLERANCE", "2.0"))
+    ADMISSION_RETRY_AFTER: int = int(os.getenv("ADMISSION_RETRY_AFTER", "1"))
+    
+    # Deadline Settings
+    DEADLINE_ENABLED: bool = os.getenv("DEADLINE_ENABLED", "True").lower() == "true"
+    # Seconds a REST caller will wait for the response; gRPC uses the call deadline
+    DEADLINE_HEADER: str = os.getenv("DEADLINE_HEADER", "X-Request-Timeout")
+    
+    # Circuit breaker Settings (one breaker per operation class, e.g. "users.read")
+    CIRCUIT_BREAKER_ENABLED: bool = os.getenv("CIRCUIT_BREAKER_ENABLED", "True").lower() == "true"
+    # Seconds of call outcomes the failure rate is computed over
+    CIRCUIT_BREAKER_WINDOW: float = float(os.getenv("CIRCUIT_BREAKER_WINDOW", "30"))
+    CIRCUIT_BREAKER_FAILURE_RATE: float = float(os.getenv("CIRCUIT_BREAKER_FAILURE_RATE", "0.5"))
+    CIRCUIT_BREAKER_MIN_CALLS: int = int(os.getenv("CIRCUIT_BREAKER_MIN_CALLS", "10"))
+    CIRCUIT_BREAKER_OPEN_SECONDS: float = float(os.getenv("CIRCUIT_BREAKER_OPEN_SECONDS", "10"))
+    CIRCUIT_BREAKER_HALF_OPEN_TRIALS: int = int(os.getenv("CIRCUIT_BREAKER_HALF_OPEN_TRIALS", "3"))
+    
+    # Export Settings
+    EXPORT_BATCH_SIZE: int = int(os.getenv("EXPORT_BATCH_SIZE", "1000"))
     
 settings = Settings()
\ No newline at end of file
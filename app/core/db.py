@@ -1,17 +1,34 @@
-from motor.motor_asyncio import AsyncIOMotorClient
+from typing import TYPE_CHECKING
+
 import pymongo
 from .config import settings
+from .metrics import mongo_pool_listeners
+from .timing import mongo_event_listeners
+
+if TYPE_CHECKING:
+    from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorGridFSBucket
 
 class Database:
-    client: AsyncIOMotorClient = None
+    client: "AsyncIOMotorClient" = None
     db = None
+    fs: "AsyncIOMotorGridFSBucket" = None
     
 db = Database()
 
 async def connect_to_mongodb():
     """ Connect to MongoDB """
-    db.client = AsyncIOMotorClient(settings.MONGODB_URL)
+    # Imported here rather than at module level: the lifespan connects before
+    # serving anyway, and importing `main` alone stays cheaper
+    from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorGridFSBucket
+
+    db.client = AsyncIOMotorClient(
+        settings.MONGODB_URL,
+        minPoolSize=settings.MONGODB_MIN_POOL_SIZE,
+        serverSelectionTimeoutMS=settings.MONGODB_SERVER_SELECTION_TIMEOUT_MS,
+        event_listeners=[*mongo_event_listeners(), *mongo_pool_listeners()]
+    )
     db.db = db.client[settings.MONGODB_DB_NAME]
+    db.fs = AsyncIOMotorGridFSBucket(db.db, bucket_name=settings.GRIDFS_BUCKET_NAME)
     
     # Create indexes for optimized lookups
     await create_indexes()
@@ -28,16 +45,30 @@ async def create_indexes():
     # User indexes
     await db.db.users.create_indexes([
         pymongo.IndexModel("username", unique=True),
-        pymongo.IndexModel("email", unique=True)
+        pymongo.IndexModel("email", unique=True),
+        pymongo.IndexModel("updated_at")
     ])
     
     # Project indexes
     await db.db.projects.create_indexes([
         pymongo.IndexModel("slug", unique=True),
-        pymongo.IndexModel("user_id")
+        pymongo.IndexModel("user_id"),
+        pymongo.IndexModel("updated_at")
     ])
     
     # Project image indexes
     await db.db.project_images.create_indexes([
         pymongo.IndexModel("project_id")
-    ])
\ No newline at end of file
+    ])
+    
+    # Revoked tokens are forgotten once they would have expired anyway
+    await db.db.revoked_tokens.create_indexes([
+        pymongo.IndexModel("expires_at", expireAfterSeconds=0),
+        pymongo.IndexModel("revoked_at")
+    ])
+    
+    # Shared rate limit buckets expire once they have refilled
+    if settings.RATE_LIMIT_BACKEND == "mongo":
+        await db.db.rate_limits.create_indexes([
+            pymongo.IndexModel("expires_at", expireAfterSeconds=0)
+        ])
\ No newline at end of file
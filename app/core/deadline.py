@@ -0,0 +1,75 @@
+"""
+Request deadlines, propagated from the caller into MongoDB.
+
+The gRPC interceptor and the ASGI middleware run each request under
+`request_deadline`, which keeps the deadline in a context variable and opens a
+pymongo client-side timeout for the same instant. Every repository query in the
+request then gets the remaining time as `maxTimeMS`, and once it has run out
+pymongo fails operations without sending them. Motor copies the context into
+its executor threads, so this covers every query without touching the
+repositories.
+
+Only timeouts caused by the caller's deadline become DeadlineExceeded; others,
+such as failing to select a server within serverSelectionTimeoutMS while time
+is still left, propagate unchanged.
+"""
+import contextlib
+import time
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+import pymongo
+from pymongo.errors import ExecutionTimeout, PyMongoError
+
+class DeadlineExceeded(Exception):
+    """The caller's deadline passed before the request finished."""
+
+_deadline: ContextVar[Optional[float]] = ContextVar("request_deadline", default=None)
+
+def time_remaining() -> Optional[float]:
+    """Seconds left before the current request's deadline, or None without one."""
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+def check_deadline() -> None:
+    """Raise DeadlineExceeded if the current request's caller has given up."""
+    remaining = time_remaining()
+    if remaining is not None and remaining <= 0:
+        raise DeadlineExceeded("Request deadline exceeded")
+
+def _expired_by_deadline(error: BaseException) -> bool:
+    """True if `error` is a timeout and the current request's deadline has passed."""
+    remaining = time_remaining()
+    if remaining is None or not is_deadline_error(error):
+        return False
+    # maxTimeMS is only ever set from the deadline, but the server gives up a
+    # round trip early, so it counts even with a little time left
+    return remaining <= 0 or isinstance(error, ExecutionTimeout)
+
+@contextlib.contextmanager
+def request_deadline(timeout: Optional[float]) -> Iterator[None]:
+    """
+    Run a request that must finish within `timeout` seconds (None: no deadline
+    of its own, though an enclosing request's still applies). Timeouts caused
+    by the deadline are raised as DeadlineExceeded.
+    """
+    if timeout is not None and timeout <= 0:
+        raise DeadlineExceeded("Request deadline exceeded")
+
+    token = None if timeout is None else _deadline.set(time.monotonic() + timeout)
+    try:
+        with pymongo.timeout(timeout) if timeout is not None else contextlib.nullcontext():
+            yield
+    except Exception as e:
+        if not isinstance(e, DeadlineExceeded) and _expired_by_deadline(e):
+            raise DeadlineExceeded("Request deadline exceeded") from e
+        raise
+    finally:
+        if token is not None:
+            _deadline.reset(token)
+
+def is_deadline_error(error: BaseException) -> bool:
+    """True for DeadlineExceeded and for MongoDB operations cut short by the deadline."""
+    return isinstance(error, DeadlineExceeded) or (isinstance(error, PyMongoError) and error.timeout)
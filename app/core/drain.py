@@ -0,0 +1,24 @@
+import asyncio
+import time
+
+class InFlightRequests:
+    """Number of requests this process is handling, so shutdown can wait for them."""
+    def __init__(self):
+        self.count = 0
+
+    def enter(self) -> None:
+        self.count += 1
+
+    def exit(self) -> None:
+        self.count -= 1
+
+    async def wait_idle(self, timeout: float, interval: float = 0.05) -> bool:
+        """Wait until no request is in flight; False if `timeout` seconds passed first."""
+        deadline = time.monotonic() + timeout
+        while self.count > 0:
+            if time.monotonic() >= deadline:
+                return False
+            await asyncio.sleep(interval)
+        return True
+
+in_flight = InFlightRequests()
@@ -0,0 +1,21 @@
+from typing import Awaitable, Callable, List
+
+class Readiness:
+    """
+    Whether this process should receive traffic. Listeners (e.g. the gRPC health
+    service) are told the current state when added and on every change.
+    """
+    def __init__(self):
+        self.ready = False
+        self._listeners: List[Callable[[bool], Awaitable[None]]] = []
+
+    async def add_listener(self, listener: Callable[[bool], Awaitable[None]]) -> None:
+        self._listeners.append(listener)
+        await listener(self.ready)
+
+    async def set(self, ready: bool) -> None:
+        self.ready = ready
+        for listener in self._listeners:
+            await listener(ready)
+
+readiness = Readiness()
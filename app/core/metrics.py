@@ -0,0 +1,130 @@
+"""
+Prometheus metrics for both transports, Motor's connection pool, the event
+loop and the password hashing executor.
+
+With several workers, point PROMETHEUS_MULTIPROC_DIR at an empty directory
+shared by all of them (before the app starts); each worker then records into
+its own files and /metrics aggregates them.
+"""
+import asyncio
+import os
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Counter, Gauge, Histogram, generate_latest, multiprocess
+)
+from pymongo import monitoring
+
+from app.core.config import settings
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+LAG_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+
+HTTP_REQUESTS = Counter(
+    "http_requests_total", "HTTP requests handled", ["method", "route", "status"]
+)
+HTTP_LATENCY = Histogram(
+    "http_request_duration_seconds", "HTTP request latency", ["method", "route"], buckets=LATENCY_BUCKETS
+)
+GRPC_REQUESTS = Counter(
+    "grpc_server_handled_total", "gRPC calls handled", ["grpc_service", "grpc_method", "grpc_code"]
+)
+GRPC_LATENCY = Histogram(
+    "grpc_server_handling_seconds", "gRPC call latency", ["grpc_service", "grpc_method"], buckets=LATENCY_BUCKETS
+)
+MONGO_CONNECTIONS_OPEN = Gauge(
+    "mongo_pool_connections_open", "Open connections in Motor's pool", multiprocess_mode="livesum"
+)
+MONGO_CONNECTIONS_IN_USE = Gauge(
+    "mongo_pool_connections_in_use", "Pool connections checked out", multiprocess_mode="livesum"
+)
+MONGO_CHECKOUT_WAIT = Histogram(
+    "mongo_pool_checkout_wait_seconds", "Time spent waiting for a pool connection", buckets=LATENCY_BUCKETS
+)
+EVENT_LOOP_LAG = Histogram(
+    "event_loop_lag_seconds", "Delay of event loop wake-ups past their deadline", buckets=LAG_BUCKETS
+)
+ADMISSION_LIMIT = Gauge(
+    "admission_concurrency_limit", "Current adaptive concurrency limit", ["transport"], multiprocess_mode="livesum"
+)
+ADMISSION_REJECTED = Counter(
+    "admission_rejected_total", "Requests shed by admission control", ["transport", "priority"]
+)
+CIRCUIT_STATE = Gauge(
+    "circuit_breaker_state", "Breaker state per operation class: 0 closed, 1 open, 2 half-open",
+    ["operation"], multiprocess_mode="livemax"
+)
+CIRCUIT_CALLS = Counter(
+    "circuit_breaker_calls_total", "Guarded MongoDB operations by outcome", ["operation", "outcome"]
+)
+STALE_RESPONSES = Counter(
+    "stale_responses_total", "Expired cached responses served while MongoDB was unavailable", ["transport"]
+)
+REVOCATION_CHECKS = Counter(
+    "token_revocation_checks_total",
+    "Access token revocation checks: pass (Bloom filter miss, no I/O), revoked, or false_positive",
+    ["result"]
+)
+PBKDF2_QUEUE_DEPTH = Gauge(
+    "pbkdf2_queue_depth", "Password hashes waiting for an executor thread", multiprocess_mode="livesum"
+)
+
+def render_metrics() -> tuple:
+    """Exposition body and content type, aggregated over workers in multiprocess mode."""
+    registry = REGISTRY
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+def mark_process_dead(pid: int = None) -> None:
+    """Drop a worker's live gauges (this process by default) from the aggregate when it exits."""
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        multiprocess.mark_process_dead(pid or os.getpid())
+
+async def monitor_event_loop_lag(interval: float = None) -> None:
+    """Sample how late the loop wakes a sleeping task; run as a background task."""
+    interval = interval or settings.EVENT_LOOP_LAG_INTERVAL
+    loop = asyncio.get_running_loop()
+    while True:
+        scheduled = loop.time() + interval
+        await asyncio.sleep(interval)
+        EVENT_LOOP_LAG.observe(max(loop.time() - scheduled, 0.0))
+
+class MongoPoolMetricsListener(monitoring.ConnectionPoolListener):
+    """Tracks open/checked-out connections and checkout waits of the Motor pool."""
+    def pool_created(self, event):
+        pass
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        pass
+
+    def pool_closed(self, event):
+        pass
+
+    def connection_created(self, event):
+        MONGO_CONNECTIONS_OPEN.inc()
+
+    def connection_ready(self, event):
+        pass
+
+    def connection_closed(self, event):
+        MONGO_CONNECTIONS_OPEN.dec()
+
+    def connection_check_out_started(self, event):
+        pass
+
+    def connection_check_out_failed(self, event):
+        MONGO_CHECKOUT_WAIT.observe(event.duration)
+
+    def connection_checked_out(self, event):
+        MONGO_CONNECTIONS_IN_USE.inc()
+        MONGO_CHECKOUT_WAIT.observe(event.duration)
+
+    def connection_checked_in(self, event):
+        MONGO_CONNECTIONS_IN_USE.dec()
+
+def mongo_pool_listeners() -> list:
+    return [MongoPoolMetricsListener()] if settings.METRICS_ENABLED else []
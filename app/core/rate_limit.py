@@ -0,0 +1,158 @@
+"""
+Per-client token-bucket rate limiting for the expensive authentication routes.
+
+Each rule has a budget such as "10/minute": a bucket holds up to 10 tokens and
+refills at 10 per minute. A request takes one token from the bucket of every
+identity it is checked against (client IP, username, token subject) and is
+rejected when any of them is empty. Buckets live in process memory by default;
+RATE_LIMIT_BACKEND=mongo keeps them in a TTL collection shared by all workers.
+"""
+import math
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import NamedTuple, Optional
+
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
+
+from app.core.config import settings
+from app.core.db import db
+
+_PERIODS = {"second": 1, "minute": 60, "hour": 3600, "day": 86400}
+
+class Rate(NamedTuple):
+    capacity: float
+    per_second: float
+
+def parse_rate(value: str) -> Rate:
+    """Parse a budget like "10/minute" into a bucket capacity and refill rate."""
+    try:
+        count, period = value.split("/")
+        count = float(count)
+        seconds = _PERIODS[period.strip().lower().rstrip("s")]
+    except (KeyError, ValueError):
+        raise ValueError(f"Invalid rate limit: {value!r} (expected e.g. '10/minute')")
+    return Rate(count, count / seconds)
+
+class RateLimitRule(NamedTuple):
+    name: str
+    rate: Rate
+
+LOGIN = RateLimitRule("login", parse_rate(settings.RATE_LIMIT_LOGIN))
+REGISTER = RateLimitRule("register", parse_rate(settings.RATE_LIMIT_REGISTER))
+PASSWORD_CHANGE = RateLimitRule("password_change", parse_rate(settings.RATE_LIMIT_PASSWORD_CHANGE))
+
+class RateLimitExceeded(Exception):
+    def __init__(self, rule: RateLimitRule, retry_after: float):
+        self.rule = rule
+        self.retry_after = retry_after
+        super().__init__(f"Too many requests, retry in {self.retry_after_seconds} seconds")
+
+    @property
+    def retry_after_seconds(self) -> int:
+        return max(1, math.ceil(self.retry_after))
+
+class MemoryRateLimitBackend:
+    """Buckets in process memory, least recently used ones dropped beyond max_keys."""
+    def __init__(self, max_keys: int = 100_000):
+        self.max_keys = max_keys
+        self._buckets: "OrderedDict[str, list]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    async def consume(self, key: str, rate: Rate, cost: float = 1.0) -> float:
+        """Take `cost` tokens; returns 0 when allowed, else the seconds until they would be."""
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = [rate.capacity, now]
+                while len(self._buckets) > self.max_keys:
+                    self._buckets.popitem(last=False)
+            else:
+                self._buckets.move_to_end(key)
+                bucket[0] = min(rate.capacity, bucket[0] + (now - bucket[1]) * rate.per_second)
+                bucket[1] = now
+
+            if bucket[0] >= cost:
+                bucket[0] -= cost
+                return 0.0
+            return (cost - bucket[0]) / rate.per_second
+
+    def clear(self) -> None:
+        with self._lock:
+            self._buckets.clear()
+
+class MongoRateLimitBackend:
+    """
+    Buckets in a Mongo collection, so every worker shares them. Each check is a
+    single atomic findOneAndUpdate; documents expire once their bucket is full again.
+    """
+    collection_name = "rate_limits"
+
+    @property
+    def collection(self):
+        return db.db[self.collection_name]
+
+    async def consume(self, key: str, rate: Rate, cost: float = 1.0) -> float:
+        now = datetime.now(timezone.utc)
+        refilled = {"$min": [
+            rate.capacity,
+            {"$add": [
+                {"$ifNull": ["$tokens", rate.capacity]},
+                {"$multiply": [
+                    {"$divide": [{"$subtract": [now, {"$ifNull": ["$updated_at", now]}]}, 1000]},
+                    rate.per_second
+                ]}
+            ]}
+        ]}
+        update = [
+            {"$set": {"tokens": refilled, "updated_at": now}},
+            {"$set": {"allowed": {"$gte": ["$tokens", cost]}}},
+            {"$set": {
+                "tokens": {"$cond": ["$allowed", {"$subtract": ["$tokens", cost]}, "$tokens"]},
+                "expires_at": now + timedelta(seconds=rate.capacity / rate.per_second)
+            }},
+        ]
+        try:
+            doc = await self.collection.find_one_and_update(
+                {"_id": key}, update, upsert=True, return_document=ReturnDocument.AFTER
+            )
+        except DuplicateKeyError:
+            # Two first requests for a key raced to insert its bucket; the
+            # loser retries once and now finds the document to update
+            doc = await self.collection.find_one_and_update(
+                {"_id": key}, update, upsert=True, return_document=ReturnDocument.AFTER
+            )
+        if doc["allowed"]:
+            return 0.0
+        return (cost - doc["tokens"]) / rate.per_second
+
+class RateLimiter:
+    def __init__(self, backend):
+        self.backend = backend
+
+    async def check(self, rule: RateLimitRule, **identities: Optional[str]) -> None:
+        """
+        Take a token for each identity, e.g. `ip=..., username=...` (empty ones are
+        skipped); raise RateLimitExceeded if any bucket is out of tokens.
+        """
+        if not settings.RATE_LIMIT_ENABLED:
+            return
+        retry_after = 0.0
+        for kind, identity in identities.items():
+            if identity:
+                key = f"{rule.name}:{kind}:{identity}"
+                retry_after = max(retry_after, await self.backend.consume(key, rule.rate))
+        if retry_after:
+            raise RateLimitExceeded(rule, retry_after)
+
+def _create_backend():
+    if settings.RATE_LIMIT_BACKEND == "mongo":
+        return MongoRateLimitBackend()
+    if settings.RATE_LIMIT_BACKEND == "memory":
+        return MemoryRateLimitBackend()
+    raise ValueError(f"Unknown RATE_LIMIT_BACKEND: {settings.RATE_LIMIT_BACKEND}")
+
+rate_limiter = RateLimiter(_create_backend())
@@ -0,0 +1,177 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+from app.core.config import settings
+
+# Tag shared by every cached project listing
+PROJECTS_TAG = "projects"
+
+def user_tag(user_id) -> str:
+    return f"user:{user_id}"
+
+def project_tag(project_id) -> str:
+    return f"project:{project_id}"
+
+def image_tag(image_id) -> str:
+    return f"image:{image_id}"
+
+@dataclass
+class CachedResponse:
+    status: int
+    headers: List[Tuple[bytes, bytes]]
+    body: bytes
+    tags: Tuple[str, ...]
+    expires_at: float
+    size: int
+    # Routing keys ("route", "path_params") of the request that produced the entry
+    route_scope: Optional[Dict[str, Any]] = None
+
+class ResponseCache:
+    """
+    Thread-safe store of fully serialized responses, bounded by total bytes with
+    LRU eviction. Every entry carries tags; purging a tag drops all its entries.
+
+    All state sits behind one lock, so any thread may read or purge. A purge
+    sequence number lets readers that started before a purge refuse to store
+    what they loaded, so an in-flight read never resurrects stale data.
+
+    Expired entries are kept for `stale_ttl` more seconds (unless evicted or
+    purged) so they can stand in while MongoDB is unavailable.
+    """
+    def __init__(self, max_bytes: int, ttl: float, stale_ttl: float = 0):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self._entries: "OrderedDict[Hashable, CachedResponse]" = OrderedDict()
+        self._tags: Dict[str, Set[Hashable]] = {}
+        self._size = 0
+        self._purge_sequence = 0
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0 and self.ttl > 0
+
+    @property
+    def sequence(self) -> int:
+        return self._purge_sequence
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def max_entry_bytes(self) -> int:
+        # Keep one large response from flushing the whole cache
+        return self.max_bytes // 16
+
+    def get(self, key: Hashable, stale: bool = False) -> Optional[CachedResponse]:
+        """The live entry for a key; with `stale`, also one that expired less than stale_ttl ago."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            now = time.monotonic()
+            if entry.expires_at <= now:
+                if entry.expires_at + self.stale_ttl <= now:
+                    self._remove(key)
+                    return None
+                if not stale:
+                    return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def set(
+        self,
+        key: Hashable,
+        status: int,
+        headers: List[Tuple[bytes, bytes]],
+        body: bytes,
+        tags: Iterable[str],
+        ttl: Optional[float] = None,
+        sequence: Optional[int] = None,
+        route_scope: Optional[Dict[str, Any]] = None
+    ) -> bool:
+        size = len(body) + sum(len(name) + len(value) for name, value in headers)
+        if not self.enabled or size > self.max_entry_bytes:
+            return False
+
+        entry = CachedResponse(
+            status=status,
+            headers=headers,
+            body=body,
+            tags=tuple(tags),
+            expires_at=time.monotonic() + (ttl or self.ttl),
+            size=size,
+            route_scope=route_scope
+        )
+        with self._lock:
+            if sequence is not None and sequence != self._purge_sequence:
+                return False
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = entry
+            self._size += size
+            for tag in entry.tags:
+                self._tags.setdefault(tag, set()).add(key)
+            while self._size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+        return True
+
+    def purge_tags(self, *tags: str) -> int:
+        """Drop every entry carrying any of the tags; returns how many were dropped."""
+        with self._lock:
+            self._purge_sequence += 1
+            keys = set()
+            for tag in tags:
+                keys.update(self._tags.get(tag, ()))
+            for key in keys:
+                self._remove(key)
+            return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._purge_sequence += 1
+            self._entries.clear()
+            self._tags.clear()
+            self._size = 0
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._entries.pop(key)
+        self._size -= entry.size
+        for tag in entry.tags:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+# Process-wide cache in front of the public REST reads
+response_cache = ResponseCache(
+    max_bytes=settings.RESPONSE_CACHE_MAX_BYTES,
+    ttl=settings.RESPONSE_CACHE_TTL,
+    stale_ttl=settings.RESPONSE_CACHE_STALE_TTL
+)
+
+# Same for the idempotent gRPC reads; entries are serialized messages
+grpc_response_cache = ResponseCache(
+    max_bytes=settings.GRPC_RESPONSE_CACHE_MAX_BYTES,
+    ttl=settings.GRPC_RESPONSE_CACHE_TTL,
+    stale_ttl=settings.RESPONSE_CACHE_STALE_TTL
+)
+
+def purge_tags(*tags: str) -> None:
+    """Invalidate cached responses after a write; called by the service layer."""
+    response_cache.purge_tags(*tags)
+    grpc_response_cache.purge_tags(*tags)
+
+def clear_caches() -> None:
+    """Drop every cached response, for writes that touch too much to tag."""
+    response_cache.clear()
+    grpc_response_cache.clear()
@@ -0,0 +1,137 @@
+"""
+Revoked access tokens, checked without touching MongoDB on the common path.
+
+Revocations are stored in the `revoked_tokens` collection, keyed by the
+token's `jti` and dropped by a TTL index once the token would have expired
+anyway. Every process keeps a Bloom filter of the revoked IDs, topped up every
+REVOCATION_REFRESH_SECONDS with the revocations made since its last refresh.
+A token the filter has never seen is not revoked, so almost every request
+passes with no I/O; only filter hits are confirmed against MongoDB. Revocations
+made by another worker take effect here after at most one refresh interval.
+"""
+import asyncio
+import hashlib
+import math
+import time
+from datetime import datetime, timedelta
+from typing import Optional
+
+from pymongo.errors import DuplicateKeyError
+
+from app.core.circuit_breaker import guard
+from app.core.config import settings
+from app.core.db import db
+from app.core.metrics import REVOCATION_CHECKS
+
+COLLECTION_NAME = "revoked_tokens"
+
+# Re-read revocations this far behind the newest one seen, in case workers'
+# clocks or commit order disagree; adding an ID twice is harmless
+_REFRESH_OVERLAP = timedelta(seconds=5)
+
+class BloomFilter:
+    """Set membership with no false negatives and about `error_rate` false positives up to `capacity` items."""
+    def __init__(self, capacity: int, error_rate: float):
+        self.capacity = capacity
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item: str):
+        # Double hashing: k positions from the two halves of one digest
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        return ((first + i * second) % self.size for i in range(self.hashes))
+
+    def add(self, item: str) -> None:
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+class RevocationList:
+    """This process's view of the revoked tokens."""
+    def __init__(self, capacity: int, error_rate: float):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self._filter = BloomFilter(capacity, error_rate)
+        self._newest: Optional[datetime] = None
+        self._built_at = 0.0
+        self._refresh_lock = asyncio.Lock()
+
+    @property
+    def collection(self):
+        return db.db[COLLECTION_NAME]
+
+    async def _load(self, since: Optional[datetime]) -> list:
+        query = {} if since is None else {"revoked_at": {"$gte": since - _REFRESH_OVERLAP}}
+        cursor = self.collection.find(query, {"_id": 1, "revoked_at": 1}).sort("revoked_at", 1)
+        return await cursor.to_list(length=None)
+
+    async def refresh(self) -> None:
+        """Add revocations made since the last refresh; rebuild the filter when it has aged or filled up."""
+        async with self._refresh_lock:
+            rebuild = (
+                not self._built_at
+                or self._filter.count > self.capacity
+                or time.monotonic() - self._built_at > settings.REVOCATION_REBUILD_SECONDS
+            )
+            documents = await self._load(None if rebuild else self._newest)
+            if rebuild:
+                # A fresh filter forgets tokens the TTL index has since dropped
+                bloom = BloomFilter(max(self.capacity, 2 * len(documents)), self.error_rate)
+                self._built_at = time.monotonic()
+            else:
+                bloom = self._filter
+            for document in documents:
+                if document["_id"] not in bloom:
+                    bloom.add(document["_id"])
+            if documents:
+                self._newest = documents[-1]["revoked_at"]
+            self._filter = bloom
+
+    async def run_refresher(self, interval: float = None) -> None:
+        """Keep the filter up to date; run as a background task."""
+        interval = interval or settings.REVOCATION_REFRESH_SECONDS
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.refresh()
+            except Exception as e:
+                # Keep serving from the filter we have and try again next time
+                print(f"Token revocation refresh failed: {e}")
+
+    async def is_revoked(self, jti: str) -> bool:
+        if jti not in self._filter:
+            REVOCATION_CHECKS.labels("pass").inc()
+            return False
+        with guard(f"{COLLECTION_NAME}.read"):
+            revoked = await self.collection.find_one({"_id": jti}, {"_id": 1}) is not None
+        REVOCATION_CHECKS.labels("revoked" if revoked else "false_positive").inc()
+        return revoked
+
+    async def revoke(self, jti: str, expires_at: datetime, username: str) -> None:
+        """Revoke a token until `expires_at`, when it would have stopped working anyway. Idempotent."""
+        now = datetime.utcnow()
+        with guard(f"{COLLECTION_NAME}.write"):
+            try:
+                await self.collection.insert_one({
+                    "_id": jti,
+                    "username": username,
+                    "revoked_at": now,
+                    "expires_at": expires_at
+                })
+            except DuplicateKeyError:
+                pass
+        # Effective at once in this process; other workers pick it up on refresh
+        if jti not in self._filter:
+            self._filter.add(jti)
+
+revocation_list = RevocationList(
+    capacity=settings.REVOCATION_BLOOM_CAPACITY,
+    error_rate=settings.REVOCATION_BLOOM_ERROR_RATE
+)
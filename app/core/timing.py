@@ -0,0 +1,100 @@
+"""
+Per-request phase timings (JWT, PBKDF2, Mongo, serialization), reported as a
+Server-Timing header on REST and as trailing metadata on gRPC.
+
+Instrumented code calls `timed(name)`. Outside a timed request that is a single
+context variable lookup returning a shared no-op context manager.
+"""
+import contextlib
+import threading
+import time
+from contextvars import ContextVar, Token
+from typing import Dict, List, Optional
+
+from pymongo import monitoring
+
+from app.core.config import settings
+
+SERVER_TIMING_HEADER = "server-timing"
+
+class RequestTimings:
+    """Accumulated duration and count per phase for one request."""
+    __slots__ = ("started_at", "_phases", "_lock")
+
+    def __init__(self):
+        self.started_at = time.perf_counter()
+        self._phases: Dict[str, List[float]] = {}
+        # Motor runs commands on executor threads, possibly several at once
+        self._lock = threading.Lock()
+
+    def add(self, name: str, seconds: float) -> None:
+        with self._lock:
+            phase = self._phases.get(name)
+            if phase is None:
+                self._phases[name] = [seconds, 1]
+            else:
+                phase[0] += seconds
+                phase[1] += 1
+
+    def header_value(self) -> str:
+        parts = []
+        with self._lock:
+            for name, (seconds, count) in self._phases.items():
+                part = f"{name};dur={seconds * 1000:.2f}"
+                if count > 1:
+                    part += f';desc="{count} calls"'
+                parts.append(part)
+        parts.append(f"total;dur={(time.perf_counter() - self.started_at) * 1000:.2f}")
+        return ", ".join(parts)
+
+_request_timings: ContextVar[Optional[RequestTimings]] = ContextVar("request_timings", default=None)
+
+class _Timer:
+    __slots__ = ("timings", "name", "started_at")
+
+    def __init__(self, timings: RequestTimings, name: str):
+        self.timings = timings
+        self.name = name
+
+    def __enter__(self):
+        self.started_at = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.timings.add(self.name, time.perf_counter() - self.started_at)
+        return False
+
+_NOT_TIMED = contextlib.nullcontext()
+
+def timed(name: str):
+    """Context manager recording the enclosed block under `name` for the current request."""
+    timings = _request_timings.get()
+    if timings is None:
+        return _NOT_TIMED
+    return _Timer(timings, name)
+
+def start_request() -> Token:
+    """Begin collecting timings in the current context; pass the token to `end_request`."""
+    return _request_timings.set(RequestTimings())
+
+def end_request(token: Token) -> None:
+    _request_timings.reset(token)
+
+def current_timings() -> Optional[RequestTimings]:
+    return _request_timings.get()
+
+class MongoTimingListener(monitoring.CommandListener):
+    """Adds the server round trip of every Mongo command to the request's timings."""
+    def started(self, event):
+        pass
+
+    def succeeded(self, event):
+        timings = _request_timings.get()
+        if timings is not None:
+            timings.add("mongo", event.duration_micros / 1_000_000)
+
+    def failed(self, event):
+        self.succeeded(event)
+
+def mongo_event_listeners() -> list:
+    return [MongoTimingListener()] if settings.SERVER_TIMING else []
@@ -1,5 +1,6 @@
-from pydantic import BaseModel, Field, EmailStr, field_serializer
-from typing import Optional, List
+from pydantic import BaseModel, Field, EmailStr
+from typing import Any, Callable, ClassVar, Dict, Literal, NamedTuple, Optional, List, Union, get_args, get_origin
+import copy
 from datetime import datetime
 from bson import ObjectId
 
@@ -8,7 +9,11 @@ class PyObjectId(str):
     @classmethod
     def __get_pydantic_core_schema__(cls, source_type, handler):
         from pydantic_core import core_schema
-        return core_schema.with_info_plain_validator_function(cls.validate)
+        return core_schema.with_info_plain_validator_function(
+            cls.validate,
+            # Serialize as a plain string instead of inferring the type per value
+            serialization=core_schema.to_string_ser_schema()
+        )
 
     @classmethod
     def validate(cls, v, info):
@@ -22,8 +27,91 @@ class PyObjectId(str):
     def __get_pydantic_json_schema__(cls, field_schema, handler):
         return {"type": "string"}  # Ensure JSON schema reflects string type
 
+def _document_converter(annotation) -> Optional[Callable]:
+    """How to turn a stored value into the field's Python value, or None to keep it as is."""
+    origin = get_origin(annotation)
+    if origin is Union:
+        # Optional[X]: None is passed through by the caller
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        return _document_converter(args[0]) if len(args) == 1 else None
+    if origin is list:
+        item = _document_converter(get_args(annotation)[0])
+        return (lambda values: [item(value) for value in values]) if item else None
+    if annotation is PyObjectId:
+        return str
+    if isinstance(annotation, type) and issubclass(annotation, DocumentModel):
+        return annotation.from_document
+    return None
+
+class _DocumentField(NamedTuple):
+    name: str
+    key: str  # as stored, i.e. the alias if there is one
+    convert: Optional[Callable]
+    default: Optional[Callable]  # None when the field is required
+
+def _document_default(field) -> Optional[Callable]:
+    if field.default_factory is not None:
+        return field.default_factory
+    if field.is_required():
+        return None
+    default = field.default
+    # Mutable defaults ([] for images and projects) must not be shared
+    return (lambda: copy.copy(default)) if isinstance(default, (list, dict, set)) else (lambda: default)
+
+_document_fields: Dict[type, List[_DocumentField]] = {}
+
+class DocumentModel(BaseModel):
+    """Base for models that are read back from MongoDB."""
+    # Set where pydantic-core validation is already cheaper than building the
+    # model in Python (no EmailStr), so from_document simply validates
+    validate_documents: ClassVar[bool] = False
+
+    @classmethod
+    def from_document(cls, document: dict):
+        """Build the model from a trusted stored document the cheapest way that stays correct."""
+        if cls.validate_documents:
+            return cls.model_validate(document)
+        return cls.construct_document(document)
+
+    @classmethod
+    def construct_document(cls, document: dict):
+        """
+        Build the model from a trusted stored document without validating it.
+        ObjectIds become strings and nested documents become models, so the
+        result compares and serializes like a validated one; keys that are
+        not fields (e.g. password_hash) are dropped. Works like
+        `model_construct`, minus the per-call field introspection.
+        """
+        fields = _document_fields.get(cls)
+        if fields is None:
+            fields = _document_fields[cls] = [
+                _DocumentField(name, field.alias or name, _document_converter(field.annotation), _document_default(field))
+                for name, field in cls.model_fields.items()
+            ]
+
+        values = {}
+        fields_set = set()
+        for name, key, convert, default in fields:
+            if key in document:
+                value = document[key]
+            elif name in document:
+                value = document[name]
+            else:
+                if default is not None:
+                    values[name] = default()
+                continue
+            values[name] = convert(value) if convert is not None and value is not None else value
+            fields_set.add(name)
+
+        model = cls.__new__(cls)
+        object.__setattr__(model, "__dict__", values)
+        object.__setattr__(model, "__pydantic_fields_set__", fields_set)
+        object.__setattr__(model, "__pydantic_extra__", None)
+        object.__setattr__(model, "__pydantic_private__", None)
+        return model
+
 # User Models
-class UserBase(BaseModel):
+class UserBase(DocumentModel):
     username: str
     email: EmailStr
     role: str = "user"
@@ -41,6 +129,7 @@ class UserInDB(UserBase):
     id: PyObjectId = Field(default_factory=lambda: str(ObjectId()), alias="_id")
     password_hash: str
     created_at: datetime = Field(default_factory=datetime.utcnow)
+    updated_at: Optional[datetime] = None
 
     model_config = {
         "populate_by_name": True,
@@ -59,13 +148,10 @@ class UserInDB(UserBase):
         }
     }
 
-    @field_serializer('created_at')
-    def serialize_dt(self, dt: datetime, _info):
-        return dt.isoformat()
-
 class User(UserBase):
     id: PyObjectId = Field(alias="_id")
     created_at: datetime
+    updated_at: Optional[datetime] = None
 
     model_config = {
         "populate_by_name": True,
@@ -83,12 +169,27 @@ class User(UserBase):
         }
     }
 
-    @field_serializer('created_at')
-    def serialize_dt(self, dt: datetime, _info):
-        return dt.isoformat()
+# User profile Models (denormalized stats kept on the user document)
+class LatestProject(DocumentModel):
+    id: PyObjectId = Field(alias="_id")
+    slug: str
+    title: str
+    created_at: datetime
+
+    model_config = {"populate_by_name": True}
+
+class UserStats(DocumentModel):
+    project_count: int = 0
+    image_count: int = 0
+    latest_project: Optional[LatestProject] = None
+
+class UserProfile(User):
+    stats: UserStats = Field(default_factory=UserStats)
 
 # Project Image Models
-class ProjectImageBase(BaseModel):
+class ProjectImageBase(DocumentModel):
+    validate_documents = True
+
     project_id: PyObjectId
     image_url: str
 
@@ -100,6 +201,11 @@ class ProjectImageUpdate(BaseModel):
 
 class ProjectImageInDB(ProjectImageBase):
     id: PyObjectId = Field(default_factory=lambda: str(ObjectId()), alias="_id")
+    # Set for images uploaded to GridFS; external images only have image_url
+    file_id: Optional[PyObjectId] = None
+    content_type: Optional[str] = None
+    length: Optional[int] = None
+    checksum: Optional[str] = None
 
     model_config = {
         "populate_by_name": True,
@@ -109,8 +215,28 @@ class ProjectImageInDB(ProjectImageBase):
 class ProjectImage(ProjectImageInDB):
     pass
 
+# Portfolio Models (summary projection of a user's projects and images)
+class ProjectSummary(DocumentModel):
+    validate_documents = True
+
+    id: PyObjectId = Field(alias="_id")
+    slug: str
+    title: str
+    body_excerpt: Optional[str] = None
+    github_link: Optional[str] = None
+    created_at: datetime
+    updated_at: datetime
+    images: List[ProjectImage] = []
+
+    model_config = {"populate_by_name": True}
+
+class UserPortfolio(UserProfile):
+    projects: List[ProjectSummary] = []
+
 # Project Models
-class ProjectBase(BaseModel):
+class ProjectBase(DocumentModel):
+    validate_documents = True
+
     slug: str
     title: str
     body: str
@@ -128,6 +254,10 @@ class ProjectUpdate(BaseModel):
 
 class ProjectInDB(ProjectBase):
     id: PyObjectId = Field(default_factory=lambda: str(ObjectId()), alias="_id")
+    # Pre-rendered body, refreshed only when body_hash changes
+    body_html: Optional[str] = None
+    body_excerpt: Optional[str] = None
+    body_hash: Optional[str] = None
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
 
@@ -141,6 +271,8 @@ class ProjectInDB(ProjectBase):
                     "slug": "sample-project",
                     "title": "Sample Project",
                     "body": "Sample project body content",
+                    "body_html": "<p>Sample project body content</p>",
+                    "body_excerpt": "Sample project body content",
                     "user_id": "507f1f77bcf86cd799439022",
                     "created_at": "2023-01-01T00:00:00",
                     "updated_at": "2023-01-01T00:00:00"
@@ -149,10 +281,6 @@ class ProjectInDB(ProjectBase):
         }
     }
 
-    @field_serializer('created_at', 'updated_at')
-    def serialize_dt(self, dt: datetime, _info):
-        return dt.isoformat()
-
 class Project(ProjectInDB):
     images: List[ProjectImage] = []
 
@@ -166,6 +294,8 @@ class Project(ProjectInDB):
                     "slug": "sample-project",
                     "title": "Sample Project",
                     "body": "Sample project body content",
+                    "body_html": "<p>Sample project body content</p>",
+                    "body_excerpt": "Sample project body content",
                     "user_id": "507f1f77bcf86cd799439022",
                     "created_at": "2023-01-01T00:00:00",
                     "updated_at": "2023-01-01T00:00:00",
@@ -173,4 +303,14 @@ class Project(ProjectInDB):
                 }
             ]
         }
-    }
\ No newline at end of file
+    }
+
+# Batch Models
+class BatchOperation(BaseModel):
+    method: Literal["GET", "POST", "PUT", "PATCH", "DELETE"] = "GET"
+    path: str = Field(..., description="Path including any query string, e.g. /api/v1/users/username/johndoe")
+    headers: Dict[str, str] = {}
+    body: Optional[Any] = None
+
+class BatchRequest(BaseModel):
+    requests: List[BatchOperation] = Field(..., min_length=1)
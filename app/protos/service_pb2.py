@@ -22,83 +22,94 @@ _runtime_version.ValidateProtobufRuntimeVersion(
 _sym_db = _symbol_database.Default()
 
 
+from google.protobuf import field_mask_pb2 as google_dot_protobuf_dot_field__mask__pb2
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\rservice.proto\x12\x06protos\".\n\x0fGetUsersRequest\x12\x0c\n\x04skip\x18\x01 \x01(\x05\x12\r\n\x05limit\x18\x02 \x01(\x05\"/\n\x10GetUsersResponse\x12\x1b\n\x05users\x18\x01 \x03(\x0b\x32\x0c.protos.User\"\x1c\n\x0eGetUserRequest\x12\n\n\x02id\x18\x01 \x01(\t\",\n\x18GetUserByUsernameRequest\x12\x10\n\x08username\x18\x01 \x01(\t\"T\n\x11\x43reateUserRequest\x12\x10\n\x08username\x18\x01 \x01(\t\x12\r\n\x05\x65mail\x18\x02 \x01(\t\x12\x10\n\x08password\x18\x03 \x01(\t\x12\x0c\n\x04role\x18\x04 \x01(\t\"\xa1\x01\n\x11UpdateUserRequest\x12\n\n\x02id\x18\x01 \x01(\t\x12\x15\n\x08username\x18\x02 \x01(\tH\x00\x88\x01\x01\x12\x12\n\x05\x65mail\x18\x03 \x01(\tH\x01\x88\x01\x01\x12\x15\n\x08password\x18\x04 \x01(\tH\x02\x88\x01\x01\x12\x11\n\x04role\x18\x05 \x01(\tH\x03\x88\x01\x01\x42\x0b\n\t_usernameB\x08\n\x06_emailB\x0b\n\t_passwordB\x07\n\x05_role\"\x1f\n\x11\x44\x65leteUserRequest\x12\n\n\x02id\x18\x01 \x01(\t\"%\n\x12\x44\x65leteUserResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\"U\n\x04User\x12\n\n\x02id\x18\x01 \x01(\t\x12\x10\n\x08username\x18\x02 \x01(\t\x12\r\n\x05\x65mail\x18\x03 \x01(\t\x12\x0c\n\x04role\x18\x04 \x01(\t\x12\x12\n\ncreated_at\x18\x05 \x01(\t\"*\n\x0cUserResponse\x12\x1a\n\x04user\x18\x01 \x01(\x0b\x32\x0c.protos.User\"=\n\x17\x41uthenticateUserRequest\x12\x10\n\x08username\x18\x01 \x01(\t\x12\x10\n\x08password\x18\x02 \x01(\t\"E\n\x18\x41uthenticateUserResponse\x12\r\n\x05token\x18\x01 \x01(\t\x12\x1a\n\x04user\x18\x02 \x01(\x0b\x32\x0c.protos.User\"1\n\x12GetProjectsRequest\x12\x0c\n\x04skip\x18\x01 \x01(\x05\x12\r\n\x05limit\x18\x02 \x01(\x05\"8\n\x13GetProjectsResponse\x12!\n\x08projects\x18\x01 \x03(\x0b\x32\x0f.protos.Project\"\x1f\n\x11GetProjectRequest\x12\n\n\x02id\x18\x01 \x01(\t\"\'\n\x17GetProjectBySlugRequest\x12\x0c\n\x04slug\x18\x01 \x01(\t\"H\n\x18GetProjectsByUserRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\t\x12\x0c\n\x04skip\x18\x02 \x01(\x05\x12\r\n\x05limit\x18\x03 \x01(\x05\"|\n\x14\x43reateProjectRequest\x12\x0c\n\x04slug\x18\x01 \x01(\t\x12\r\n\x05title\x18\x02 \x01(\t\x12\x0c\n\x04\x62ody\x18\x03 \x01(\t\x12\x18\n\x0bgithub_link\x18\x04 \x01(\tH\x00\x88\x01\x01\x12\x0f\n\x07user_id\x18\x05 \x01(\tB\x0e\n\x0c_github_link\"\xa2\x01\n\x14UpdateProjectRequest\x12\n\n\x02id\x18\x01 \x01(\t\x12\x11\n\x04slug\x18\x02 \x01(\tH\x00\x88\x01\x01\x12\x12\n\x05title\x18\x03 \x01(\tH\x01\x88\x01\x01\x12\x11\n\x04\x62ody\x18\x04 \x01(\tH\x02\x88\x01\x01\x12\x18\n\x0bgithub_link\x18\x05 \x01(\tH\x03\x88\x01\x01\x42\x07\n\x05_slugB\x08\n\x06_titleB\x07\n\x05_bodyB\x0e\n\x0c_github_link\"\"\n\x14\x44\x65leteProjectRequest\x12\n\n\x02id\x18\x01 \x01(\t\"(\n\x15\x44\x65leteProjectResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\"\xc9\x01\n\x07Project\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04slug\x18\x02 \x01(\t\x12\r\n\x05title\x18\x03 \x01(\t\x12\x0c\n\x04\x62ody\x18\x04 \x01(\t\x12\x18\n\x0bgithub_link\x18\x05 \x01(\tH\x00\x88\x01\x01\x12\x0f\n\x07user_id\x18\x06 \x01(\t\x12\x12\n\ncreated_at\x18\x07 \x01(\t\x12\x12\n\nupdated_at\x18\x08 \x01(\t\x12$\n\x06images\x18\t \x03(\x0b\x32\x14.protos.ProjectImageB\x0e\n\x0c_github_link\"3\n\x0fProjectResponse\x12 \n\x07project\x18\x01 \x01(\x0b\x32\x0f.protos.Project\"/\n\x19GetImagesByProjectRequest\x12\x12\n\nproject_id\x18\x01 \x01(\t\"@\n\x18GetProjectImagesResponse\x12$\n\x06images\x18\x01 \x03(\x0b\x32\x14.protos.ProjectImage\"\x1d\n\x0fGetImageRequest\x12\n\n\x02id\x18\x01 \x01(\t\";\n\x12\x43reateImageRequest\x12\x12\n\nproject_id\x18\x01 \x01(\t\x12\x11\n\timage_url\x18\x02 \x01(\t\"F\n\x12UpdateImageRequest\x12\n\n\x02id\x18\x01 \x01(\t\x12\x16\n\timage_url\x18\x02 \x01(\tH\x00\x88\x01\x01\x42\x0c\n\n_image_url\" \n\x12\x44\x65leteImageRequest\x12\n\n\x02id\x18\x01 \x01(\t\"&\n\x13\x44\x65leteImageResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\"A\n\x0cProjectImage\x12\n\n\x02id\x18\x01 \x01(\t\x12\x12\n\nproject_id\x18\x02 \x01(\t\x12\x11\n\timage_url\x18\x03 \x01(\t\";\n\x14ProjectImageResponse\x12#\n\x05image\x18\x01 \x01(\x0b\x32\x14.protos.ProjectImage2\xec\x03\n\x0bUserService\x12=\n\x08GetUsers\x12\x17.protos.GetUsersRequest\x1a\x18.protos.GetUsersResponse\x12\x37\n\x07GetUser\x12\x16.protos.GetUserRequest\x1a\x14.protos.UserResponse\x12K\n\x11GetUserByUsername\x12 .protos.GetUserByUsernameRequest\x1a\x14.protos.UserResponse\x12=\n\nCreateUser\x12\x19.protos.CreateUserRequest\x1a\x14.protos.UserResponse\x12=\n\nUpdateUser\x12\x19.protos.UpdateUserRequest\x1a\x14.protos.UserResponse\x12\x43\n\nDeleteUser\x12\x19.protos.DeleteUserRequest\x1a\x1a.protos.DeleteUserResponse\x12U\n\x10\x41uthenticateUser\x12\x1f.protos.AuthenticateUserRequest\x1a .protos.AuthenticateUserResponse2\x9a\x04\n\x0eProjectService\x12\x46\n\x0bGetProjects\x12\x1a.protos.GetProjectsRequest\x1a\x1b.protos.GetProjectsResponse\x12@\n\nGetProject\x12\x19.protos.GetProjectRequest\x1a\x17.protos.ProjectResponse\x12L\n\x10GetProjectBySlug\x12\x1f.protos.GetProjectBySlugRequest\x1a\x17.protos.ProjectResponse\x12R\n\x11GetProjectsByUser\x12 .protos.GetProjectsByUserRequest\x1a\x1b.protos.GetProjectsResponse\x12\x46\n\rCreateProject\x12\x1c.protos.CreateProjectRequest\x1a\x17.protos.ProjectResponse\x12\x46\n\rUpdateProject\x12\x1c.protos.UpdateProjectRequest\x1a\x17.protos.ProjectResponse\x12L\n\rDeleteProject\x12\x1c.protos.DeleteProjectRequest\x1a\x1d.protos.DeleteProjectResponse2\x8d\x03\n\x13ProjectImageService\x12Y\n\x12GetImagesByProject\x12!.protos.GetImagesByProjectRequest\x1a .protos.GetProjectImagesResponse\x12\x41\n\x08GetImage\x12\x17.protos.GetImageRequest\x1a\x1c.protos.ProjectImageResponse\x12G\n\x0b\x43reateImage\x12\x1a.protos.CreateImageRequest\x1a\x1c.protos.ProjectImageResponse\x12G\n\x0bUpdateImage\x12\x1a.protos.UpdateImageRequest\x1a\x1c.protos.ProjectImageResponse\x12\x46\n\x0b\x44\x65leteImage\x12\x1a.protos.DeleteImageRequest\x1a\x1b.protos.DeleteImageResponseb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\rservice.proto\x12\x06protos\x1a google/protobuf/field_mask.proto\"]\n\x0fGetUsersRequest\x12\x0c\n\x04skip\x18\x01 \x01(\x05\x12\r\n\x05limit\x18\x02 \x01(\x05\x12-\n\tread_mask\x18\x03 \x01(\x0b\x32\x1a.google.protobuf.FieldMask\"/\n\x10GetUsersResponse\x12\x1b\n\x05users\x18\x01 \x03(\x0b\x32\x0c.protos.User\"K\n\x0eGetUserRequest\x12\n\n\x02id\x18\x01 \x01(\t\x12-\n\tread_mask\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.FieldMask\"[\n\x18GetUserByUsernameRequest\x12\x10\n\x08username\x18\x01 \x01(\t\x12-\n\tread_mask\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.FieldMask\"T\n\x11\x43reateUserRequest\x12\x10\n\x08username\x18\x01 \x01(\t\x12\r\n\x05\x65mail\x18\x02 \x01(\t\x12\x10\n\x08password\x18\x03 \x01(\t\x12\x0c\n\x04role\x18\x04 \x01(\t\"\xa1\x01\n\x11UpdateUserRequest\x12\n\n\x02id\x18\x01 \x01(\t\x12\x15\n\x08username\x18\x02 \x01(\tH\x00\x88\x01\x01\x12\x12\n\x05\x65mail\x18\x03 \x01(\tH\x01\x88\x01\x01\x12\x15\n\x08password\x18\x04 \x01(\tH\x02\x88\x01\x01\x12\x11\n\x04role\x18\x05 \x01(\tH\x03\x88\x01\x01\x42\x0b\n\t_usernameB\x08\n\x06_emailB\x0b\n\t_passwordB\x07\n\x05_role\"\x1f\n\x11\x44\x65leteUserRequest\x12\n\n\x02id\x18\x01 \x01(\t\"%\n\x12\x44\x65leteUserResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\"U\n\x04User\x12\n\n\x02id\x18\x01 \x01(\t\x12\x10\n\x08username\x18\x02 \x01(\t\x12\r\n\x05\x65mail\x18\x03 \x01(\t\x12\x0c\n\x04role\x18\x04 \x01(\t\x12\x12\n\ncreated_at\x18\x05 \x01(\t\"*\n\x0cUserResponse\x12\x1a\n\x04user\x18\x01 \x01(\x0b\x32\x0c.protos.User\"=\n\x17\x41uthenticateUserRequest\x12\x10\n\x08username\x18\x01 \x01(\t\x12\x10\n\x08password\x18\x02 \x01(\t\"E\n\x18\x41uthenticateUserResponse\x12\r\n\x05token\x18\x01 \x01(\t\x12\x1a\n\x04user\x18\x02 \x01(\x0b\x32\x0c.protos.User\"+\n\x17GetUserPortfolioRequest\x12\x10\n\x08username\x18\x01 \x01(\t\"\xc9\x01\n\x10PortfolioProject\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04slug\x18\x02 \x01(\t\x12\r\n\x05title\x18\x03 \x01(\t\x12\x14\n\x0c\x62ody_excerpt\x18\x04 \x01(\t\x12\x18\n\x0bgithub_link\x18\x05 \x01(\tH\x00\x88\x01\x01\x12\x12\n\ncreated_at\x18\x06 \x01(\t\x12\x12\n\nupdated_at\x18\x07 \x01(\t\x12$\n\x06images\x18\x08 \x03(\x0b\x32\x14.protos.ProjectImageB\x0e\n\x0c_github_link\"\x8b\x01\n\x15UserPortfolioResponse\x12\x1a\n\x04user\x18\x01 \x01(\x0b\x32\x0c.protos.User\x12\x15\n\rproject_count\x18\x02 \x01(\x05\x12\x13\n\x0bimage_count\x18\x03 \x01(\x05\x12*\n\x08projects\x18\x04 \x03(\x0b\x32\x18.protos.PortfolioProject\"`\n\x12GetProjectsRequest\x12\x0c\n\x04skip\x18\x01 \x01(\x05\x12\r\n\x05limit\x18\x02 \x01(\x05\x12-\n\tread_mask\x18\x03 \x01(\x0b\x32\x1a.google.protobuf.FieldMask\"8\n\x13GetProjectsResponse\x12!\n\x08projects\x18\x01 \x03(\x0b\x32\x0f.protos.Project\"N\n\x11GetProjectRequest\x12\n\n\x02id\x18\x01 \x01(\t\x12-\n\tread_mask\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.FieldMask\"V\n\x17GetProjectBySlugRequest\x12\x0c\n\x04slug\x18\x01 \x01(\t\x12-\n\tread_mask\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.FieldMask\"w\n\x18GetProjectsByUserRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\t\x12\x0c\n\x04skip\x18\x02 \x01(\x05\x12\r\n\x05limit\x18\x03 \x01(\x05\x12-\n\tread_mask\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.FieldMask\"|\n\x14\x43reateProjectRequest\x12\x0c\n\x04slug\x18\x01 \x01(\t\x12\r\n\x05title\x18\x02 \x01(\t\x12\x0c\n\x04\x62ody\x18\x03 \x01(\t\x12\x18\n\x0bgithub_link\x18\x04 \x01(\tH\x00\x88\x01\x01\x12\x0f\n\x07user_id\x18\x05 \x01(\tB\x0e\n\x0c_github_link\"\xa2\x01\n\x14UpdateProjectRequest\x12\n\n\x02id\x18\x01 \x01(\t\x12\x11\n\x04slug\x18\x02 \x01(\tH\x00\x88\x01\x01\x12\x12\n\x05title\x18\x03 \x01(\tH\x01\x88\x01\x01\x12\x11\n\x04\x62ody\x18\x04 \x01(\tH\x02\x88\x01\x01\x12\x18\n\x0bgithub_link\x18\x05 \x01(\tH\x03\x88\x01\x01\x42\x07\n\x05_slugB\x08\n\x06_titleB\x07\n\x05_bodyB\x0e\n\x0c_github_link\"\"\n\x14\x44\x65leteProjectRequest\x12\n\n\x02id\x18\x01 \x01(\t\"(\n\x15\x44\x65leteProjectResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\"\xf2\x01\n\x07Project\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04slug\x18\x02 \x01(\t\x12\r\n\x05title\x18\x03 \x01(\t\x12\x0c\n\x04\x62ody\x18\x04 \x01(\t\x12\x18\n\x0bgithub_link\x18\x05 \x01(\tH\x00\x88\x01\x01\x12\x0f\n\x07user_id\x18\x06 \x01(\t\x12\x12\n\ncreated_at\x18\x07 \x01(\t\x12\x12\n\nupdated_at\x18\x08 \x01(\t\x12$\n\x06images\x18\t \x03(\x0b\x32\x14.protos.ProjectImage\x12\x11\n\tbody_html\x18\n \x01(\t\x12\x14\n\x0c\x62ody_excerpt\x18\x0b \x01(\tB\x0e\n\x0c_github_link\"3\n\x0fProjectResponse\x12 \n\x07project\x18\x01 \x01(\x0b\x32\x0f.protos.Project\"/\n\x19GetImagesByProjectRequest\x12\x12\n\nproject_id\x18\x01 \x01(\t\"@\n\x18GetProjectImagesResponse\x12$\n\x06images\x18\x01 \x03(\x0b\x32\x14.protos.ProjectImage\"\x1d\n\x0fGetImageRequest\x12\n\n\x02id\x18\x01 \x01(\t\";\n\x12\x43reateImageRequest\x12\x12\n\nproject_id\x18\x01 \x01(\t\x12\x11\n\timage_url\x18\x02 \x01(\t\"F\n\x12UpdateImageRequest\x12\n\n\x02id\x18\x01 \x01(\t\x12\x16\n\timage_url\x18\x02 \x01(\tH\x00\x88\x01\x01\x42\x0c\n\n_image_url\" \n\x12\x44\x65leteImageRequest\x12\n\n\x02id\x18\x01 \x01(\t\"&\n\x13\x44\x65leteImageResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\"g\n\x0cProjectImage\x12\n\n\x02id\x18\x01 \x01(\t\x12\x12\n\nproject_id\x18\x02 \x01(\t\x12\x11\n\timage_url\x18\x03 \x01(\t\x12\x14\n\x0c\x63ontent_type\x18\x04 \x01(\t\x12\x0e\n\x06length\x18\x05 \x01(\x03\";\n\x14ProjectImageResponse\x12#\n\x05image\x18\x01 \x01(\x0b\x32\x14.protos.ProjectImage\"B\n\x14\x44ownloadImageRequest\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0e\n\x06offset\x18\x02 \x01(\x03\x12\x0e\n\x06length\x18\x03 \x01(\x03\"h\n\nImageChunk\x12\x0c\n\x04\x64\x61ta\x18\x01 \x01(\x0c\x12\x0e\n\x06offset\x18\x02 \x01(\x03\x12\x14\n\x0ctotal_length\x18\x03 \x01(\x03\x12\x14\n\x0c\x63ontent_type\x18\x04 \x01(\t\x12\x10\n\x08\x63hecksum\x18\x05 \x01(\t2\xc0\x04\n\x0bUserService\x12=\n\x08GetUsers\x12\x17.protos.GetUsersRequest\x1a\x18.protos.GetUsersResponse\x12\x37\n\x07GetUser\x12\x16.protos.GetUserRequest\x1a\x14.protos.UserResponse\x12K\n\x11GetUserByUsername\x12 .protos.GetUserByUsernameRequest\x1a\x14.protos.UserResponse\x12=\n\nCreateUser\x12\x19.protos.CreateUserRequest\x1a\x14.protos.UserResponse\x12=\n\nUpdateUser\x12\x19.protos.UpdateUserRequest\x1a\x14.protos.UserResponse\x12\x43\n\nDeleteUser\x12\x19.protos.DeleteUserRequest\x1a\x1a.protos.DeleteUserResponse\x12U\n\x10\x41uthenticateUser\x12\x1f.protos.AuthenticateUserRequest\x1a .protos.AuthenticateUserResponse\x12R\n\x10GetUserPortfolio\x12\x1f.protos.GetUserPortfolioRequest\x1a\x1d.protos.UserPortfolioResponse2\x9a\x04\n\x0eProjectService\x12\x46\n\x0bGetProjects\x12\x1a.protos.GetProjectsRequest\x1a\x1b.protos.GetProjectsResponse\x12@\n\nGetProject\x12\x19.protos.GetProjectRequest\x1a\x17.protos.ProjectResponse\x12L\n\x10GetProjectBySlug\x12\x1f.protos.GetProjectBySlugRequest\x1a\x17.protos.ProjectResponse\x12R\n\x11GetProjectsByUser\x12 .protos.GetProjectsByUserRequest\x1a\x1b.protos.GetProjectsResponse\x12\x46\n\rCreateProject\x12\x1c.protos.CreateProjectRequest\x1a\x17.protos.ProjectResponse\x12\x46\n\rUpdateProject\x12\x1c.protos.UpdateProjectRequest\x1a\x17.protos.ProjectResponse\x12L\n\rDeleteProject\x12\x1c.protos.DeleteProjectRequest\x1a\x1d.protos.DeleteProjectResponse2\xd2\x03\n\x13ProjectImageService\x12Y\n\x12GetImagesByProject\x12!.protos.GetImagesByProjectRequest\x1a .protos.GetProjectImagesResponse\x12\x41\n\x08GetImage\x12\x17.protos.GetImageRequest\x1a\x1c.protos.ProjectImageResponse\x12G\n\x0b\x43reateImage\x12\x1a.protos.CreateImageRequest\x1a\x1c.protos.ProjectImageResponse\x12G\n\x0bUpdateImage\x12\x1a.protos.UpdateImageRequest\x1a\x1c.protos.ProjectImageResponse\x12\x46\n\x0b\x44\x65leteImage\x12\x1a.protos.DeleteImageRequest\x1a\x1b.protos.DeleteImageResponse\x12\x43\n\rDownloadImage\x12\x1c.protos.DownloadImageRequest\x1a\x12.protos.ImageChunk0\x01\x62\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
 _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'service_pb2', _globals)
 if not _descriptor._USE_C_DESCRIPTORS:
   DESCRIPTOR._loaded_options = None
-  _globals['_GETUSERSREQUEST']._serialized_start=25
-  _globals['_GETUSERSREQUEST']._serialized_end=71
-  _globals['_GETUSERSRESPONSE']._serialized_start=73
-  _globals['_GETUSERSRESPONSE']._serialized_end=120
-  _globals['_GETUSERREQUEST']._serialized_start=122
-  _globals['_GETUSERREQUEST']._serialized_end=150
-  _globals['_GETUSERBYUSERNAMEREQUEST']._serialized_start=152
-  _globals['_GETUSERBYUSERNAMEREQUEST']._serialized_end=196
-  _globals['_CREATEUSERREQUEST']._serialized_start=198
-  _globals['_CREATEUSERREQUEST']._serialized_end=282
-  _globals['_UPDATEUSERREQUEST']._serialized_start=285
-  _globals['_UPDATEUSERREQUEST']._serialized_end=446
-  _globals['_DELETEUSERREQUEST']._serialized_start=448
-  _globals['_DELETEUSERREQUEST']._serialized_end=479
-  _globals['_DELETEUSERRESPONSE']._serialized_start=481
-  _globals['_DELETEUSERRESPONSE']._serialized_end=518
-  _globals['_USER']._serialized_start=520
-  _globals['_USER']._serialized_end=605
-  _globals['_USERRESPONSE']._serialized_start=607
-  _globals['_USERRESPONSE']._serialized_end=649
-  _globals['_AUTHENTICATEUSERREQUEST']._serialized_start=651
-  _globals['_AUTHENTICATEUSERREQUEST']._serialized_end=712
-  _globals['_AUTHENTICATEUSERRESPONSE']._serialized_start=714
-  _globals['_AUTHENTICATEUSERRESPONSE']._serialized_end=783
-  _globals['_GETPROJECTSREQUEST']._serialized_start=785
-  _globals['_GETPROJECTSREQUEST']._serialized_end=834
-  _globals['_GETPROJECTSRESPONSE']._serialized_start=836
-  _globals['_GETPROJECTSRESPONSE']._serialized_end=892
-  _globals['_GETPROJECTREQUEST']._serialized_start=894
-  _globals['_GETPROJECTREQUEST']._serialized_end=925
-  _globals['_GETPROJECTBYSLUGREQUEST']._serialized_start=927
-  _globals['_GETPROJECTBYSLUGREQUEST']._serialized_end=966
-  _globals['_GETPROJECTSBYUSERREQUEST']._serialized_start=968
-  _globals['_GETPROJECTSBYUSERREQUEST']._serialized_end=1040
-  _globals['_CREATEPROJECTREQUEST']._serialized_start=1042
-  _globals['_CREATEPROJECTREQUEST']._serialized_end=1166
-  _globals['_UPDATEPROJECTREQUEST']._serialized_start=1169
-  _globals['_UPDATEPROJECTREQUEST']._serialized_end=1331
-  _globals['_DELETEPROJECTREQUEST']._serialized_start=1333
-  _globals['_DELETEPROJECTREQUEST']._serialized_end=1367
-  _globals['_DELETEPROJECTRESPONSE']._serialized_start=1369
-  _globals['_DELETEPROJECTRESPONSE']._serialized_end=1409
-  _globals['_PROJECT']._serialized_start=1412
-  _globals['_PROJECT']._serialized_end=1613
-  _globals['_PROJECTRESPONSE']._serialized_start=1615
-  _globals['_PROJECTRESPONSE']._serialized_end=1666
-  _globals['_GETIMAGESBYPROJECTREQUEST']._serialized_start=1668
-  _globals['_GETIMAGESBYPROJECTREQUEST']._serialized_end=1715
-  _globals['_GETPROJECTIMAGESRESPONSE']._serialized_start=1717
-  _globals['_GETPROJECTIMAGESRESPONSE']._serialized_end=1781
-  _globals['_GETIMAGEREQUEST']._serialized_start=1783
-  _globals['_GETIMAGEREQUEST']._serialized_end=1812
-  _globals['_CREATEIMAGEREQUEST']._serialized_start=1814
-  _globals['_CREATEIMAGEREQUEST']._serialized_end=1873
-  _globals['_UPDATEIMAGEREQUEST']._serialized_start=1875
-  _globals['_UPDATEIMAGEREQUEST']._serialized_end=1945
-  _globals['_DELETEIMAGEREQUEST']._serialized_start=1947
-  _globals['_DELETEIMAGEREQUEST']._serialized_end=1979
-  _globals['_DELETEIMAGERESPONSE']._serialized_start=1981
-  _globals['_DELETEIMAGERESPONSE']._serialized_end=2019
-  _globals['_PROJECTIMAGE']._serialized_start=2021
-  _globals['_PROJECTIMAGE']._serialized_end=2086
-  _globals['_PROJECTIMAGERESPONSE']._serialized_start=2088
-  _globals['_PROJECTIMAGERESPONSE']._serialized_end=2147
-  _globals['_USERSERVICE']._serialized_start=2150
-  _globals['_USERSERVICE']._serialized_end=2642
-  _globals['_PROJECTSERVICE']._serialized_start=2645
-  _globals['_PROJECTSERVICE']._serialized_end=3183
-  _globals['_PROJECTIMAGESERVICE']._serialized_start=3186
-  _globals['_PROJECTIMAGESERVICE']._serialized_end=3583
+  _globals['_GETUSERSREQUEST']._serialized_start=59
+  _globals['_GETUSERSREQUEST']._serialized_end=152
+  _globals['_GETUSERSRESPONSE']._serialized_start=154
+  _globals['_GETUSERSRESPONSE']._serialized_end=201
+  _globals['_GETUSERREQUEST']._serialized_start=203
+  _globals['_GETUSERREQUEST']._serialized_end=278
+  _globals['_GETUSERBYUSERNAMEREQUEST']._serialized_start=280
+  _globals['_GETUSERBYUSERNAMEREQUEST']._serialized_end=371
+  _globals['_CREATEUSERREQUEST']._serialized_start=373
+  _globals['_CREATEUSERREQUEST']._serialized_end=457
+  _globals['_UPDATEUSERREQUEST']._serialized_start=460
+  _globals['_UPDATEUSERREQUEST']._serialized_end=621
+  _globals['_DELETEUSERREQUEST']._serialized_start=623
+  _globals['_DELETEUSERREQUEST']._serialized_end=654
+  _globals['_DELETEUSERRESPONSE']._serialized_start=656
+  _globals['_DELETEUSERRESPONSE']._serialized_end=693
+  _globals['_USER']._serialized_start=695
+  _globals['_USER']._serialized_end=780
+  _globals['_USERRESPONSE']._serialized_start=782
+  _globals['_USERRESPONSE']._serialized_end=824
+  _globals['_AUTHENTICATEUSERREQUEST']._serialized_start=826
+  _globals['_AUTHENTICATEUSERREQUEST']._serialized_end=887
+  _globals['_AUTHENTICATEUSERRESPONSE']._serialized_start=889
+  _globals['_AUTHENTICATEUSERRESPONSE']._serialized_end=958
+  _globals['_GETUSERPORTFOLIOREQUEST']._serialized_start=960
+  _globals['_GETUSERPORTFOLIOREQUEST']._serialized_end=1003
+  _globals['_PORTFOLIOPROJECT']._serialized_start=1006
+  _globals['_PORTFOLIOPROJECT']._serialized_end=1207
+  _globals['_USERPORTFOLIORESPONSE']._serialized_start=1210
+  _globals['_USERPORTFOLIORESPONSE']._serialized_end=1349
+  _globals['_GETPROJECTSREQUEST']._serialized_start=1351
+  _globals['_GETPROJECTSREQUEST']._serialized_end=1447
+  _globals['_GETPROJECTSRESPONSE']._serialized_start=1449
+  _globals['_GETPROJECTSRESPONSE']._serialized_end=1505
+  _globals['_GETPROJECTREQUEST']._serialized_start=1507
+  _globals['_GETPROJECTREQUEST']._serialized_end=1585
+  _globals['_GETPROJECTBYSLUGREQUEST']._serialized_start=1587
+  _globals['_GETPROJECTBYSLUGREQUEST']._serialized_end=1673
+  _globals['_GETPROJECTSBYUSERREQUEST']._serialized_start=1675
+  _globals['_GETPROJECTSBYUSERREQUEST']._serialized_end=1794
+  _globals['_CREATEPROJECTREQUEST']._serialized_start=1796
+  _globals['_CREATEPROJECTREQUEST']._serialized_end=1920
+  _globals['_UPDATEPROJECTREQUEST']._serialized_start=1923
+  _globals['_UPDATEPROJECTREQUEST']._serialized_end=2085
+  _globals['_DELETEPROJECTREQUEST']._serialized_start=2087
+  _globals['_DELETEPROJECTREQUEST']._serialized_end=2121
+  _globals['_DELETEPROJECTRESPONSE']._serialized_start=2123
+  _globals['_DELETEPROJECTRESPONSE']._serialized_end=2163
+  _globals['_PROJECT']._serialized_start=2166
+  _globals['_PROJECT']._serialized_end=2408
+  _globals['_PROJECTRESPONSE']._serialized_start=2410
+  _globals['_PROJECTRESPONSE']._serialized_end=2461
+  _globals['_GETIMAGESBYPROJECTREQUEST']._serialized_start=2463
+  _globals['_GETIMAGESBYPROJECTREQUEST']._serialized_end=2510
+  _globals['_GETPROJECTIMAGESRESPONSE']._serialized_start=2512
+  _globals['_GETPROJECTIMAGESRESPONSE']._serialized_end=2576
+  _globals['_GETIMAGEREQUEST']._serialized_start=2578
+  _globals['_GETIMAGEREQUEST']._serialized_end=2607
+  _globals['_CREATEIMAGEREQUEST']._serialized_start=2609
+  _globals['_CREATEIMAGEREQUEST']._serialized_end=2668
+  _globals['_UPDATEIMAGEREQUEST']._serialized_start=2670
+  _globals['_UPDATEIMAGEREQUEST']._serialized_end=2740
+  _globals['_DELETEIMAGEREQUEST']._serialized_start=2742
+  _globals['_DELETEIMAGEREQUEST']._serialized_end=2774
+  _globals['_DELETEIMAGERESPONSE']._serialized_start=2776
+  _globals['_DELETEIMAGERESPONSE']._serialized_end=2814
+  _globals['_PROJECTIMAGE']._serialized_start=2816
+  _globals['_PROJECTIMAGE']._serialized_end=2919
+  _globals['_PROJECTIMAGERESPONSE']._serialized_start=2921
+  _globals['_PROJECTIMAGERESPONSE']._serialized_end=2980
+  _globals['_DOWNLOADIMAGEREQUEST']._serialized_start=2982
+  _globals['_DOWNLOADIMAGEREQUEST']._serialized_end=3048
+  _globals['_IMAGECHUNK']._serialized_start=3050
+  _globals['_IMAGECHUNK']._serialized_end=3154
+  _globals['_USERSERVICE']._serialized_start=3157
+  _globals['_USERSERVICE']._serialized_end=3733
+  _globals['_PROJECTSERVICE']._serialized_start=3736
+  _globals['_PROJECTSERVICE']._serialized_end=4274
+  _globals['_PROJECTIMAGESERVICE']._serialized_start=4277
+  _globals['_PROJECTIMAGESERVICE']._serialized_end=4743
 # @@protoc_insertion_point(module_scope)
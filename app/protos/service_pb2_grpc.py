@@ -69,6 +69,11 @@ class UserServiceStub(object):
                 request_serializer=service__pb2.AuthenticateUserRequest.SerializeToString,
                 response_deserializer=service__pb2.AuthenticateUserResponse.FromString,
                 _registered_method=True)
+        self.GetUserPortfolio = channel.unary_unary(
+                '/protos.UserService/GetUserPortfolio',
+                request_serializer=service__pb2.GetUserPortfolioRequest.SerializeToString,
+                response_deserializer=service__pb2.UserPortfolioResponse.FromString,
+                _registered_method=True)
 
 
 class UserServiceServicer(object):
@@ -116,6 +121,12 @@ class UserServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def GetUserPortfolio(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_UserServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -154,6 +165,11 @@ def add_UserServiceServicer_to_server(servicer, server):
                     request_deserializer=service__pb2.AuthenticateUserRequest.FromString,
                     response_serializer=service__pb2.AuthenticateUserResponse.SerializeToString,
             ),
+            'GetUserPortfolio': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetUserPortfolio,
+                    request_deserializer=service__pb2.GetUserPortfolioRequest.FromString,
+                    response_serializer=service__pb2.UserPortfolioResponse.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'protos.UserService', rpc_method_handlers)
@@ -354,6 +370,33 @@ class UserService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def GetUserPortfolio(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/protos.UserService/GetUserPortfolio',
+            service__pb2.GetUserPortfolioRequest.SerializeToString,
+            service__pb2.UserPortfolioResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
 
 class ProjectServiceStub(object):
     """Missing associated documentation comment in .proto file."""
@@ -719,6 +762,11 @@ class ProjectImageServiceStub(object):
                 request_serializer=service__pb2.DeleteImageRequest.SerializeToString,
                 response_deserializer=service__pb2.DeleteImageResponse.FromString,
                 _registered_method=True)
+        self.DownloadImage = channel.unary_stream(
+                '/protos.ProjectImageService/DownloadImage',
+                request_serializer=service__pb2.DownloadImageRequest.SerializeToString,
+                response_deserializer=service__pb2.ImageChunk.FromString,
+                _registered_method=True)
 
 
 class ProjectImageServiceServicer(object):
@@ -754,6 +802,12 @@ class ProjectImageServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def DownloadImage(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_ProjectImageServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -782,6 +836,11 @@ def add_ProjectImageServiceServicer_to_server(servicer, server):
                     request_deserializer=service__pb2.DeleteImageRequest.FromString,
                     response_serializer=service__pb2.DeleteImageResponse.SerializeToString,
             ),
+            'DownloadImage': grpc.unary_stream_rpc_method_handler(
+                    servicer.DownloadImage,
+                    request_deserializer=service__pb2.DownloadImageRequest.FromString,
+                    response_serializer=service__pb2.ImageChunk.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'protos.ProjectImageService', rpc_method_handlers)
@@ -927,3 +986,30 @@ class ProjectImageService(object):
             timeout,
             metadata,
             _registered_method=True)
+
+    @staticmethod
+    def DownloadImage(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/protos.ProjectImageService/DownloadImage',
+            service__pb2.DownloadImageRequest.SerializeToString,
+            service__pb2.ImageChunk.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
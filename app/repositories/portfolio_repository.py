@@ -0,0 +1,66 @@
+from typing import Optional
+
+from app.core.circuit_breaker import guarded
+from app.core.config import settings
+from app.core.db import db
+from app.models.models import UserPortfolio
+
+class PortfolioRepository:
+    """Reads a user's whole portfolio (user, projects, images) in one aggregation."""
+    collection_name = "users"
+
+    def _pipeline(self, username: str) -> list:
+        return [
+            {"$match": {"username": username}},
+            {"$limit": 1},
+            {"$project": {"password_hash": 0}},
+            {"$lookup": {
+                "from": "projects",
+                "let": {"user_id": "$_id"},
+                "pipeline": [
+                    {"$match": {"$expr": {"$eq": ["$user_id", "$$user_id"]}}},
+                    {"$sort": {"created_at": -1}},
+                    {"$limit": settings.PORTFOLIO_MAX_PROJECTS},
+                    {"$project": {
+                        "slug": 1,
+                        "title": 1,
+                        "body_excerpt": 1,
+                        "github_link": 1,
+                        "created_at": 1,
+                        "updated_at": 1
+                    }},
+                    {"$lookup": {
+                        "from": "project_images",
+                        "let": {"project_id": "$_id"},
+                        "pipeline": [
+                            {"$match": {"$expr": {"$eq": ["$project_id", "$$project_id"]}}},
+                            {"$project": {
+                                "project_id": 1,
+                                "image_url": 1,
+                                "content_type": 1,
+                                "length": 1
+                            }}
+                        ],
+                        "as": "images"
+                    }}
+                ],
+                "as": "projects"
+            }}
+        ]
+
+    @guarded("read")
+    async def get_by_username(self, username: str) -> Optional[UserPortfolio]:
+        cursor = db.db[self.collection_name].aggregate(self._pipeline(username))
+        async for document in cursor:
+            return UserPortfolio.from_document(document)
+        return None
+
+    @guarded("read")
+    async def get_version(self, username: str) -> Optional[tuple]:
+        """Cheap projection of the fields that change whenever the portfolio does."""
+        document = await db.db[self.collection_name].find_one(
+            {"username": username}, {"updated_at": 1, "portfolio_changed_at": 1}
+        )
+        if document:
+            return (document["_id"], document.get("updated_at"), document.get("portfolio_changed_at"))
+        return None
@@ -0,0 +1,158 @@
+from bson import ObjectId
+from typing import AsyncIterator, List, Optional
+import hashlib
+
+import gridfs
+
+from app.core.circuit_breaker import guarded
+from app.core.config import settings
+from app.core.db import db
+from app.models.models import ProjectImage, ProjectImageCreate, ProjectImageUpdate
+
+class ProjectImageRepository:
+    collection_name = "project_images"
+
+    @guarded("read")
+    async def get_by_project(self, project_id: str) -> List[ProjectImage]:
+        if not ObjectId.is_valid(project_id):
+            return []
+
+        images = []
+        cursor = db.db[self.collection_name].find({"project_id": ObjectId(project_id)})
+        async for document in cursor:
+            images.append(ProjectImage.from_document(document))
+        return images
+
+    @guarded("read")
+    async def get_by_id(self, id: str) -> Optional[ProjectImage]:
+        if not ObjectId.is_valid(id):
+            return None
+
+        document = await db.db[self.collection_name].find_one({"_id": ObjectId(id)})
+        if document:
+            return ProjectImage.from_document(document)
+        return None
+
+    @guarded("write")
+    async def create(self, image: ProjectImageCreate) -> ProjectImage:
+        image_dict = image.model_dump()
+        image_dict["project_id"] = ObjectId(image_dict["project_id"])
+
+        result = await db.db[self.collection_name].insert_one(image_dict)
+
+        if result.inserted_id:
+            return await self.get_by_id(str(result.inserted_id))
+        return None
+
+    @guarded("write")
+    async def upload(
+        self,
+        project_id: str,
+        chunks: AsyncIterator[bytes],
+        content_type: str,
+        filename: str
+    ) -> ProjectImage:
+        """
+        Stream an image into GridFS chunk by chunk and record it for the project.
+        At most one GridFS chunk is buffered, whatever the image size.
+        """
+        image_id = ObjectId()
+        file_id = ObjectId()
+        grid_in = db.fs.open_upload_stream_with_id(
+            file_id,
+            filename,
+            metadata={
+                "project_id": ObjectId(project_id),
+                "image_id": image_id,
+                "content_type": content_type
+            }
+        )
+
+        digest = hashlib.sha256()
+        length = 0
+        try:
+            async for chunk in chunks:
+                if not chunk:
+                    continue
+                length += len(chunk)
+                if length > settings.MAX_IMAGE_UPLOAD_BYTES:
+                    raise ValueError("Image exceeds the maximum upload size")
+                digest.update(chunk)
+                await grid_in.write(chunk)
+
+            if length == 0:
+                raise ValueError("Image upload is empty")
+            await grid_in.close()
+        except BaseException:
+            await grid_in.abort()
+            raise
+
+        image_data = {
+            "_id": image_id,
+            "project_id": ObjectId(project_id),
+            "image_url": f"{settings.API_PREFIX}/v1/images/{image_id}/content",
+            "file_id": file_id,
+            "content_type": content_type,
+            "length": length,
+            "checksum": digest.hexdigest()
+        }
+        await db.db[self.collection_name].insert_one(image_data)
+        return ProjectImage.from_document(image_data)
+
+    @guarded("read")
+    async def open_file(self, image: ProjectImage):
+        """Open the GridFS download stream backing an uploaded image."""
+        if not image.file_id:
+            return None
+
+        try:
+            return await db.fs.open_download_stream(ObjectId(image.file_id))
+        except gridfs.errors.NoFile:
+            return None
+
+    @guarded("write")
+    async def update(self, id: str, image: ProjectImageUpdate) -> Optional[ProjectImage]:
+        if not ObjectId.is_valid(id):
+            return None
+
+        # Filter not None values
+        update_data = { k: v for k, v in image.model_dump().items() if v is not None }
+
+        if update_data:
+            await db.db[self.collection_name].update_one(
+                {"_id": ObjectId(id)},
+                {"$set": update_data}
+            )
+
+        return await self.get_by_id(id)
+
+    @guarded("write")
+    async def delete_by_project(self, project_id: str) -> int:
+        """Delete every image of a project, including stored content."""
+        if not ObjectId.is_valid(project_id):
+            return 0
+
+        deleted = 0
+        cursor = db.db[self.collection_name].find({"project_id": ObjectId(project_id)}, {"_id": 1})
+        async for document in cursor:
+            if await self.delete(str(document["_id"])):
+                deleted += 1
+        return deleted
+
+    @guarded("write")
+    async def delete(self, id: str) -> bool:
+        if not ObjectId.is_valid(id):
+            return False
+
+        document = await db.db[self.collection_name].find_one_and_delete(
+            {"_id": ObjectId(id)}, projection={"file_id": 1}
+        )
+        if not document:
+            return False
+
+        if document.get("file_id"):
+            try:
+                await db.fs.delete(document["file_id"])
+            except gridfs.errors.NoFile:
+                pass
+        return True
@@ -0,0 +1,217 @@
+from bson import ObjectId
+from typing import AsyncIterator, FrozenSet, List, Optional
+from datetime import datetime
+
+from pymongo.errors import DuplicateKeyError
+
+from app.core.circuit_breaker import guarded
+from app.core.config import settings
+from app.core.db import db
+from app.models.models import Project, ProjectCreate, ProjectUpdate
+from app.repositories.projection import construct_partial, to_projection
+from app.services.markdown_renderer import render_body, content_hash, RENDERER_VERSION
+
+class ProjectRepository:
+    collection_name = "projects"
+
+    async def _to_projects(self, cursor, fields: Optional[FrozenSet[str]]) -> List[Project]:
+        if fields:
+            return [construct_partial(Project, document, fields) async for document in cursor]
+        return [Project.from_document(document) async for document in cursor]
+
+    async def _find_partial(self, query: dict, fields: FrozenSet[str]) -> Optional[Project]:
+        # Validator fields are always read so ETags still work; they are not returned
+        document = await db.db[self.collection_name].find_one(
+            query, to_projection(fields, "updated_at", "body_hash")
+        )
+        if document:
+            return construct_partial(Project, document, fields)
+        return None
+
+    @guarded("read")
+    async def get_all(self, skip: int = 0, limit: int = 100, fields: Optional[FrozenSet[str]] = None) -> List[Project]:
+        cursor = db.db[self.collection_name].find(
+            {}, to_projection(fields) if fields else None
+        ).sort("created_at", -1).skip(skip).limit(limit)
+        return await self._to_projects(cursor, fields)
+
+    @guarded("read")
+    async def get_by_id(self, id: str, fields: Optional[FrozenSet[str]] = None) -> Optional[Project]:
+        if not ObjectId.is_valid(id):
+            return None
+
+        if fields:
+            return await self._find_partial({"_id": ObjectId(id)}, fields)
+
+        document = await db.db[self.collection_name].find_one({"_id": ObjectId(id)})
+        if document:
+            return Project.from_document(document)
+        return None
+
+    @guarded("read")
+    async def get_all_documents(self, skip: int, limit: int, projection: dict) -> List[dict]:
+        """Raw documents for callers that convert them themselves (gRPC reads)."""
+        cursor = db.db[self.collection_name].find({}, projection).sort("created_at", -1).skip(skip).limit(limit)
+        return [document async for document in cursor]
+
+    @guarded("read")
+    async def get_document_by_id(self, id: str, projection: dict) -> Optional[dict]:
+        if not ObjectId.is_valid(id):
+            return None
+        return await db.db[self.collection_name].find_one({"_id": ObjectId(id)}, projection)
+
+    @guarded("read")
+    async def get_document_by_slug(self, slug: str, projection: dict) -> Optional[dict]:
+        return await db.db[self.collection_name].find_one({"slug": slug}, projection)
+
+    @guarded("read")
+    async def get_documents_by_user(self, user_id: str, skip: int, limit: int, projection: dict) -> List[dict]:
+        if not ObjectId.is_valid(user_id):
+            return []
+
+        cursor = db.db[self.collection_name].find(
+            {"user_id": ObjectId(user_id)}, projection
+        ).sort("created_at", -1).skip(skip).limit(limit)
+        return [document async for document in cursor]
+
+    @guarded("read")
+    async def get_validator(self, id: str) -> Optional[dict]:
+        """Fetch only the fields needed to build cache validators."""
+        if not ObjectId.is_valid(id):
+            return None
+
+        return await db.db[self.collection_name].find_one(
+            {"_id": ObjectId(id)}, {"updated_at": 1, "body_hash": 1}
+        )
+
+    @guarded("read")
+    async def get_validator_by_slug(self, slug: str) -> Optional[dict]:
+        return await db.db[self.collection_name].find_one(
+            {"slug": slug}, {"updated_at": 1, "body_hash": 1}
+        )
+
+    @guarded("read")
+    async def get_owner_id(self, id: str) -> Optional[str]:
+        if not ObjectId.is_valid(id):
+            return None
+
+        document = await db.db[self.collection_name].find_one({"_id": ObjectId(id)}, {"user_id": 1})
+        if document:
+            return str(document["user_id"])
+        return None
+
+    @guarded("read")
+    async def get_by_slug(self, slug: str, fields: Optional[FrozenSet[str]] = None) -> Optional[Project]:
+        if fields:
+            return await self._find_partial({"slug": slug}, fields)
+
+        document = await db.db[self.collection_name].find_one({"slug": slug})
+        if document:
+            return Project.from_document(document)
+        return None
+
+    @guarded("read")
+    async def get_by_user(
+        self,
+        user_id: str,
+        skip: int = 0,
+        limit: int = 100,
+        fields: Optional[FrozenSet[str]] = None
+    ) -> List[Project]:
+        if not ObjectId.is_valid(user_id):
+            return []
+
+        cursor = db.db[self.collection_name].find(
+            {"user_id": ObjectId(user_id)}, to_projection(fields) if fields else None
+        ).sort("created_at", -1).skip(skip).limit(limit)
+        return await self._to_projects(cursor, fields)
+
+    async def iter_export(self, since: Optional[datetime] = None) -> AsyncIterator[dict]:
+        """Stream raw project documents in _id order, optionally only those updated since a time."""
+        query = {"updated_at": {"$gte": since}} if since else {}
+        cursor = db.db[self.collection_name].find(
+            query, {"render_version": 0}, batch_size=settings.EXPORT_BATCH_SIZE
+        ).sort("_id", 1)
+        async for document in cursor:
+            yield document
+
+    @guarded("write")
+    async def create(self, project: ProjectCreate) -> Project:
+        existing_slug = await db.db[self.collection_name].find_one({"slug": project.slug}, {"_id": 1})
+        if existing_slug:
+            raise ValueError("Slug already exists")
+
+        project_dict = project.model_dump()
+        project_dict["user_id"] = ObjectId(project_dict["user_id"])
+
+        # Render once on write so reads never have to
+        now = datetime.utcnow()
+        project_data = {
+            **project_dict,
+            **render_body(project_dict["body"]),
+            "created_at": now,
+            "updated_at": now
+        }
+
+        try:
+            result = await db.db[self.collection_name].insert_one(project_data)
+        except DuplicateKeyError:
+            # Lost a race with a concurrent create; the unique index is the real check
+            raise ValueError("Slug already exists")
+
+        if result.inserted_id:
+            return await self.get_by_id(str(result.inserted_id))
+        return None
+
+    @guarded("write")
+    async def update(self, id: str, project: ProjectUpdate) -> Optional[Project]:
+        if not ObjectId.is_valid(id):
+            return None
+
+        # Filter not None values
+        update_data = { k: v for k, v in project.model_dump().items() if v is not None }
+
+        if update_data:
+            if "slug" in update_data:
+                existing = await db.db[self.collection_name].find_one(
+                    {"slug": update_data["slug"]}, {"_id": 1}
+                )
+                if existing and str(existing["_id"]) != id:
+                    raise ValueError("Slug already exists")
+
+            if "body" in update_data:
+                # Only re-render when the source (or renderer) actually changed
+                current = await db.db[self.collection_name].find_one(
+                    {"_id": ObjectId(id)}, {"body_hash": 1}
+                )
+                if current is None:
+                    return None
+                if current.get("body_hash") != content_hash(update_data["body"]):
+                    update_data.update(render_body(update_data["body"]))
+
+            update_data["updated_at"] = datetime.utcnow()
+
+            try:
+                await db.db[self.collection_name].update_one(
+                    {"_id": ObjectId(id)},
+                    {"$set": update_data}
+                )
+            except DuplicateKeyError:
+                raise ValueError("Slug already exists")
+
+        return await self.get_by_id(id)
+
+    @guarded("write")
+    async def delete(self, id: str) -> bool:
+        if not ObjectId.is_valid(id):
+            return False
+
+        result = await db.db[self.collection_name].delete_one({"_id": ObjectId(id)})
+        return result.deleted_count > 0
+
+    def find_stale_renders(self, batch_size: int = 100):
+        """Cursor over projects rendered by an older renderer version."""
+        return db.db[self.collection_name].find(
+            {"render_version": {"$ne": RENDERER_VERSION}},
+            {"body": 1, "user_id": 1}
+        ).batch_size(batch_size)
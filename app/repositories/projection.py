@@ -0,0 +1,56 @@
+"""Sparse fieldsets: client-selected fields translated into Mongo projections."""
+from typing import FrozenSet, Iterable, Optional, Type, TypeVar, Union
+
+from pydantic import BaseModel
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+# Fields clients may select; `id` is always returned
+USER_FIELDS: FrozenSet[str] = frozenset({
+    "id", "username", "email", "role", "created_at", "updated_at"
+})
+PROJECT_FIELDS: FrozenSet[str] = frozenset({
+    "id", "slug", "title", "body", "body_html", "body_excerpt",
+    "github_link", "user_id", "created_at", "updated_at"
+})
+
+def parse_fields(
+    fields: Optional[Union[str, Iterable[str]]],
+    allowed: FrozenSet[str]
+) -> Optional[FrozenSet[str]]:
+    """
+    Parse a `fields=` value (comma separated) or field mask paths.
+    Returns None when no selection was made; raises ValueError on unknown fields.
+    """
+    if fields is None:
+        return None
+    if isinstance(fields, str):
+        fields = fields.split(",")
+
+    selected = frozenset(field.strip() for field in fields if field.strip())
+    if not selected:
+        return None
+
+    unknown = selected - allowed
+    if unknown:
+        raise ValueError(
+            f"Unknown fields: {', '.join(sorted(unknown))}. "
+            f"Allowed fields: {', '.join(sorted(allowed))}"
+        )
+    return selected | {"id"}
+
+def to_projection(fields: Iterable[str], *extra: str) -> dict:
+    """Mongo projection for the selected fields plus any extra ones needed internally."""
+    projection = {"_id": 1}
+    for field in (*fields, *extra):
+        if field != "id":
+            projection[field] = 1
+    return projection
+
+def construct_partial(model: Type[ModelT], document: dict, fields: Iterable[str]) -> ModelT:
+    """
+    Build a model from a projected document without validation.
+    Only the selected fields are marked as set, so serializing with
+    `exclude_unset=True` emits exactly those.
+    """
+    return model.model_construct(_fields_set=set(fields), **document)
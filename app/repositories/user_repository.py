@@ -1,57 +1,168 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from bson import ObjectId
-from typing import List, Optional
+from typing import AsyncIterator, FrozenSet, List, Optional
 from datetime import datetime
 import hashlib
 import os
 
+from app.core.circuit_breaker import guarded
+from app.core.config import settings
 from app.core.db import db
+from app.core.deadline import check_deadline
+from app.core.metrics import PBKDF2_QUEUE_DEPTH
+from app.core.timing import timed
 from app.models.models import User, UserCreate, UserUpdate, UserInDB
+from app.repositories.projection import construct_partial, to_projection
+from app.repositories.user_stats_repository import EMPTY_STATS
+
+# pbkdf2_hmac releases the GIL, so hashing on threads keeps the event loop responsive
+pbkdf2_executor = ThreadPoolExecutor(max_workers=settings.PBKDF2_WORKERS, thread_name_prefix="pbkdf2")
+
+def _pbkdf2(password: str, salt: bytes) -> bytes:
+    PBKDF2_QUEUE_DEPTH.dec()
+    return hashlib.pbkdf2_hmac('sha256', password.encode('utf-8'), salt, 100000)
+
+def _dequeue_if_cancelled(future) -> None:
+    if future.cancelled():
+        PBKDF2_QUEUE_DEPTH.dec()
 
 class UserRepository:
     collection_name = "users"
     
-    def _hash_password(self, password: str) -> str:
+    async def _derive_key(self, password: str, salt: bytes) -> bytes:
+        # Hashing is the costliest step of a request; skip it once the caller gave up
+        check_deadline()
+        PBKDF2_QUEUE_DEPTH.inc()
+        future = pbkdf2_executor.submit(_pbkdf2, password, salt)
+        future.add_done_callback(_dequeue_if_cancelled)
+        with timed("pbkdf2"):
+            return await asyncio.wrap_future(future)
+    
+    async def _hash_password(self, password: str) -> str:
         salt = os.urandom(32)
-        key = hashlib.pbkdf2_hmac('sha256', password.encode('utf-8'), salt, 100000)
+        key = await self._derive_key(password, salt)
         return salt.hex() + ':' + key.hex()
     
-    def _verify_password(self, stored_password: str, provided_password: str) -> bool:
+    async def _verify_password(self, stored_password: str, provided_password: str) -> bool:
         salt_hex, key_hex = stored_password.split(':')
         salt = bytes.fromhex(salt_hex)
         stored_key = bytes.fromhex(key_hex)
-        new_key = hashlib.pbkdf2_hmac('sha256', provided_password.encode('utf-8'), salt, 100000)
+        new_key = await self._derive_key(provided_password, salt)
         return new_key == stored_key
     
-    async def get_all(self, skip: int = 0, limit: int = 100) -> List[User]:
-        users = []
-        cursor = db.db[self.collection_name].find().skip(skip).limit(limit)
-        async for document in cursor:
-            user_dict = { k: v for k, v in document.items() if k != 'password_hash' }
-            users.append(User(**user_dict))
-        return users
+    @guarded("read")
+    async def get_all(self, skip: int = 0, limit: int = 100, fields: Optional[FrozenSet[str]] = None) -> List[User]:
+        if fields:
+            cursor = db.db[self.collection_name].find({}, to_projection(fields)).skip(skip).limit(limit)
+            return [construct_partial(User, document, fields) async for document in cursor]
+        
+        cursor = db.db[self.collection_name].find({}, {"password_hash": 0}).skip(skip).limit(limit)
+        return [User.from_document(document) async for document in cursor]
     
-    async def get_by_id(self, id: str) -> Optional[User]:
+    @guarded("read")
+    async def get_by_id(self, id: str, fields: Optional[FrozenSet[str]] = None) -> Optional[User]:
         if not ObjectId.is_valid(id):
             return None
         
-        document = await db.db[self.collection_name].find_one({"_id": ObjectId(id)})
+        if fields:
+            return await self._find_partial({"_id": ObjectId(id)}, fields)
+        
+        return await self._find_public({"_id": ObjectId(id)})
+    
+    @guarded("read")
+    async def get_all_documents(self, skip: int, limit: int, projection: dict) -> List[dict]:
+        """Raw documents for callers that convert them themselves (gRPC reads)."""
+        cursor = db.db[self.collection_name].find({}, projection).skip(skip).limit(limit)
+        return [document async for document in cursor]
+    
+    @guarded("read")
+    async def get_document_by_id(self, id: str, projection: dict) -> Optional[dict]:
+        if not ObjectId.is_valid(id):
+            return None
+        return await db.db[self.collection_name].find_one({"_id": ObjectId(id)}, projection)
+    
+    @guarded("read")
+    async def get_document_by_username(self, username: str, projection: dict) -> Optional[dict]:
+        return await db.db[self.collection_name].find_one({"username": username}, projection)
+    
+    @guarded("read")
+    async def get_public_by_username(self, username: str) -> Optional[User]:
+        return await self._find_public({"username": username})
+    
+    @guarded("read")
+    async def get_public_by_email(self, email: str) -> Optional[User]:
+        return await self._find_public({"email": email})
+    
+    async def _find_public(self, query: dict) -> Optional[User]:
+        document = await db.db[self.collection_name].find_one(query, {"password_hash": 0})
         if document:
-            user_dict = { k: v for k, v in document.items() if k != 'password_hash' }
-            return User(**user_dict)
+            return User.from_document(document)
         return None
     
+    @guarded("read")
+    async def get_partial_by_username(self, username: str, fields: FrozenSet[str]) -> Optional[User]:
+        return await self._find_partial({"username": username}, fields)
+    
+    async def _find_partial(self, query: dict, fields: FrozenSet[str]) -> Optional[User]:
+        # Validator fields are always read so ETags still work; they are not returned
+        document = await db.db[self.collection_name].find_one(
+            query, to_projection(fields, "created_at", "updated_at")
+        )
+        if document:
+            return construct_partial(User, document, fields)
+        return None
+    
+    @guarded("read")
+    async def get_validator(self, id: str) -> Optional[dict]:
+        """Fetch only the fields needed to build cache validators."""
+        if not ObjectId.is_valid(id):
+            return None
+        
+        return await db.db[self.collection_name].find_one(
+            {"_id": ObjectId(id)}, {"created_at": 1, "updated_at": 1}
+        )
+    
+    @guarded("read")
+    async def get_validator_by_username(self, username: str) -> Optional[dict]:
+        return await db.db[self.collection_name].find_one(
+            {"username": username}, {"created_at": 1, "updated_at": 1}
+        )
+    
+    async def iter_export(self, since: Optional[datetime] = None) -> AsyncIterator[dict]:
+        """
+        Stream raw user documents (without password hashes) in _id order.
+        With `since`, only users changed at or after it; users that were never
+        updated fall back to their creation time.
+        """
+        query = {}
+        if since:
+            query = {"$or": [
+                {"updated_at": {"$gte": since}},
+                {"updated_at": None, "created_at": {"$gte": since}}
+            ]}
+        
+        cursor = db.db[self.collection_name].find(
+            query, {"password_hash": 0}, batch_size=settings.EXPORT_BATCH_SIZE
+        ).sort("_id", 1)
+        async for document in cursor:
+            yield document
+    
+    @guarded("read")
     async def get_by_email(self, email: str) -> Optional[UserInDB]:
         document = await db.db[self.collection_name].find_one({ "email": email })
         if document:
-            return UserInDB(**document)
+            return UserInDB.from_document(document)
         return None
     
+    @guarded("read")
     async def get_by_username(self, username: str) -> Optional[UserInDB]:
         document = await db.db[self.collection_name].find_one({"username": username})
         if document:
-            return UserInDB(**document)
+            return UserInDB.from_document(document)
         return None
     
+    @guarded("write")
     async def create(self, user: UserCreate) -> User:
         existing_username = await self.get_by_username(user.username)
         if existing_username:
@@ -64,12 +175,15 @@ class UserRepository:
         # Create user with hashed password
         user_dict = user.dict()
         password = user_dict.pop("password")
-        password_hash = self._hash_password(password)
+        password_hash = await self._hash_password(password)
         
+        now = datetime.utcnow()
         user_data = {
             **user_dict,
             "password_hash": password_hash,
-            "created_at": datetime.utcnow()
+            "created_at": now,
+            "updated_at": now,
+            "stats": dict(EMPTY_STATS)
         }
         
         result = await db.db[self.collection_name].insert_one(user_data)
@@ -78,17 +192,18 @@ class UserRepository:
             return await self.get_by_id(str(result.inserted_id))
         return None
     
+    @guarded("write")
     async def update(self, id: str, user: UserUpdate) -> Optional[User]:
         if not ObjectId.is_valid(id):
             return None
         
         # Filter not None values
-        update_data = { k: v for k, v in user.model_dump().items if v is not None }
+        update_data = { k: v for k, v in user.model_dump().items() if v is not None }
         
         if update_data:
             if "password" in update_data:
                 password = update_data.pop("password")
-                update_data["password_hash"] = self._hash_password(password)
+                update_data["password_hash"] = await self._hash_password(password)
                 
             if "username" in update_data:
                 existing = await self.get_by_username(update_data["username"])
@@ -99,6 +214,8 @@ class UserRepository:
                 existing = await self.get_by_email(update_data["email"])
                 if existing and str(existing.id) != id:
                     raise ValueError("Email already exists")
+            
+            update_data["updated_at"] = datetime.utcnow()
                 
             await db.db[self.collection_name].update_one(
                 {"_id": ObjectId(id)},
@@ -107,21 +224,22 @@ class UserRepository:
             
         return await self.get_by_id(id)
     
+    @guarded("write")
     async def delete(self, id: str) -> bool:
         if not ObjectId.is_valid(id):
             return False
         
         result = await db.db[self.collection_name].delete_one({"_id": ObjectId(id)})
-        return result.delete_count > 0
+        return result.deleted_count > 0
     
+    @guarded("read")
     async def authenticate(self, username: str, password: str) -> Optional[User]:
         user = await self.get_by_username(username)
         if not user:
             return None
         
-        if not self._verify_password(user.password_hash, password):
+        if not await self._verify_password(user.password_hash, password):
             return None
         
         # Return user without password_hash
-        user_dict = { k: v for k, v in user.model_dump().items() if k != 'password_hash' }
-        return User(**user_dict)
\ No newline at end of file
+        return User.from_document(user.model_dump(exclude={"password_hash"}))
\ No newline at end of file
@@ -0,0 +1,174 @@
+from bson import ObjectId
+from datetime import datetime
+from typing import Optional
+
+from pymongo import UpdateOne
+
+from app.core.circuit_breaker import guarded
+from app.core.db import db
+from app.models.models import UserProfile
+
+EMPTY_STATS = {"project_count": 0, "image_count": 0, "latest_project": None}
+
+class UserStatsRepository:
+    """
+    Denormalized per-user counters kept in the `stats` field of user documents.
+    Writers adjust them with $inc; `reconcile` recomputes them to fix any drift.
+    Every write also stamps `portfolio_changed_at`, which portfolio caches key on.
+    """
+    collection_name = "users"
+
+    def _latest_project(self, project) -> dict:
+        return {
+            "_id": ObjectId(project.id),
+            "slug": project.slug,
+            "title": project.title,
+            "created_at": project.created_at
+        }
+
+    @guarded("read")
+    async def get_profile_by_username(self, username: str) -> Optional[UserProfile]:
+        document = await db.db[self.collection_name].find_one(
+            {"username": username}, {"password_hash": 0}
+        )
+        if document:
+            return UserProfile.from_document(document)
+        return None
+
+    @guarded("write")
+    async def record_project_created(self, project) -> None:
+        await db.db[self.collection_name].update_one(
+            {"_id": ObjectId(project.user_id)},
+            {
+                "$inc": {"stats.project_count": 1},
+                "$set": {
+                    "stats.latest_project": self._latest_project(project),
+                    "portfolio_changed_at": datetime.utcnow()
+                }
+            }
+        )
+
+    @guarded("write")
+    async def touch_portfolio(self, user_id: str) -> None:
+        if not ObjectId.is_valid(str(user_id)):
+            return
+        await db.db[self.collection_name].update_one(
+            {"_id": ObjectId(user_id)},
+            {"$set": {"portfolio_changed_at": datetime.utcnow()}}
+        )
+
+    @guarded("write")
+    async def touch_portfolios(self, user_ids) -> None:
+        """Stamp several owners' portfolios as changed, e.g. after a bulk re-render."""
+        ids = [ObjectId(user_id) for user_id in set(map(str, user_ids)) if ObjectId.is_valid(user_id)]
+        if ids:
+            await db.db[self.collection_name].update_many(
+                {"_id": {"$in": ids}},
+                {"$set": {"portfolio_changed_at": datetime.utcnow()}}
+            )
+
+    @guarded("write")
+    async def record_project_updated(self, project) -> None:
+        await self.touch_portfolio(project.user_id)
+        # Only touches the pointer when this project is the latest one
+        await db.db[self.collection_name].update_one(
+            {"_id": ObjectId(project.user_id), "stats.latest_project._id": ObjectId(project.id)},
+            {"$set": {"stats.latest_project": self._latest_project(project)}}
+        )
+
+    @guarded("write")
+    async def record_project_deleted(self, project, image_count: int = 0) -> None:
+        user_id = ObjectId(project.user_id)
+        await db.db[self.collection_name].update_one(
+            {"_id": user_id},
+            {
+                "$inc": {"stats.project_count": -1, "stats.image_count": -image_count},
+                "$set": {"portfolio_changed_at": datetime.utcnow()}
+            }
+        )
+
+        # Rare path: the latest project went away, point at the next newest one
+        result = await db.db[self.collection_name].update_one(
+            {"_id": user_id, "stats.latest_project._id": ObjectId(project.id)},
+            {"$set": {"stats.latest_project": None}}
+        )
+        if result.modified_count:
+            latest = await db.db.projects.find_one(
+                {"user_id": user_id},
+                {"slug": 1, "title": 1, "created_at": 1},
+                sort=[("created_at", -1)]
+            )
+            if latest:
+                await db.db[self.collection_name].update_one(
+                    {"_id": user_id, "stats.latest_project": None},
+                    {"$set": {"stats.latest_project": latest}}
+                )
+
+    @guarded("write")
+    async def increment_images(self, user_id: str, amount: int = 1) -> None:
+        if not ObjectId.is_valid(user_id):
+            return
+        await db.db[self.collection_name].update_one(
+            {"_id": ObjectId(user_id)},
+            {
+                "$inc": {"stats.image_count": amount},
+                "$set": {"portfolio_changed_at": datetime.utcnow()}
+            }
+        )
+
+    async def reconcile(self, batch_size: int = 500) -> int:
+        """Recompute every user's stats from the projects and images collections."""
+        stats = {}
+
+        project_pipeline = [
+            {"$sort": {"created_at": -1}},
+            {"$group": {
+                "_id": "$user_id",
+                "project_count": {"$sum": 1},
+                "latest_project": {"$first": {
+                    "_id": "$_id",
+                    "slug": "$slug",
+                    "title": "$title",
+                    "created_at": "$created_at"
+                }}
+            }}
+        ]
+        async for row in db.db.projects.aggregate(project_pipeline, allowDiskUse=True):
+            stats[row["_id"]] = {
+                **EMPTY_STATS,
+                "project_count": row["project_count"],
+                "latest_project": row["latest_project"]
+            }
+
+        image_pipeline = [
+            {"$lookup": {
+                "from": "projects",
+                "localField": "project_id",
+                "foreignField": "_id",
+                "as": "project"
+            }},
+            {"$unwind": "$project"},
+            {"$group": {"_id": "$project.user_id", "image_count": {"$sum": 1}}}
+        ]
+        async for row in db.db.project_images.aggregate(image_pipeline, allowDiskUse=True):
+            stats.setdefault(row["_id"], dict(EMPTY_STATS))["image_count"] = row["image_count"]
+
+        updated = 0
+        operations = []
+        now = datetime.utcnow()
+        async for user in db.db[self.collection_name].find({}, {"stats": 1}):
+            expected = stats.get(user["_id"], EMPTY_STATS)
+            if user.get("stats") != expected:
+                operations.append(UpdateOne(
+                    {"_id": user["_id"]},
+                    {"$set": {"stats": expected, "portfolio_changed_at": now}}
+                ))
+            if len(operations) >= batch_size:
+                await db.db[self.collection_name].bulk_write(operations, ordered=False)
+                updated += len(operations)
+                operations = []
+        if operations:
+            await db.db[self.collection_name].bulk_write(operations, ordered=False)
+            updated += len(operations)
+
+        return updated
@@ -0,0 +1,68 @@
+import hashlib
+import html
+import re
+from typing import Any, Dict
+
+from app.core.config import settings
+
+# Bump whenever the renderer output changes (extensions, markdown upgrade, ...)
+# so that the bulk re-render command picks up every stored project.
+RENDERER_VERSION = 2
+MARKDOWN_EXTENSIONS = ["fenced_code", "tables", "sane_lists"]
+
+# What markdown and MARKDOWN_EXTENSIONS produce; anything else in a body (raw
+# <script>, event handlers, javascript: links) is dropped from the stored HTML
+ALLOWED_TAGS = {
+    "h1", "h2", "h3", "h4", "h5", "h6", "p", "br", "hr", "blockquote",
+    "strong", "em", "code", "pre", "a", "img", "ul", "ol", "li",
+    "table", "thead", "tbody", "tr", "th", "td",
+}
+ALLOWED_ATTRIBUTES = {
+    "a": {"href", "title"},
+    "img": {"src", "alt", "title"},
+    "code": {"class"},
+    "th": {"style"},
+    "td": {"style"},
+}
+ALLOWED_URL_SCHEMES = {"http", "https", "mailto"}
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+def content_hash(body: str) -> str:
+    """Hash of the markdown source and renderer version."""
+    digest = hashlib.sha256()
+    digest.update(str(RENDERER_VERSION).encode('utf-8'))
+    digest.update(b'\x00')
+    digest.update(body.encode('utf-8'))
+    return digest.hexdigest()
+
+def make_excerpt(body_html: str, length: int = None) -> str:
+    """Plain-text excerpt of rendered HTML, cut on a word boundary."""
+    length = length or settings.PROJECT_EXCERPT_LENGTH
+    text = html.unescape(_TAG_RE.sub(" ", body_html))
+    text = _WHITESPACE_RE.sub(" ", text).strip()
+    if len(text) <= length:
+        return text
+    cut = text[:length].rsplit(" ", 1)[0]
+    return cut.rstrip(".,;:") + "…"
+
+def render_body(body: str) -> Dict[str, Any]:
+    """Render a project body into the fields stored next to it."""
+    # Imported on first use; most processes only ever read rendered bodies
+    import markdown
+    import nh3
+    body_html = nh3.clean(
+        markdown.markdown(body, extensions=MARKDOWN_EXTENSIONS),
+        tags=ALLOWED_TAGS,
+        attributes=ALLOWED_ATTRIBUTES,
+        url_schemes=ALLOWED_URL_SCHEMES,
+        # Column alignment from the tables extension
+        filter_style_properties={"text-align"}
+    )
+    return {
+        "body_html": body_html,
+        "body_excerpt": make_excerpt(body_html),
+        "body_hash": content_hash(body),
+        "render_version": RENDERER_VERSION
+    }
@@ -0,0 +1,32 @@
+from typing import Optional
+
+from app.core.cache import LRUCache
+from app.core.config import settings
+from app.models.models import UserPortfolio
+from app.repositories.portfolio_repository import PortfolioRepository
+
+# Shared by every PortfolioService instance (REST and gRPC) in this process.
+# Entries are keyed by username and validated against the user's change stamps.
+portfolio_cache = LRUCache(max_entries=settings.PORTFOLIO_CACHE_SIZE)
+
+class PortfolioService:
+    def __init__(self):
+        self.repository = PortfolioRepository()
+
+    async def get_portfolio(self, username: str, use_cache: bool = True) -> Optional[UserPortfolio]:
+        if not use_cache or settings.PORTFOLIO_CACHE_SIZE <= 0:
+            return await self.repository.get_by_username(username)
+
+        version = await self.repository.get_version(username)
+        if version is None:
+            portfolio_cache.delete(username)
+            return None
+
+        cached = portfolio_cache.get(username)
+        if cached and cached[0] == version:
+            return cached[1]
+
+        portfolio = await self.repository.get_by_username(username)
+        if portfolio:
+            portfolio_cache.set(username, (version, portfolio))
+        return portfolio
@@ -0,0 +1,90 @@
+from typing import AsyncIterator, List, Optional
+
+from app.core.config import settings
+from app.core.response_cache import image_tag, project_tag, purge_tags, user_tag
+from app.models.models import ProjectImage, ProjectImageCreate, ProjectImageUpdate
+from app.repositories.project_image_repository import ProjectImageRepository
+from app.repositories.project_repository import ProjectRepository
+from app.repositories.user_stats_repository import UserStatsRepository
+
+class ProjectImageService:
+    def __init__(self):
+        self.repository = ProjectImageRepository()
+        self.project_repository = ProjectRepository()
+        self.stats_repository = UserStatsRepository()
+
+    async def _count_image(self, project_id: str, amount: int) -> None:
+        owner_id = await self.project_repository.get_owner_id(str(project_id))
+        if owner_id:
+            await self.stats_repository.increment_images(owner_id, amount)
+            purge_tags(user_tag(owner_id))
+        purge_tags(project_tag(project_id))
+
+    async def get_images_by_project(self, project_id: str) -> List[ProjectImage]:
+        return await self.repository.get_by_project(project_id)
+
+    async def get_image(self, id: str) -> Optional[ProjectImage]:
+        return await self.repository.get_by_id(id)
+
+    async def create_image(self, image: ProjectImageCreate) -> ProjectImage:
+        created = await self.repository.create(image)
+        if created:
+            await self._count_image(created.project_id, 1)
+        return created
+
+    async def upload_image(
+        self,
+        project_id: str,
+        chunks: AsyncIterator[bytes],
+        content_type: str,
+        filename: str
+    ) -> ProjectImage:
+        if not content_type or not content_type.startswith("image/"):
+            raise ValueError("Only image content types can be uploaded")
+        uploaded = await self.repository.upload(project_id, chunks, content_type, filename)
+        await self._count_image(project_id, 1)
+        return uploaded
+
+    async def open_image(self, image: ProjectImage):
+        return await self.repository.open_file(image)
+
+    async def iter_image(
+        self,
+        grid_out,
+        start: int = 0,
+        end: Optional[int] = None,
+        chunk_size: Optional[int] = None
+    ) -> AsyncIterator[bytes]:
+        """Yield the bytes of an open image in [start, end], one chunk at a time."""
+        chunk_size = chunk_size or settings.IMAGE_STREAM_CHUNK_BYTES
+        end = grid_out.length - 1 if end is None else end
+        remaining = end - start + 1
+
+        grid_out.seek(start)
+        while remaining > 0:
+            data = await grid_out.read(min(chunk_size, remaining))
+            if not data:
+                break
+            remaining -= len(data)
+            yield data
+
+    async def update_image(self, id: str, image: ProjectImageUpdate) -> Optional[ProjectImage]:
+        updated = await self.repository.update(id, image)
+        if updated:
+            owner_id = await self.project_repository.get_owner_id(str(updated.project_id))
+            if owner_id:
+                await self.stats_repository.touch_portfolio(owner_id)
+                purge_tags(user_tag(owner_id))
+            purge_tags(image_tag(id), project_tag(updated.project_id))
+        return updated
+
+    async def delete_image(self, id: str) -> bool:
+        image = await self.repository.get_by_id(id)
+        if not image:
+            return False
+
+        deleted = await self.repository.delete(id)
+        if deleted:
+            await self._count_image(image.project_id, -1)
+            purge_tags(image_tag(id))
+        return deleted
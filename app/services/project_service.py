@@ -0,0 +1,126 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import AsyncIterator, FrozenSet, List, Optional
+
+from pymongo import UpdateOne
+
+from app.core.config import settings
+from app.core.db import db
+from app.core.response_cache import PROJECTS_TAG, clear_caches, project_tag, purge_tags, user_tag
+from app.models.models import Project, ProjectCreate, ProjectUpdate
+from app.repositories.project_repository import ProjectRepository
+from app.repositories.project_image_repository import ProjectImageRepository
+from app.repositories.user_stats_repository import UserStatsRepository
+from app.services.markdown_renderer import render_body
+
+class ProjectService:
+    def __init__(self):
+        self.repository = ProjectRepository()
+        self.image_repository = ProjectImageRepository()
+        self.stats_repository = UserStatsRepository()
+
+    async def get_projects(self, skip: int = 0, limit: int = 100, fields: Optional[FrozenSet[str]] = None) -> List[Project]:
+        return await self.repository.get_all(skip, limit, fields)
+
+    async def get_project_documents(self, skip: int, limit: int, projection: dict) -> List[dict]:
+        return await self.repository.get_all_documents(skip, limit, projection)
+
+    async def get_project_document(self, id: str, projection: dict) -> Optional[dict]:
+        return await self.repository.get_document_by_id(id, projection)
+
+    async def get_project_document_by_slug(self, slug: str, projection: dict) -> Optional[dict]:
+        return await self.repository.get_document_by_slug(slug, projection)
+
+    async def get_project_documents_by_user(self, user_id: str, skip: int, limit: int, projection: dict) -> List[dict]:
+        return await self.repository.get_documents_by_user(user_id, skip, limit, projection)
+
+    def export_projects(self, since: Optional[datetime] = None) -> AsyncIterator[dict]:
+        return self.repository.iter_export(since)
+
+    async def get_project(self, id: str, fields: Optional[FrozenSet[str]] = None) -> Optional[Project]:
+        return await self.repository.get_by_id(id, fields)
+
+    async def get_project_validator(self, id: str) -> Optional[dict]:
+        return await self.repository.get_validator(id)
+
+    async def get_project_validator_by_slug(self, slug: str) -> Optional[dict]:
+        return await self.repository.get_validator_by_slug(slug)
+
+    async def get_project_by_slug(self, slug: str, fields: Optional[FrozenSet[str]] = None) -> Optional[Project]:
+        return await self.repository.get_by_slug(slug, fields)
+
+    async def get_projects_by_user(
+        self,
+        user_id: str,
+        skip: int = 0,
+        limit: int = 100,
+        fields: Optional[FrozenSet[str]] = None
+    ) -> List[Project]:
+        return await self.repository.get_by_user(user_id, skip, limit, fields)
+
+    async def create_project(self, project: ProjectCreate) -> Project:
+        created = await self.repository.create(project)
+        if created:
+            await self.stats_repository.record_project_created(created)
+            purge_tags(PROJECTS_TAG, user_tag(created.user_id))
+        return created
+
+    async def update_project(self, id: str, project: ProjectUpdate) -> Optional[Project]:
+        updated = await self.repository.update(id, project)
+        if updated:
+            await self.stats_repository.record_project_updated(updated)
+            purge_tags(PROJECTS_TAG, project_tag(id), user_tag(updated.user_id))
+        return updated
+
+    async def delete_project(self, id: str) -> bool:
+        project = await self.repository.get_by_id(id)
+        if not project:
+            return False
+
+        image_count = await self.image_repository.delete_by_project(id)
+        deleted = await self.repository.delete(id)
+        if deleted:
+            await self.stats_repository.record_project_deleted(project, image_count)
+            purge_tags(PROJECTS_TAG, project_tag(id), user_tag(project.user_id))
+        return deleted
+
+    async def rerender_stale(self, batch_size: int = 100, workers: Optional[int] = None) -> int:
+        """
+        Re-render every project whose stored HTML came from an older renderer.
+        Rendering is fanned out over a process pool, one batch at a time.
+        """
+        loop = asyncio.get_running_loop()
+        collection = db.db[self.repository.collection_name]
+        rendered = 0
+
+        with ProcessPoolExecutor(max_workers=workers or settings.RENDER_WORKERS) as pool:
+            batch = []
+            async for document in self.repository.find_stale_renders(batch_size):
+                batch.append(document)
+                if len(batch) >= batch_size:
+                    rendered += await self._rerender_batch(loop, pool, collection, batch)
+                    batch = []
+            if batch:
+                rendered += await self._rerender_batch(loop, pool, collection, batch)
+
+        if rendered:
+            clear_caches()
+        return rendered
+
+    async def _rerender_batch(self, loop, pool, collection, documents) -> int:
+        results = await asyncio.gather(*[
+            loop.run_in_executor(pool, render_body, document.get("body", ""))
+            for document in documents
+        ])
+        # New HTML is a new representation: move the validators that ETags and
+        # portfolio caches key on, so running servers stop answering 304 for it
+        now = datetime.utcnow()
+        await collection.bulk_write([
+            UpdateOne({"_id": document["_id"]}, {"$set": {**fields, "updated_at": now}})
+            for document, fields in zip(documents, results)
+        ], ordered=False)
+        await self.stats_repository.touch_portfolios(
+            document["user_id"] for document in documents if document.get("user_id")
+        )
+        return len(documents)
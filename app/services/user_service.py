@@ -1,42 +1,72 @@
-from typing import List, Optional
+from datetime import datetime
+from typing import AsyncIterator, FrozenSet, List, Optional
 
-from app.models.models import User, UserCreate, UserUpdate
+from app.core.response_cache import clear_caches, purge_tags, user_tag
+from app.models.models import User, UserCreate, UserUpdate, UserProfile
 from app.repositories.user_repository import UserRepository
+from app.repositories.user_stats_repository import UserStatsRepository
 
 class UserServices:
     def __init__(self):
         self.repository = UserRepository()
+        self.stats_repository = UserStatsRepository()
         
-    async def get_users(self, skip: int = 0, limit: int = 100) -> List[User]:
-        return await self.repository.get_all(skip, limit)
+    async def get_users(self, skip: int = 0, limit: int = 100, fields: Optional[FrozenSet[str]] = None) -> List[User]:
+        return await self.repository.get_all(skip, limit, fields)
     
-    async def get_user(self, id: str) -> Optional[User]:
-        return await self.repository.get_by_id(id)
+    async def get_user_documents(self, skip: int, limit: int, projection: dict) -> List[dict]:
+        return await self.repository.get_all_documents(skip, limit, projection)
     
-    async def get_user_by_username(self, username: str) -> Optional[User]:
-        user = await self.repository.get_by_username(username)
+    async def get_user_document(self, id: str, projection: dict) -> Optional[dict]:
+        return await self.repository.get_document_by_id(id, projection)
+    
+    async def get_user_document_by_username(self, username: str, projection: dict) -> Optional[dict]:
+        return await self.repository.get_document_by_username(username, projection)
+    
+    def export_users(self, since: Optional[datetime] = None) -> AsyncIterator[dict]:
+        return self.repository.iter_export(since)
+    
+    async def get_user(self, id: str, fields: Optional[FrozenSet[str]] = None) -> Optional[User]:
+        return await self.repository.get_by_id(id, fields)
+    
+    async def get_user_validator(self, id: str) -> Optional[dict]:
+        return await self.repository.get_validator(id)
+    
+    async def get_user_validator_by_username(self, username: str) -> Optional[dict]:
+        return await self.repository.get_validator_by_username(username)
+    
+    async def get_user_by_username(self, username: str, fields: Optional[FrozenSet[str]] = None) -> Optional[User]:
+        if fields:
+            return await self.repository.get_partial_by_username(username, fields)
         
-        if user:
-            user_dict = { k: v for k, v in user.dict().items() if k != 'password_hash' }
-            return User(**user_dict)
-        return None
+        return await self.repository.get_public_by_username(username)
+    
+    async def get_user_profile(self, username: str) -> Optional[UserProfile]:
+        return await self.stats_repository.get_profile_by_username(username)
+    
+    async def reconcile_user_stats(self) -> int:
+        updated = await self.stats_repository.reconcile()
+        if updated:
+            clear_caches()
+        return updated
     
     async def get_user_by_email(self, email: str) -> Optional[User]:
-        user = await self.repository.get_by_email(email)
-        if user:
-            # Convert to User model (without password_hash)
-            user_dict = {k: v for k, v in user.dict().items() if k != 'password_hash'}
-            return User(**user_dict)
-        return None
+        return await self.repository.get_public_by_email(email)
     
     async def create_user(self, user: UserCreate) -> User:
         return await self.repository.create(user)
     
     async def update_user(self, id: str, user: UserUpdate) -> Optional[User]:
-        return await self.repository.update(id, user)
+        updated = await self.repository.update(id, user)
+        if updated:
+            purge_tags(user_tag(id))
+        return updated
     
     async def delete_user(self, id: str) -> bool:
-        return await self.repository.delete(id)
+        deleted = await self.repository.delete(id)
+        if deleted:
+            purge_tags(user_tag(id))
+        return deleted
     
     async def authenticate_user(self, username: str, password: str) -> Optional[User]:
         return await self.repository.authenticate(username, password)
\ No newline at end of file
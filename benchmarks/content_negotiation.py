@@ -0,0 +1,44 @@
+"""
+Payload size and encode/decode time of a 100-user page per negotiated media type.
+
+Usage:
+    python -m benchmarks.content_negotiation [--rows 100] [--repeat 2000]
+"""
+import argparse
+import timeit
+
+import msgpack
+import orjson
+
+import app.protos.service_pb2 as service_pb2
+from app.api.converters import to_proto_bytes
+from app.api.rest.responses import dump_json, dump_msgpack
+from app.models.models import User
+from benchmarks.serialization import make_rows
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=2000)
+    args = parser.parse_args()
+
+    users = [User(**row) for row in make_rows(args.rows)]
+    cases = [
+        ("application/json", lambda: dump_json(users), orjson.loads),
+        ("application/msgpack", lambda: dump_msgpack(users), msgpack.unpackb),
+        ("application/x-protobuf", lambda: to_proto_bytes(User, True, users),
+         service_pb2.GetUsersResponse.FromString),
+    ]
+
+    print(f"{args.rows}-user page, best of 5 x {args.repeat} runs")
+    for media_type, encode, decode in cases:
+        body = encode()
+        encode_time = min(timeit.repeat(encode, number=args.repeat, repeat=5)) / args.repeat
+        decode_time = min(timeit.repeat(lambda: decode(body), number=args.repeat, repeat=5)) / args.repeat
+        print(
+            f"  {media_type:<24} {len(body):7d} bytes"
+            f"  encode {encode_time * 1e6:8.1f} us  decode {decode_time * 1e6:8.1f} us"
+        )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Server CPU of one gRPC GetUsers(limit=100) call, from BSON reply to serialized response.
+
+Compares the model paths (decode whole documents, drop password_hash, build a
+pydantic User per document, then user_to_proto) with the direct path (decode
+only the projected fields and fill the messages straight from the documents).
+Network, MongoDB and gRPC framing costs are the same for both and left out.
+
+Usage:
+    python -m benchmarks.grpc_get_users [--rows 100] [--repeat 500]
+"""
+import argparse
+import time
+from datetime import datetime, timedelta
+
+import bson
+from bson import ObjectId
+
+import app.protos.service_pb2 as service_pb2
+from app.api.converters import USER_DOCUMENT_PROJECTION, user_document_to_proto, user_to_proto
+from app.models.models import User
+
+def make_documents(rows: int) -> list:
+    """Users as stored, including the fields gRPC never returns."""
+    now = datetime.utcnow().replace(microsecond=0)
+    return [
+        {
+            "_id": ObjectId(),
+            "username": f"user{i}",
+            "email": f"user{i}@example.com",
+            "role": "user",
+            "password_hash": "ab" * 32 + ":" + "cd" * 32,
+            "created_at": now - timedelta(minutes=i),
+            "updated_at": now,
+            "stats": {
+                "project_count": 3,
+                "image_count": 7,
+                "latest_project": {"_id": ObjectId(), "slug": f"project-{i}", "title": "Project", "created_at": now}
+            },
+            "portfolio_changed_at": now
+        }
+        for i in range(rows)
+    ]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=500)
+    args = parser.parse_args()
+
+    documents = make_documents(args.rows)
+    # What the server reads off the wire with and without the projection
+    full_reply = b"".join(bson.encode(document) for document in documents)
+    projected_reply = b"".join(
+        bson.encode({key: value for key, value in document.items() if key in USER_DOCUMENT_PROJECTION})
+        for document in documents
+    )
+
+    def validated_models():
+        users = []
+        for document in bson.decode_all(full_reply):
+            user_dict = {k: v for k, v in document.items() if k != 'password_hash'}
+            users.append(User(**user_dict))
+        return service_pb2.GetUsersResponse(users=[user_to_proto(user) for user in users]).SerializeToString()
+
+    def trusted_models():
+        users = [User.from_document(document) for document in bson.decode_all(full_reply)]
+        return service_pb2.GetUsersResponse(users=[user_to_proto(user) for user in users]).SerializeToString()
+
+    def direct():
+        return service_pb2.GetUsersResponse(
+            users=[user_document_to_proto(document) for document in bson.decode_all(projected_reply)]
+        ).SerializeToString()
+
+    assert validated_models() == trusted_models() == direct()
+
+    cases = [
+        ("pydantic User (validated)", validated_models),
+        ("pydantic User (from_document)", trusted_models),
+        ("BSON -> protobuf", direct),
+    ]
+    print(f"GetUsers(limit={args.rows}), server CPU per call, best of 5 x {args.repeat} calls")
+    print(f"  reply size: {len(full_reply)} bytes full, {len(projected_reply)} bytes projected")
+    baseline = None
+    for name, func in cases:
+        timings = []
+        for _ in range(5):
+            started_at = time.process_time()
+            for _ in range(args.repeat):
+                func()
+            timings.append((time.process_time() - started_at) / args.repeat)
+        best = min(timings)
+        baseline = baseline or best
+        print(f"  {name:<32} {best * 1e6:9.1f} us/call  ({baseline / best:4.1f}x)")
+
+if __name__ == "__main__":
+    main()
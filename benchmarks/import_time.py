@@ -0,0 +1,104 @@
+"""
+Cold import time of `main`, checked against a budget.
+
+Imports `main` in fresh interpreters under `python -X importtime`, and `fastapi`
+alone as a baseline for this machine. Exits with status 1 when the fastest
+import of `main` takes more than --max-ratio times the fastest FastAPI-only
+import (or more than --budget-ms, if given), or when a module that should only
+be loaded on demand (the gRPC stack, motor, msgpack, markdown, uvicorn) was
+imported.
+
+The ratio keeps the check meaningful on slow and fast machines alike; the tree
+currently measures between 1.5x and 2.2x depending on the machine. Run it from
+the repository root:
+
+Usage:
+    python -m benchmarks.import_time [--max-ratio 2.5] [--budget-ms MS] [--runs 5] [--top 15]
+"""
+import argparse
+import re
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Loaded lazily; importing `main` must not pull these in
+LAZY_MODULES = [
+    "grpc", "grpc_health", "app.api.grpc_server", "app.protos.service_pb2",
+    "motor", "msgpack", "markdown", "nh3", "uvicorn",
+]
+# Deliberately eager, so not listed above:
+# - email_validator: pydantic imports it when the EmailStr user models are
+#   defined, and FastAPI builds their schemas while registering the routes.
+# - jose: nearly every request verifies a token; deferring it would only move
+#   the import onto the first authenticated request, which warm-up never makes.
+
+_LINE_RE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+def import_baseline() -> int:
+    """Cumulative microseconds to import FastAPI alone in a new interpreter."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import fastapi"],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    for line in result.stderr.splitlines():
+        match = _LINE_RE.match(line)
+        if match and match.group(4) == "fastapi":
+            return int(match.group(2))
+    raise RuntimeError("fastapi missing from the -X importtime output")
+
+def import_main() -> Tuple[Dict[str, Tuple[int, int]], List[str]]:
+    """Import `main` in a new interpreter; returns {module: (self_us, cumulative_us)} and lazy modules seen."""
+    probe = (
+        "import sys, main; "
+        f"print(','.join(m for m in {LAZY_MODULES!r} if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", probe],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    timings = {}
+    for line in result.stderr.splitlines():
+        match = _LINE_RE.match(line)
+        if match:
+            timings[match.group(4)] = (int(match.group(1)), int(match.group(2)))
+    loaded = [name for name in result.stdout.strip().split(",") if name]
+    return timings, loaded
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--max-ratio", type=float, default=2.5, help="budget relative to importing FastAPI alone")
+    parser.add_argument("--budget-ms", type=float, default=None, help="absolute budget, checked as well when given")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    baseline_ms = min(import_baseline() for _ in range(args.runs)) / 1000
+    runs = [import_main() for _ in range(args.runs)]
+    best_timings, loaded = min(runs, key=lambda run: run[0]["main"][1])
+    best_ms = best_timings["main"][1] / 1000
+    ratio = best_ms / baseline_ms
+    print(f"import main: best {best_ms:.0f} ms of {args.runs} runs")
+    print(f"import fastapi alone: best {baseline_ms:.0f} ms; main is {ratio:.2f}x (budget {args.max_ratio:.2f}x)")
+
+    print("\nHeaviest imports (cumulative, best run):")
+    heaviest = sorted(best_timings.items(), key=lambda item: item[1][1], reverse=True)
+    for name, (_, cumulative) in heaviest[1:args.top + 1]:
+        print(f"  {cumulative / 1000:8.1f} ms  {name}")
+
+    failed = False
+    if loaded:
+        print(f"\nFAIL: imported eagerly but should load on demand: {', '.join(loaded)}")
+        failed = True
+    if ratio > args.max_ratio:
+        print(f"\nFAIL: cold import is {ratio:.2f}x FastAPI alone, over the {args.max_ratio:.2f}x budget")
+        failed = True
+    if args.budget_ms is not None and best_ms > args.budget_ms:
+        print(f"\nFAIL: cold import is {best_ms - args.budget_ms:.0f} ms over the {args.budget_ms:.0f} ms budget")
+        failed = True
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()
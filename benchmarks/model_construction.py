@@ -0,0 +1,92 @@
+"""
+Per-object cost of building models from stored documents: validation vs the trusted paths.
+
+Times construction, JSON serialization and both together for User, Project
+(with images) and ProjectImage, built from documents shaped like MongoDB's,
+through full validation, `construct_document` (no validation) and
+`from_document` (whichever of the two the model picks).
+
+Usage:
+    python -m benchmarks.model_construction [--images 3] [--repeat 20000]
+"""
+import argparse
+import timeit
+from datetime import datetime
+
+from bson import ObjectId
+
+from app.models.models import Project, ProjectImage, User
+
+def make_image(project_id: ObjectId) -> dict:
+    return {
+        "_id": ObjectId(),
+        "project_id": project_id,
+        "image_url": "/api/v1/images/507f1f77bcf86cd799439011/content",
+        "file_id": ObjectId(),
+        "content_type": "image/png",
+        "length": 48213,
+        "checksum": "9f86d081884c7d659a2feaa0c55ad015a3bf4f1b2b0b822cd15d6c15b0f00a08"
+    }
+
+def make_documents(images: int) -> dict:
+    now = datetime.utcnow()
+    project_id = ObjectId()
+    return {
+        User: {
+            "_id": ObjectId(),
+            "username": "johndoe",
+            "email": "john@example.com",
+            "role": "user",
+            "created_at": now,
+            "updated_at": now,
+            "stats": {"project_count": 4, "image_count": 9, "latest_project": None}
+        },
+        Project: {
+            "_id": project_id,
+            "slug": "sample-project",
+            "title": "Sample Project",
+            "body": "Sample project body content " * 40,
+            "body_html": "<p>" + "Sample project body content " * 40 + "</p>",
+            "body_excerpt": "Sample project body content",
+            "body_hash": "2c26b46b68ffc68ff99b453c1d30413413422d706483bfa0f98a5e886266e7ae",
+            "render_version": 1,
+            "github_link": "https://github.com/johndoe/sample-project",
+            "user_id": ObjectId(),
+            "created_at": now,
+            "updated_at": now,
+            "images": [make_image(project_id) for _ in range(images)]
+        },
+        ProjectImage: make_image(project_id),
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--images", type=int, default=3, help="images embedded in the Project document")
+    parser.add_argument("--repeat", type=int, default=20000)
+    args = parser.parse_args()
+
+    def measure(func) -> float:
+        return min(timeit.repeat(func, number=args.repeat, repeat=5)) / args.repeat
+
+    paths = [
+        ("validate", lambda model, document: model(**document)),
+        ("construct_document", lambda model, document: model.construct_document(document)),
+        ("from_document", lambda model, document: model.from_document(document)),
+    ]
+    print(f"Best of 5 x {args.repeat} runs, per object, in microseconds")
+    for model, document in make_documents(args.images).items():
+        expected = model(**document).model_dump_json()
+        print(f"\n{model.__name__} (from_document {'validates' if model.validate_documents else 'skips validation'})")
+        print(f"  {'':<20} {'construct':>10} {'dump_json':>10} {'total':>10}")
+        baseline = None
+        for name, build in paths:
+            instance = build(model, document)
+            assert instance.model_dump_json() == expected
+            construct = measure(lambda: build(model, document))
+            dump = measure(instance.model_dump_json)
+            total = construct + dump
+            baseline = baseline or total
+            print(f"  {name:<20} {construct * 1e6:10.2f} {dump * 1e6:10.2f} {total * 1e6:10.2f}  ({baseline / total:4.1f}x)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Serialization cost of one 100-user page: the old response path vs ModelJSONResponse.
+
+Usage:
+    python -m benchmarks.serialization [--rows 100] [--repeat 2000]
+"""
+import argparse
+import json
+import timeit
+from datetime import datetime, timedelta
+from typing import List
+
+from bson import ObjectId
+from pydantic import TypeAdapter, field_serializer
+
+from app.api.rest.responses import dump_json
+from app.models.models import User
+
+class LegacyUser(User):
+    """User as it was serialized before: Python-level isoformat on every row."""
+    @field_serializer('created_at', 'updated_at')
+    def serialize_dt(self, dt, _info):
+        return dt.isoformat() if dt else None
+
+def make_rows(rows: int) -> list:
+    now = datetime.utcnow()
+    return [
+        {
+            "_id": ObjectId(),
+            "username": f"user{i}",
+            "email": f"user{i}@example.com",
+            "role": "user",
+            "created_at": now - timedelta(minutes=i),
+            "updated_at": now
+        }
+        for i in range(rows)
+    ]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=2000)
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows)
+    legacy_users = [LegacyUser(**row) for row in rows]
+    users = [User(**row) for row in rows]
+    legacy_adapter = TypeAdapter(List[LegacyUser])
+
+    def validate_encode_dumps():
+        # FastAPI < 0.115-style: re-validate, dump to Python, then json.dumps
+        value = legacy_adapter.validate_python(legacy_users, from_attributes=True)
+        return json.dumps(legacy_adapter.dump_python(value, mode="json", by_alias=True)).encode()
+
+    def validate_dump_json():
+        # Recent FastAPI: re-validate, then dump straight to JSON bytes
+        value = legacy_adapter.validate_python(legacy_users, from_attributes=True)
+        return legacy_adapter.dump_json(value, by_alias=True)
+
+    def fast_path():
+        return dump_json(users)
+
+    assert json.loads(validate_dump_json()) == json.loads(fast_path())
+
+    cases = [
+        ("re-validate + jsonable + json.dumps", validate_encode_dumps),
+        ("re-validate + dump_json", validate_dump_json),
+        ("ModelJSONResponse (no re-validation)", fast_path),
+    ]
+    baseline = None
+    print(f"{args.rows}-user page, best of 5 x {args.repeat} runs")
+    for name, func in cases:
+        best = min(timeit.repeat(func, number=args.repeat, repeat=5)) / args.repeat
+        baseline = baseline or best
+        print(f"  {name:<40} {best * 1e6:9.1f} us/page  ({baseline / best:4.1f}x)")
+
+if __name__ == "__main__":
+    main()
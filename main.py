@@ -1,24 +1,57 @@
-import threading
-import uvicorn
+import asyncio
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 
 from app.api.rest.models import api_router
+from app.api.rest.admission import AdmissionControlMiddleware
+from app.api.rest.caching import ResponseCacheMiddleware
+from app.api.rest.circuit_breaker import CircuitBreakerMiddleware
+from app.api.rest.deadline import DeadlineMiddleware
+from app.api.rest.drain import InFlightMiddleware
+from app.api.rest.server_timing import ServerTimingMiddleware
+from app.api.rest.health import router as health_router
+from app.api.rest.metrics import MetricsMiddleware, router as metrics_router
+from app.api.rest.warmup import warm_up
 from app.core.config import settings
 from app.core.db import connect_to_mongodb, close_mongodb_connection
-from app.api.grpc_server import serve as serve_grpc
+from app.core.drain import in_flight
+from app.core.health import readiness
+from app.core.metrics import mark_process_dead, monitor_event_loop_lag
+from app.core.revocation import revocation_list
 
 # Define the lifespan context manager
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    # Startup: Initialize MongoDB and start gRPC server
+    # Startup: Initialize MongoDB and warm up before any port accepts traffic,
+    # then start the gRPC server on this event loop
     await connect_to_mongodb()
-    grpc_thread = threading.Thread(target=start_grpc_server, daemon=True)
-    grpc_thread.start()
+    await revocation_list.refresh()
+    await warm_up(app)
+    grpc_server = None
+    if settings.ENABLE_GRPC:
+        # Imported here so REST-only processes never load the gRPC stack
+        from app.api.grpc_server import serve as serve_grpc
+        grpc_server = await serve_grpc()
+    background_tasks = [asyncio.create_task(revocation_list.run_refresher())]
+    if settings.METRICS_ENABLED:
+        background_tasks.append(asyncio.create_task(monitor_event_loop_lag()))
+    await readiness.set(True)
     yield  # Application runs here
-    # Shutdown: Clean up MongoDB connection
+    # Shutdown: report not-ready, stop taking RPCs and wait for in-flight gRPC
+    # calls and REST requests (the server has already stopped accepting HTTP),
+    # and only then close MongoDB
+    await readiness.set(False)
+    # Wait for the cancellations, so no refresh runs against a closed client
+    for task in background_tasks:
+        task.cancel()
+    await asyncio.gather(*background_tasks, return_exceptions=True)
+    if grpc_server:
+        await grpc_server.stop(settings.SHUTDOWN_GRACE_PERIOD)
+    if not await in_flight.wait_idle(settings.SHUTDOWN_GRACE_PERIOD):
+        print(f"Shutdown: {in_flight.count} requests still running after the grace period")
     await close_mongodb_connection()
+    mark_process_dead()
 
 # Initialize FastAPI app with lifespan
 app = FastAPI(
@@ -28,6 +61,22 @@ app = FastAPI(
     lifespan=lifespan
 )
 
+# Shed load behind the cache, so cache hits are always served
+if settings.ADMISSION_ENABLED:
+    app.add_middleware(AdmissionControlMiddleware)
+
+# Fail requests whose caller has given up before they take an admission slot
+if settings.DEADLINE_ENABLED:
+    app.add_middleware(DeadlineMiddleware)
+
+# Cache public GET responses; added before CORS so CORS headers stay per-request
+app.add_middleware(ResponseCacheMiddleware)
+
+# Turn requests refused by an open breaker into a 503; added after the cache
+# so it can serve them stale first
+if settings.CIRCUIT_BREAKER_ENABLED:
+    app.add_middleware(CircuitBreakerMiddleware)
+
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -37,13 +86,21 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Count every request, so shutdown can wait for the ones still running
+app.add_middleware(InFlightMiddleware)
+
+# Outermost, so cache hits and CORS preflights are timed too
+if settings.SERVER_TIMING:
+    app.add_middleware(ServerTimingMiddleware)
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+
 # Include API router
 app.include_router(api_router)
-
-def start_grpc_server():
-    """Start the gRPC server."""
-    grpc_server = serve_grpc()
-    grpc_server.wait_for_termination()
+app.include_router(health_router)
+if settings.METRICS_ENABLED:
+    app.include_router(metrics_router)
 
 if __name__ == "__main__":
+    import uvicorn
     uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=settings.DEBUG)
\ No newline at end of file
@@ -0,0 +1,69 @@
+import asyncio
+
+import grpc
+import pytest
+from pymongo.errors import ServerSelectionTimeoutError
+
+from app.api.interceptors import DeadlineInterceptor
+from app.core.deadline import DeadlineExceeded, request_deadline
+
+
+class FakeContext:
+    def __init__(self, time_remaining):
+        self._time_remaining = time_remaining
+        self.aborted_with = None
+
+    def time_remaining(self):
+        return self._time_remaining
+
+    async def abort(self, code, details):
+        self.aborted_with = code
+        raise grpc.RpcError(details)
+
+
+def intercepted(behavior):
+    async def continuation(handler_call_details):
+        return grpc.unary_unary_rpc_method_handler(behavior)
+
+    handler = asyncio.run(DeadlineInterceptor().intercept_service(continuation, None))
+    return handler.unary_unary
+
+
+async def no_server(request, context):
+    raise ServerSelectionTimeoutError("No servers found yet")
+
+
+def test_timeout_without_deadline_propagates():
+    context = FakeContext(time_remaining=None)
+
+    with pytest.raises(ServerSelectionTimeoutError):
+        asyncio.run(intercepted(no_server)(None, context))
+    assert context.aborted_with is None
+
+
+def test_timeout_with_time_left_propagates():
+    context = FakeContext(time_remaining=30.0)
+
+    with pytest.raises(ServerSelectionTimeoutError):
+        asyncio.run(intercepted(no_server)(None, context))
+    assert context.aborted_with is None
+
+
+def test_timeout_after_deadline_is_deadline_exceeded():
+    async def slow_then_no_server(request, context):
+        await asyncio.sleep(0.02)
+        raise ServerSelectionTimeoutError("No servers found yet")
+
+    context = FakeContext(time_remaining=0.01)
+
+    with pytest.raises(grpc.RpcError):
+        asyncio.run(intercepted(slow_then_no_server)(None, context))
+    assert context.aborted_with == grpc.StatusCode.DEADLINE_EXCEEDED
+
+
+def test_inherited_deadline_converts_expired_timeouts():
+    with pytest.raises(DeadlineExceeded):
+        with request_deadline(0.01):
+            with request_deadline(None):
+                asyncio.run(asyncio.sleep(0.02))
+                raise ServerSelectionTimeoutError("No servers found yet")
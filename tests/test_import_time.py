@@ -0,0 +1,16 @@
+import subprocess
+import sys
+
+import pytest
+
+from benchmarks.import_time import ROOT
+
+
+@pytest.mark.slow
+def test_import_main_within_budget():
+    result = subprocess.run(
+        [sys.executable, "-m", "benchmarks.import_time", "--runs", "5"],
+        cwd=ROOT, capture_output=True, text=True
+    )
+
+    assert result.returncode == 0, result.stdout + result.stderr
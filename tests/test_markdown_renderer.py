@@ -0,0 +1,33 @@
+from app.services.markdown_renderer import RENDERER_VERSION, render_body
+
+
+def test_script_tags_are_removed():
+    rendered = render_body("Hello\n\n<script>alert(1)</script>\n")
+
+    assert "<script" not in rendered["body_html"]
+    assert "alert(1)" not in rendered["body_html"]
+    assert rendered["render_version"] == RENDERER_VERSION
+
+
+def test_javascript_links_are_neutralized():
+    rendered = render_body(
+        '[click](javascript:alert(1)) <a href="javascript:alert(2)">raw</a> '
+        '<img src="x" onerror="alert(3)">\n'
+    )
+
+    assert "javascript:" not in rendered["body_html"]
+    assert "onerror" not in rendered["body_html"]
+
+
+def test_markdown_output_is_kept():
+    rendered = render_body(
+        "# Title\n\n[site](https://example.com) [mail](mailto:me@example.com)\n\n"
+        "```python\nprint(1)\n```\n\n| a | b |\n|:--|--:|\n| 1 | 2 |\n"
+    )
+
+    html = rendered["body_html"]
+    assert "<h1>Title</h1>" in html
+    assert 'href="https://example.com"' in html
+    assert 'href="mailto:me@example.com"' in html
+    assert '<code class="language-python">' in html
+    assert '<th style="text-align:left">a</th>' in html